@@ -0,0 +1,14 @@
+"""
+ASGI config for smart_task_analyzer project.
+
+Serves the async analysis endpoints (tasks/async_views.py) on an event loop,
+e.g. with: uvicorn task_analyzer.asgi:application --workers 2
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'task_analyzer.settings')
+
+application = get_asgi_application()
@@ -55,12 +55,15 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'task_analyzer.wsgi.application'
+ASGI_APPLICATION = 'task_analyzer.asgi.application'
 
 
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR.parent / 'db.sqlite3',
+        # Job workers write while the API reads and writes; wait for the lock.
+        'OPTIONS': {'timeout': 20},
     }
 }
 
@@ -109,6 +112,51 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Maximum number of per-task scores kept by the incremental rescoring cache.
+TASK_SCORE_CACHE_SIZE = 100000
+
+# Downstream estimated hours counted as one blocked task when scoring with
+# dependency_mode=transitive_hours.
+TASK_IMPACT_HOURS_PER_TASK = 8.0
+
+# Task lists at least this long are scored in parallel worker processes when
+# TASK_PARALLEL_SCORING_WORKERS is above 1.
+TASK_PARALLEL_SCORING_THRESHOLD = 20000
+# Number of scoring worker processes (None: one per CPU core). 1 scores in
+# process: sending the tasks to the workers costs about 60% of scoring them,
+# so sharding only pays off on idle multi-core hosts, around 20k-50k tasks.
+TASK_PARALLEL_SCORING_WORKERS = 1
+
+# Threads running analyses for the async (ASGI) endpoints, per process; more
+# requests queue. Scoring mostly holds the GIL, so scale with ASGI processes.
+TASK_ANALYSIS_WORKERS = 1
+
+# Task lists at least this long are validated on the fast path (same rules
+# and errors as TaskSerializer); shorter ones go straight through DRF.
+TASK_FAST_VALIDATION_THRESHOLD = 50
+
+# Rows per INSERT statement of bulk task imports.
+TASK_BULK_CREATE_CHUNK_SIZE = 1000
+
+# Page sizes of the task list and of ranked analysis results.
+TASK_PAGE_SIZE = 100
+TASK_MAX_PAGE_SIZE = 1000
+# Seconds a ranking snapshot can be paged, and how many are kept at once.
+TASK_RANKING_SNAPSHOT_TTL = 300
+TASK_RANKING_SNAPSHOT_LIMIT = 32
+
+# Views using StreamingResponseMixin stream responses whose longest top-level
+# list has at least this many items.
+TASK_STREAMING_RESPONSE_THRESHOLD = 1000
+
+# Background jobs (manage.py run_job_worker): seconds a finished job's result
+# is kept, seconds without a heartbeat before a running job is requeued, runs
+# per job before it fails, and seconds between heartbeats.
+TASK_JOB_RESULT_TTL = 3600
+TASK_JOB_STALE_AFTER = 60
+TASK_JOB_MAX_ATTEMPTS = 3
+TASK_JOB_HEARTBEAT_INTERVAL = 5
+
 CORS_ALLOW_ALL_ORIGINS = True 
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOW_METHODS = [
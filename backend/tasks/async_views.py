@@ -0,0 +1,176 @@
+"""
+Async variants of the analysis and suggestion endpoints, for ASGI deployments.
+
+A synchronous view holds its worker for the whole request, so under WSGI a
+two-second analysis of a large board blocks every cheap request queued
+behind it on that worker. These views run on the event loop instead: stored
+tasks are read with the async ORM, and validation, scoring and JSON encoding
+run on analysis_executor, a bounded thread pool. While analyses are in
+flight the event loop keeps serving health checks and CRUD requests, and at
+most TASK_ANALYSIS_WORKERS analyses per process compete with them for the
+CPU; the rest wait in the executor's queue.
+
+The executor uses threads rather than processes because the score cache and
+the ranking snapshots are per-process state that later requests depend on.
+Responses carry the same JSON as the synchronous endpoints.
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotAllowed
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .models import DatasetVersion, Task
+from .views import (
+    AnalyzeStoredTasksView,
+    AnalyzeTasksView,
+    SuggestTasksView,
+    dataset_etag_for_version,
+    resolve_page_size,
+    single_page_etag
+)
+
+analysis_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'TASK_ANALYSIS_WORKERS', 1),
+    thread_name_prefix='task-analysis'
+)
+
+
+def _render(response):
+    """Render a response as the synchronous endpoints would (JSON encoding included)."""
+    if getattr(response, 'streaming', False):
+        # A streamed APIView response: encode it here, on the executor, rather
+        # than letting the ASGI handler iterate a sync generator on the loop.
+        rendered = HttpResponse(b''.join(response.streaming_content), status=response.status_code)
+        for header, value in response.items():
+            rendered[header] = value
+        return rendered
+    if getattr(response, 'accepted_renderer', None) is not None:
+        # Already finalized by an APIView.
+        return response.render()
+    if isinstance(response, Response):
+        return HttpResponse(
+            JSONRenderer().render(response.data),
+            status=response.status_code,
+            content_type='application/json'
+        )
+    return response
+
+
+async def offload(func, *args):
+    """Run func(*args) on the analysis executor and return its rendered response."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(analysis_executor, lambda: _render(func(*args)))
+
+
+async def aload_task_versions(tasks):
+    """Async version of views.load_task_versions."""
+    task_list = []
+    versions = {}
+    due_date_strings = {}
+    # Every row is needed anyway, so the rows are fetched in one go; Django 4.2's
+    # aiterator() evaluates values_list() querysets on the event loop thread.
+    async for row in tasks.values_list(*Task.DICT_FIELDS, 'updated_at'):
+        task_list.append(Task.row_to_dict(row, due_date_strings))
+        versions[row[0]] = row[-1]
+    return task_list, versions
+
+
+def conditional_get(view):
+    """
+    Async counterpart of views.conditional_get.
+    
+    The wrapped view is called as view(request, drf_request) and only when
+    the client's If-None-Match does not match the current ETag.
+    """
+    @functools.wraps(view)
+    async def wrapper(request):
+        drf_request = Request(request)
+        etag = quote_etag(dataset_etag_for_version(await DatasetVersion.acurrent(), drf_request))
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = await view(request, drf_request)
+        response.headers.setdefault('ETag', etag)
+        return response
+    return wrapper
+
+
+async def stored_tasks(drf_request, handler):
+    """Load stored tasks on the event loop, then offload handler(drf_request, task_list, versions)."""
+    task_list, versions = await aload_task_versions(Task.objects.all())
+    if not task_list:
+        return _render(Response(
+            {'error': 'No tasks found in database'},
+            status=status.HTTP_404_NOT_FOUND
+        ))
+    return await offload(handler, drf_request, task_list, versions)
+
+
+async def analyze_tasks(request):
+    """POST /api/tasks/async/analyze/ - Async version of AnalyzeTasksView."""
+    if request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
+    return await offload(_analyze_tasks_view, request)
+
+
+async def _analyze_stored_tasks(request):
+    drf_request = Request(request)
+    page_size, error_response = resolve_page_size(drf_request)
+    if error_response:
+        return _render(error_response)
+    
+    view = AnalyzeStoredTasksView()
+    cursor = drf_request.query_params.get('cursor')
+    if cursor:
+        # Later pages are slices of a ranking snapshot: no scoring to offload.
+        return _render(view._snapshot_page(cursor, page_size))
+    
+    # As the synchronous view: no 304 for a first page that hands out a cursor.
+    etag = single_page_etag(await DatasetVersion.acurrent(), await Task.objects.acount(), drf_request, page_size)
+    response = get_conditional_response(request, etag=etag) if etag else None
+    if response is None:
+        response = await stored_tasks(
+            drf_request,
+            lambda drf_request, task_list, versions: view._analyze(drf_request, task_list, versions, page_size)
+        )
+    if etag:
+        response.headers.setdefault('ETag', etag)
+    return response
+
+
+async def analyze_stored_tasks(request):
+    """GET /api/tasks/async/analyze-stored/ - Async version of AnalyzeStoredTasksView."""
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+    return await _analyze_stored_tasks(request)
+
+
+@conditional_get
+async def _suggest_stored_tasks(request, drf_request):
+    return await stored_tasks(drf_request, SuggestTasksView()._suggest_stored)
+
+
+async def suggest_tasks(request):
+    """GET/POST /api/tasks/async/suggest/ - Async version of SuggestTasksView."""
+    if request.method == 'POST':
+        return await offload(_suggest_tasks_view, request)
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET', 'POST'])
+    return await _suggest_stored_tasks(request)
+
+
+# Submitted task lists need no database reads, so the synchronous views run
+# whole (parsing, validation, scoring, rendering) on the executor.
+_analyze_tasks_view = AnalyzeTasksView.as_view()
+_suggest_tasks_view = SuggestTasksView.as_view()
+
+# Function views are not wrapped by DRF, which exempts its views from CSRF checks.
+for _view in (analyze_tasks, analyze_stored_tasks, suggest_tasks):
+    _view.csrf_exempt = True
@@ -0,0 +1,295 @@
+"""
+Bulk writes of stored tasks: imports and batched updates/deletes.
+
+Every item is validated before anything is written; the valid ones are then
+written with set-based statements (bulk_create, bulk_update, a filtered
+delete) inside one transaction. That is one commit (and on SQLite one fsync)
+per batch instead of one per task, and a failure part-way through rolls the
+whole batch back instead of leaving it half done.
+"""
+from typing import Callable, Dict, List, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from .models import Task
+from .serializers import TaskCreateSerializer, TaskSerializer
+from .validation import fast_validate_task
+
+BULK_MODES = ('best_effort', 'all_or_nothing')
+DEFAULT_BULK_MODE = 'best_effort'
+# Rows per INSERT statement (Django lowers it further to fit SQLite's parameter limit).
+BULK_CREATE_CHUNK_SIZE = 1000
+# Fields a batch update may change.
+UPDATABLE_FIELDS = ('title', 'due_date', 'estimated_hours', 'importance', 'dependencies')
+
+
+def _error_message(detail) -> str:
+    """Flatten serializer error details into one line."""
+    if isinstance(detail, dict):
+        return '; '.join(
+            f"{field}: {_error_message(messages)}" if field != 'non_field_errors' else _error_message(messages)
+            for field, messages in detail.items()
+        )
+    if isinstance(detail, list):
+        return ' '.join(_error_message(message) for message in detail)
+    return str(detail)
+
+
+def validate_rows(rows: List) -> Tuple[List[Tuple[int, Dict]], List[Dict]]:
+    """
+    Validate every row as TaskCreateSerializer would.
+    
+    Plain rows are checked by fast_validate_task; the others go through one
+    shared serializer instance (so the field set is built once rather than
+    per row), which also produces their error details.
+    
+    Returns:
+        Tuple of (valid, errors): valid is a list of (index, validated data),
+        errors a list of {'index', 'task', 'error', 'details'} entries
+    """
+    validator = TaskCreateSerializer()
+    date_cache = {}
+    valid = []
+    errors = []
+    for index, row in enumerate(rows):
+        data = fast_validate_task(row, date_cache, require_id=False)
+        if data is not None:
+            valid.append((index, data))
+            continue
+        try:
+            valid.append((index, validator.run_validation(row)))
+        except serializers.ValidationError as e:
+            errors.append({
+                'index': index,
+                'task': row.get('title', 'Unknown') if isinstance(row, dict) else 'Unknown',
+                'error': _error_message(e.detail),
+                'details': e.detail
+            })
+    return valid, errors
+
+
+def import_tasks(
+    rows: List,
+    mode: str = DEFAULT_BULK_MODE,
+    chunk_size: int = BULK_CREATE_CHUNK_SIZE,
+    progress: Callable[[int, int], None] = None
+) -> Dict:
+    """
+    Validate rows and store the valid ones in one transaction.
+    
+    Args:
+        rows: List of task dictionaries (title, due_date, estimated_hours,
+            importance, optional dependencies)
+        mode: 'best_effort' stores every valid row and reports the others;
+            'all_or_nothing' stores nothing if any row is invalid
+        chunk_size: Rows per INSERT statement
+        progress: Optional callable receiving (rows written, rows to write)
+            after each chunk
+    
+    Returns:
+        Dictionary with:
+        - created: Number of tasks stored
+        - tasks: The stored tasks (to_dict() form, with their new IDs)
+        - errors: Per-row errors, in row order
+    
+    Raises:
+        ValueError: If mode is unknown
+    """
+    if mode not in BULK_MODES:
+        raise ValueError(f"Invalid mode: {mode}. Valid modes are: {', '.join(BULK_MODES)}")
+    
+    valid, errors = validate_rows(rows)
+    if not valid or (errors and mode == 'all_or_nothing'):
+        return {'created': 0, 'tasks': [], 'errors': errors}
+    
+    objects = [
+        Task(
+            title=data['title'],
+            due_date=data['due_date'],
+            estimated_hours=data['estimated_hours'],
+            importance=data['importance'],
+            dependencies=data.get('dependencies', [])
+        )
+        for _, data in valid
+    ]
+    if progress is not None:
+        progress(0, len(objects))
+    created = []
+    with transaction.atomic():
+        for start in range(0, len(objects), chunk_size):
+            created.extend(Task.objects.bulk_create(objects[start:start + chunk_size], batch_size=chunk_size))
+            if progress is not None:
+                progress(len(created), len(objects))
+    
+    due_date_strings = {}
+    return {
+        'created': len(created),
+        'tasks': [
+            Task.row_to_dict(tuple(getattr(task, field) for field in Task.DICT_FIELDS), due_date_strings)
+            for task in created
+        ],
+        'errors': errors
+    }
+
+
+def _validate_updates(updates: List) -> Tuple[List[Tuple[int, Dict]], List[Dict]]:
+    """
+    Validate partial updates with TaskSerializer(partial=True).
+    
+    Returns:
+        Tuple of (valid, errors): valid is a list of (index, validated data),
+        errors a list of per-item results with status 'error'
+    """
+    validator = TaskSerializer(partial=True)
+    valid = []
+    errors = []
+    seen = set()
+    for index, item in enumerate(updates):
+        task_id = item.get('id') if isinstance(item, dict) else None
+        try:
+            data = validator.run_validation(item)
+            if 'id' not in data:
+                raise serializers.ValidationError({'id': ["This field is required."]})
+            if not any(field in data for field in UPDATABLE_FIELDS):
+                raise serializers.ValidationError(f"Update for task {data['id']} does not change anything")
+            if data['id'] in seen:
+                raise serializers.ValidationError(f"Task {data['id']} is updated more than once")
+        except serializers.ValidationError as e:
+            errors.append({
+                'op': 'update', 'index': index, 'id': task_id, 'status': 'error',
+                'error': _error_message(e.detail), 'details': e.detail
+            })
+            continue
+        seen.add(data['id'])
+        valid.append((index, data))
+    return valid, errors
+
+
+def _validate_deletes(deletes: List, updated_ids: set) -> Tuple[List[Tuple[int, int]], List[Dict]]:
+    """
+    Validate task IDs to delete.
+    
+    Returns:
+        Tuple of (valid, errors): valid is a list of (index, task ID)
+    """
+    valid = []
+    errors = []
+    seen = set()
+    for index, task_id in enumerate(deletes):
+        error = None
+        if not isinstance(task_id, int) or isinstance(task_id, bool) or task_id <= 0:
+            error = f"Task ID must be a positive integer, got: {task_id}"
+        elif task_id in updated_ids:
+            error = f"Task {task_id} cannot be both updated and deleted"
+        elif task_id in seen:
+            error = f"Task {task_id} is deleted more than once"
+        if error:
+            errors.append({'op': 'delete', 'index': index, 'id': task_id, 'status': 'error', 'error': error})
+            continue
+        seen.add(task_id)
+        valid.append((index, task_id))
+    return valid, errors
+
+
+def apply_task_mutations(
+    updates: List,
+    deletes: List,
+    mode: str = DEFAULT_BULK_MODE,
+    chunk_size: int = BULK_CREATE_CHUNK_SIZE
+) -> Dict:
+    """
+    Apply partial updates and deletes of stored tasks in one transaction.
+    
+    Updates are written with one bulk_update over the union of the changed
+    fields (plus updated_at, which bulk_update does not set by itself and
+    which keys the score cache), deletes with one filtered delete. The
+    dataset version therefore changes once per batch as seen by readers,
+    and only the updated tasks are rescored by the next analysis.
+    
+    Args:
+        updates: List of {'id': ..., <fields to change>} dictionaries
+        deletes: List of task IDs
+        mode: 'best_effort' applies every valid item and reports the others;
+            'all_or_nothing' applies nothing if any item is invalid (the
+            valid items are then reported as 'skipped')
+        chunk_size: Rows per UPDATE statement
+    
+    Returns:
+        Dictionary with:
+        - updated: Number of tasks updated
+        - deleted: Number of tasks deleted
+        - results: One result per item, updates then deletes, in request order
+    
+    Raises:
+        ValueError: If mode is unknown
+    """
+    if mode not in BULK_MODES:
+        raise ValueError(f"Invalid mode: {mode}. Valid modes are: {', '.join(BULK_MODES)}")
+    
+    valid_updates, update_errors = _validate_updates(updates)
+    valid_deletes, delete_errors = _validate_deletes(deletes, {data['id'] for _, data in valid_updates})
+    
+    with transaction.atomic():
+        ids = [data['id'] for _, data in valid_updates] + [task_id for _, task_id in valid_deletes]
+        existing = Task.objects.in_bulk(ids)
+        
+        results = {('update', error['index']): error for error in update_errors}
+        results.update({('delete', error['index']): error for error in delete_errors})
+        for index, data in valid_updates:
+            if data['id'] not in existing:
+                results[('update', index)] = {
+                    'op': 'update', 'index': index, 'id': data['id'], 'status': 'error',
+                    'error': f"Task {data['id']} does not exist"
+                }
+        for index, task_id in valid_deletes:
+            if task_id not in existing:
+                results[('delete', index)] = {
+                    'op': 'delete', 'index': index, 'id': task_id, 'status': 'error',
+                    'error': f"Task {task_id} does not exist"
+                }
+        
+        valid_updates = [(index, data) for index, data in valid_updates if ('update', index) not in results]
+        valid_deletes = [(index, task_id) for index, task_id in valid_deletes if ('delete', index) not in results]
+        if results and mode == 'all_or_nothing':
+            for index, data in valid_updates:
+                results[('update', index)] = {'op': 'update', 'index': index, 'id': data['id'], 'status': 'skipped'}
+            for index, task_id in valid_deletes:
+                results[('delete', index)] = {'op': 'delete', 'index': index, 'id': task_id, 'status': 'skipped'}
+            valid_updates, valid_deletes = [], []
+        
+        now = timezone.now()
+        changed_fields = set()
+        tasks = []
+        for index, data in valid_updates:
+            task = existing[data['id']]
+            for field in UPDATABLE_FIELDS:
+                if field in data:
+                    setattr(task, field, data[field])
+                    changed_fields.add(field)
+            task.updated_at = now
+            tasks.append(task)
+            results[('update', index)] = {
+                'op': 'update', 'index': index, 'id': task.pk, 'status': 'updated', 'task': task.to_dict()
+            }
+        if tasks:
+            fields = [field for field in UPDATABLE_FIELDS if field in changed_fields] + ['updated_at']
+            Task.objects.bulk_update(tasks, fields, batch_size=chunk_size)
+        
+        delete_ids = [task_id for _, task_id in valid_deletes]
+        if delete_ids:
+            Task.objects.filter(pk__in=delete_ids).delete()
+        for index, task_id in valid_deletes:
+            results[('delete', index)] = {
+                'op': 'delete', 'index': index, 'id': task_id, 'status': 'deleted',
+                'task': existing[task_id].to_dict()
+            }
+    
+    return {
+        'updated': len(tasks),
+        'deleted': len(delete_ids),
+        'results': [
+            results[key] for key in sorted(results, key=lambda key: (key[0] != 'update', key[1]))
+        ]
+    }
@@ -0,0 +1,176 @@
+"""
+Named working-day calendars for urgency scoring.
+
+Built-in calendars are rule sets that generate the public holidays of a
+year. Custom calendars are stored in the database (HolidayCalendar) and
+extend an optional built-in base calendar with extra dates.
+
+Every calendar is compiled once into a WorkingDayCalendar (cached per-year
+bitsets plus prefix sums) and kept in the registry, so scoring never
+rebuilds a calendar. Editing or deleting a custom calendar invalidates its
+compiled entry.
+"""
+import threading
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Set
+
+from dateutil.easter import easter
+
+from .scoring import PriorityCalculator, WorkingDayCalendar, get_default_calendar
+
+DEFAULT_CALENDAR = 'us'
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """Return the n-th given weekday of a month (n=-1 for the last one)."""
+    if n > 0:
+        d = date(year, month, 1)
+        d += timedelta(days=(weekday - d.weekday()) % 7)
+        return d + timedelta(days=7 * (n - 1))
+    d = date(year + (month == 12), month % 12 + 1, 1) - timedelta(days=1)
+    return d - timedelta(days=(d.weekday() - weekday) % 7)
+
+
+def _with_substitutes(fixed_days: List[date], holidays: Set[date]) -> Set[date]:
+    """
+    Add fixed-date holidays, moving weekend ones to the next free weekday.
+
+    Weekday holidays are placed first so substitutes never collide with them
+    (e.g. Christmas on a Sunday is observed on Tuesday after Boxing Day).
+    """
+    holidays.update(d for d in fixed_days if d.weekday() < 5)
+    for d in fixed_days:
+        if d.weekday() >= 5:
+            substitute = d
+            while substitute.weekday() >= 5 or substitute in holidays:
+                substitute += timedelta(days=1)
+            holidays.add(substitute)
+    return holidays
+
+
+def get_uk_holidays(year: int) -> Set[date]:
+    """Get bank holidays for England and Wales for a given year."""
+    easter_sunday = easter(year)
+    holidays = {
+        easter_sunday - timedelta(days=2),
+        easter_sunday + timedelta(days=1),
+        _nth_weekday(year, 5, 0, 1),
+        _nth_weekday(year, 5, 0, -1),
+        _nth_weekday(year, 8, 0, -1),
+    }
+    return _with_substitutes(
+        [date(year, 1, 1), date(year, 12, 25), date(year, 12, 26)],
+        holidays
+    )
+
+
+def get_no_holidays(year: int) -> Set[date]:
+    """Weekends-only calendar: no public holidays."""
+    return set()
+
+
+BUILTIN_CALENDARS: Dict[str, Callable[[int], Set[date]]] = {
+    'us': PriorityCalculator._get_us_holidays,
+    'uk': get_uk_holidays,
+    'none': get_no_holidays,
+}
+
+
+class CustomHolidayProvider:
+    """
+    Holiday provider of a custom calendar: a built-in base plus extra dates.
+
+    A plain class rather than a closure so compiled calendars can be pickled
+    and sent to scoring worker processes.
+    """
+
+    def __init__(self, base_calendar: str, extra_by_year: Dict[int, Set[date]]):
+        self.base_calendar = base_calendar or 'none'
+        self.extra_by_year = extra_by_year
+
+    def __call__(self, year: int) -> Set[date]:
+        base_provider = BUILTIN_CALENDARS.get(self.base_calendar, get_no_holidays)
+        return base_provider(year) | self.extra_by_year.get(year, set())
+
+
+class CalendarRegistry:
+    """
+    Registry of compiled working-day calendars, keyed by name.
+
+    Built-in calendars are compiled on first use and kept for the life of the
+    process. Custom calendars are loaded from the database and recompiled only
+    when their row changes (tracked through updated_at).
+    """
+
+    def __init__(self):
+        self._calendars: Dict[str, WorkingDayCalendar] = {}
+        self._versions: Dict[str, datetime] = {}
+        self._lock = threading.Lock()
+
+    def names(self) -> List[str]:
+        """List built-in and custom calendar names."""
+        from .models import HolidayCalendar
+        return sorted(BUILTIN_CALENDARS) + list(
+            HolidayCalendar.objects.order_by('name').values_list('name', flat=True)
+        )
+
+    def get(self, name: str = None) -> WorkingDayCalendar:
+        """
+        Return the compiled calendar for a name.
+
+        Args:
+            name: Calendar name (case-insensitive); None or '' selects the default
+
+        Returns:
+            WorkingDayCalendar instance shared by all callers
+
+        Raises:
+            KeyError: If no calendar with this name exists
+        """
+        name = (name or DEFAULT_CALENDAR).strip().lower()
+        if name == DEFAULT_CALENDAR:
+            return get_default_calendar()
+
+        if name in BUILTIN_CALENDARS:
+            calendar = self._calendars.get(name)
+            if calendar is None:
+                with self._lock:
+                    calendar = self._calendars.get(name)
+                    if calendar is None:
+                        calendar = WorkingDayCalendar(holiday_provider=BUILTIN_CALENDARS[name], name=name)
+                        self._calendars[name] = calendar
+            return calendar
+
+        from .models import HolidayCalendar
+        row = HolidayCalendar.objects.filter(name=name).first()
+        if row is None:
+            raise KeyError(name)
+
+        with self._lock:
+            calendar = self._calendars.get(name)
+            if calendar is None or self._versions.get(name) != row.updated_at:
+                calendar = self._compile(row)
+                self._calendars[name] = calendar
+                self._versions[name] = row.updated_at
+        return calendar
+
+    def invalidate(self, name: str):
+        """Drop the compiled calendar for a name so the next get() recompiles it."""
+        name = name.strip().lower()
+        with self._lock:
+            self._calendars.pop(name, None)
+            self._versions.pop(name, None)
+
+    @staticmethod
+    def _compile(row) -> WorkingDayCalendar:
+        """Compile a HolidayCalendar row into a WorkingDayCalendar."""
+        extra_by_year: Dict[int, Set[date]] = {}
+        for value in row.holidays or []:
+            d = datetime.strptime(value, '%Y-%m-%d').date() if isinstance(value, str) else value
+            extra_by_year.setdefault(d.year, set()).add(d)
+
+        provider = CustomHolidayProvider(row.base_calendar, extra_by_year)
+        return WorkingDayCalendar(holiday_provider=provider, name=row.name)
+
+
+calendar_registry = CalendarRegistry()
@@ -0,0 +1,389 @@
+"""
+Background jobs backed by the Job table.
+
+Long analyses and imports are submitted as jobs and run by worker processes
+(manage.py run_job_worker) instead of inside an HTTP request. The queue is
+the Job table itself, so no broker is needed:
+
+- workers claim the oldest queued job with a conditional UPDATE, so a job
+  is claimed by exactly one worker however many poll the table;
+- a running job's heartbeat is refreshed by a background thread, and jobs
+  whose worker stopped sending heartbeats are requeued (up to a retry limit);
+- an import stores its result on the job in the import's transaction, so
+  a requeued import is never written twice;
+- finished jobs keep their result until they expire and are purged.
+
+A job of an endpoint kind runs the endpoint's own view on its payload (the
+request body, or the query parameters for stored tasks when the payload
+has no 'tasks'), so its result and errors are exactly the endpoint's.
+"""
+import io
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import timedelta
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import OperationalError, close_old_connections, connection, transaction
+from django.db.models import F
+from django.urls import resolve, reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+# Job kind -> URL name of the endpoint it runs.
+ENDPOINT_JOBS = {
+    'analyze': 'analyze-tasks',
+    'suggest': 'suggest-tasks',
+    'dashboard': 'dashboard',
+    'dependency_graph': 'dependency-graph',
+    'critical_path': 'critical-path',
+    'plan': 'daily-plan',
+    'weight_sweep': 'weight-sweep',
+    'what_if': 'what-if',
+}
+JOB_KINDS = tuple(ENDPOINT_JOBS) + ('bulk_import',)
+
+DEFAULT_RESULT_TTL = 3600
+DEFAULT_STALE_AFTER = 60
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_HEARTBEAT_INTERVAL = 5
+# Tries (and base delay in seconds between them) to store a finished job's
+# outcome while the database is locked.
+FINISH_ATTEMPTS = 3
+FINISH_RETRY_DELAY = 1.0
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def submit_job(kind: str, payload: Dict) -> Job:
+    """
+    Queue a job.
+
+    Raises:
+        ValueError: If the kind is unknown or the payload is not an object
+    """
+    if kind not in JOB_KINDS:
+        raise ValueError(f"Invalid job kind: {kind}. Valid kinds are: {', '.join(JOB_KINDS)}")
+    if not isinstance(payload, dict):
+        raise ValueError(f"Job payload must be an object, got: {type(payload).__name__}")
+    return Job.objects.create(kind=kind, payload=payload)
+
+
+def claim_job(worker_id: str) -> Optional[Job]:
+    """
+    Claim the oldest queued job for this worker.
+
+    The UPDATE only matches while the job is still queued, so when workers
+    race for the same job exactly one of them gets it; the others move on
+    to the next one.
+
+    Returns:
+        The claimed job, or None if the queue is empty
+    """
+    while True:
+        job_id = Job.objects.filter(status=Job.QUEUED).order_by('id').values_list('id', flat=True).first()
+        if job_id is None:
+            return None
+        now = timezone.now()
+        claimed = Job.objects.filter(pk=job_id, status=Job.QUEUED).update(
+            status=Job.RUNNING,
+            worker=worker_id,
+            attempts=F('attempts') + 1,
+            started_at=now,
+            heartbeat_at=now,
+            progress=0.0,
+            progress_message='Started'
+        )
+        if claimed:
+            return Job.objects.get(pk=job_id)
+
+
+def requeue_stale_jobs(stale_after: float = None, max_attempts: int = None) -> int:
+    """
+    Requeue running jobs whose worker stopped sending heartbeats.
+
+    Jobs that already used max_attempts fail instead.
+
+    Returns:
+        Number of jobs requeued or failed
+    """
+    stale_after = stale_after if stale_after is not None else _setting('TASK_JOB_STALE_AFTER', DEFAULT_STALE_AFTER)
+    max_attempts = max_attempts if max_attempts is not None else _setting('TASK_JOB_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS)
+    now = timezone.now()
+    stale = Job.objects.filter(status=Job.RUNNING, heartbeat_at__lt=now - timedelta(seconds=stale_after))
+    failed = stale.filter(attempts__gte=max_attempts).update(
+        status=Job.FAILED,
+        error='Worker stopped responding',
+        finished_at=now,
+        expires_at=now + timedelta(seconds=_setting('TASK_JOB_RESULT_TTL', DEFAULT_RESULT_TTL))
+    )
+    requeued = stale.filter(attempts__lt=max_attempts).update(
+        status=Job.QUEUED,
+        worker='',
+        progress=0.0,
+        progress_message='Requeued after worker stopped responding'
+    )
+    return failed + requeued
+
+
+def purge_expired_jobs() -> int:
+    """Delete finished jobs whose result has expired; return how many."""
+    deleted, _ = Job.objects.filter(expires_at__lt=timezone.now()).delete()
+    return deleted
+
+
+def _claimed(job_id: int, worker: str = None):
+    """The job as a queryset, while it is still running (under this worker's claim)."""
+    jobs = Job.objects.filter(pk=job_id, status=Job.RUNNING)
+    return jobs if worker is None else jobs.filter(worker=worker)
+
+
+class JobProgress:
+    """
+    Progress of a running job, written by a heartbeat thread.
+
+    report() only records the latest progress in memory; the thread writes
+    it together with the heartbeat every interval, from its own database
+    connection. A job that writes inside a transaction (bulk import) can
+    therefore report progress without the update joining its transaction.
+    """
+
+    def __init__(self, job_id: int, interval: float = None, worker: str = None):
+        self.job_id = job_id
+        self.worker = worker
+        self.interval = interval if interval is not None else _setting(
+            'TASK_JOB_HEARTBEAT_INTERVAL', DEFAULT_HEARTBEAT_INTERVAL
+        )
+        self.fraction = 0.0
+        self.message = 'Started'
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f'job-{job_id}-heartbeat', daemon=True)
+
+    def report(self, fraction: float, message: str = ''):
+        """Record progress (0 to 1) and a short description."""
+        self.fraction = max(0.0, min(1.0, float(fraction)))
+        self.message = message[:255]
+
+    def _run(self):
+        try:
+            while not self._stop.wait(self.interval):
+                try:
+                    _claimed(self.job_id, self.worker).update(
+                        heartbeat_at=timezone.now(),
+                        progress=self.fraction,
+                        progress_message=self.message
+                    )
+                except OperationalError:
+                    # The database is busy (e.g. locked by the job's own write); retry next beat.
+                    pass
+        finally:
+            connection.close()
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+
+def _response_result(response) -> Tuple[object, int]:
+    """The JSON body and status of an endpoint response, as its client would see them."""
+    if response.streaming:
+        content = b''.join(response.streaming_content)
+    elif getattr(response, 'accepted_renderer', None) is not None:
+        # Finalized by the view: render with the renderer it negotiated.
+        content = response.render().content
+    else:
+        content = JSONRenderer().render(response.data)
+    return json.loads(content or 'null'), response.status_code
+
+
+def _endpoint_request(path: str, method: str, payload: Dict) -> WSGIRequest:
+    """Build the request the endpoint would receive for this payload."""
+    if method == 'GET':
+        query = urlencode({
+            key: value if isinstance(value, str) else json.dumps(value)
+            for key, value in payload.items()
+        })
+        body = b''
+    else:
+        query = ''
+        body = json.dumps(payload, cls=DjangoJSONEncoder).encode('utf-8')
+    return WSGIRequest({
+        'REQUEST_METHOD': method,
+        'PATH_INFO': path,
+        'SCRIPT_NAME': '',
+        'QUERY_STRING': query,
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': str(len(body)),
+        'SERVER_NAME': 'localhost',
+        'SERVER_PORT': '80',
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.url_scheme': 'http',
+    })
+
+
+def run_endpoint(kind: str, payload: Dict) -> Tuple[object, int]:
+    """
+    Run the endpoint of an endpoint job kind on a payload.
+
+    Stored tasks are used (GET) when the payload has no 'tasks' and the
+    endpoint supports it; otherwise the payload is the POST body.
+
+    Returns:
+        Tuple of (response data, HTTP status code)
+    """
+    path = reverse(ENDPOINT_JOBS[kind])
+    view = resolve(path).func
+    method = 'GET' if 'tasks' not in payload and hasattr(view.cls, 'get') else 'POST'
+    return _response_result(view(_endpoint_request(path, method, payload)))
+
+
+class ClaimLost(Exception):
+    """The job was requeued (and possibly claimed by another worker) while this worker ran it."""
+
+
+def _bulk_import(job: Job, progress: JobProgress) -> Tuple[object, int]:
+    """
+    Run a bulk import, reporting the rows written.
+
+    The import's result is written to the job row in the import's own
+    transaction. A long import transaction can block heartbeats (SQLite
+    locks the whole database) and get the job requeued; the next attempt
+    then finds the stored result and returns it instead of importing the
+    tasks a second time. An attempt that lost its claim before committing
+    rolls back instead.
+    """
+    from .views import TaskBulkCreateView
+
+    if job.result is not None:
+        return job.result, job.result_status
+
+    def report(done, total):
+        progress.report(done / total if total else 1.0, f"Stored {done} of {total} tasks")
+
+    progress.report(0.0, 'Validating tasks')
+    with transaction.atomic():
+        data, status_code = _response_result(TaskBulkCreateView()._import(job.payload, progress=report))
+        if not _claimed(job.pk, job.worker).update(result=data, result_status=status_code):
+            raise ClaimLost(f"Job {job.pk} was requeued during the import")
+    return data, status_code
+
+
+def run_job(job: Job) -> Job:
+    """
+    Run a claimed job and store its outcome.
+
+    The job succeeds when the endpoint answers with a 2xx status; otherwise
+    it fails and its result is the endpoint's error body. The outcome is
+    only stored while the job is still running under this worker's claim:
+    a job requeued meanwhile (e.g. after a long stall) belongs to whichever
+    worker claimed it next, and this run's outcome is dropped.
+    """
+    with JobProgress(job.pk, worker=job.worker) as progress:
+        try:
+            if job.kind == 'bulk_import':
+                data, status_code = _bulk_import(job, progress)
+            else:
+                progress.report(0.0, 'Running')
+                data, status_code = run_endpoint(job.kind, job.payload)
+            job.result = data
+            job.result_status = status_code
+            job.status = Job.SUCCEEDED if 200 <= status_code < 300 else Job.FAILED
+            if job.status == Job.FAILED:
+                job.error = (data or {}).get('error', 'Job failed') if isinstance(data, dict) else 'Job failed'
+        except Exception as e:
+            job.status = Job.FAILED
+            job.result_status = 500
+            job.error = str(e) or type(e).__name__
+
+    now = timezone.now()
+    job.progress = 1.0 if job.status == Job.SUCCEEDED else progress.fraction
+    job.progress_message = 'Finished' if job.status == Job.SUCCEEDED else 'Failed'
+    job.finished_at = now
+    job.heartbeat_at = now
+    job.expires_at = now + timedelta(seconds=_setting('TASK_JOB_RESULT_TTL', DEFAULT_RESULT_TTL))
+    outcome = {
+        field: getattr(job, field) for field in (
+            'status', 'result', 'result_status', 'error', 'progress', 'progress_message',
+            'finished_at', 'heartbeat_at', 'expires_at'
+        )
+    }
+    for attempt in range(1, FINISH_ATTEMPTS + 1):
+        try:
+            finished = _claimed(job.pk, job.worker).update(**outcome)
+            break
+        except OperationalError:
+            if attempt == FINISH_ATTEMPTS:
+                # Still running without heartbeats: requeue_stale_jobs will run it again.
+                logger.exception("Could not store the outcome of job %s; it is left to be requeued", job.pk)
+                return job
+            time.sleep(FINISH_RETRY_DELAY * attempt)
+    if not finished:
+        logger.warning("Job %s was requeued while worker %s ran it; its outcome is discarded", job.pk, job.worker)
+        job.refresh_from_db()
+    return job
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def work(
+    worker_id: str = None,
+    poll_interval: float = 1.0,
+    max_jobs: int = None,
+    stop_when_idle: bool = False,
+    should_stop: Callable[[], bool] = None
+) -> int:
+    """
+    Worker loop: claim and run jobs until stopped.
+
+    Args:
+        worker_id: Name recorded on claimed jobs (default: host:pid)
+        poll_interval: Seconds to sleep when the queue is empty
+        max_jobs: Stop after this many jobs
+        stop_when_idle: Stop as soon as the queue is empty
+        should_stop: Optional callable checked between jobs
+
+    Returns:
+        Number of jobs run
+    """
+    worker_id = worker_id or default_worker_id()
+    processed = 0
+    while max_jobs is None or processed < max_jobs:
+        if should_stop is not None and should_stop():
+            break
+        close_old_connections()
+        try:
+            requeue_stale_jobs()
+            purge_expired_jobs()
+            job = claim_job(worker_id)
+        except OperationalError:
+            # The database is busy or unreachable; keep the worker alive and retry.
+            logger.exception("Worker %s could not poll the job queue", worker_id)
+            time.sleep(poll_interval)
+            continue
+        if job is None:
+            if stop_when_idle:
+                break
+            time.sleep(poll_interval)
+            continue
+        run_job(job)
+        processed += 1
+    return processed
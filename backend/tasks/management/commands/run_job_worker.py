@@ -0,0 +1,78 @@
+"""
+Run background job workers: python manage.py run_job_worker
+"""
+import multiprocessing
+import signal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from tasks.jobs import default_worker_id, work
+
+
+def _worker_process(poll_interval, max_jobs, stop_when_idle):
+    """Entry point of a forked worker process."""
+    stopping = []
+    signal.signal(signal.SIGTERM, lambda *args: stopping.append(True))
+    work(
+        worker_id=default_worker_id(),
+        poll_interval=poll_interval,
+        max_jobs=max_jobs,
+        stop_when_idle=stop_when_idle,
+        should_stop=lambda: bool(stopping)
+    )
+
+
+class Command(BaseCommand):
+    help = 'Run queued background jobs (see POST /api/tasks/jobs/).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes', type=int, default=1,
+            help='Number of worker processes (default: 1)'
+        )
+        parser.add_argument(
+            '--poll-interval', type=float, default=1.0,
+            help='Seconds between queue polls when idle (default: 1)'
+        )
+        parser.add_argument(
+            '--max-jobs', type=int, default=None,
+            help='Exit after each worker ran this many jobs'
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Run the queued jobs, then exit'
+        )
+
+    def handle(self, *args, **options):
+        processes = options['processes']
+        if processes < 1:
+            raise CommandError('--processes must be at least 1')
+        worker_args = (options['poll_interval'], options['max_jobs'], options['once'])
+
+        if processes == 1:
+            processed = work(
+                poll_interval=worker_args[0],
+                max_jobs=worker_args[1],
+                stop_when_idle=worker_args[2]
+            )
+            self.stdout.write(f'Ran {processed} job(s)')
+            return
+
+        # Forked workers must not share the parent's database connection.
+        connections.close_all()
+        workers = [
+            multiprocessing.Process(target=_worker_process, args=worker_args, name=f'job-worker-{i}')
+            for i in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        self.stdout.write(f'Started {processes} job workers')
+        try:
+            for worker in workers:
+                worker.join()
+        except KeyboardInterrupt:
+            for worker in workers:
+                worker.terminate()
+            for worker in workers:
+                worker.join()
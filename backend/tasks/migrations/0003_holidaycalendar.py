@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_taskfeedback_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HolidayCalendar',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Calendar name used as selector', max_length=64, unique=True)),
+                ('base_calendar', models.CharField(blank=True, default='', help_text='Built-in calendar this one extends (empty for weekends only)', max_length=32)),
+                ('holidays', models.JSONField(blank=True, default=list, help_text='List of extra holiday dates (YYYY-MM-DD)')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+    ]
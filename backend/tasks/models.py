@@ -2,11 +2,110 @@
 Task models for the task analyzer application.
 Tasks are persisted to SQLite database.
 """
-from django.db import models
+from django.db import models, transaction
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 
-class Task(models.Model):
+class DatasetVersion(models.Model):
+    """
+    Monotonically increasing version of the stored data.
+    
+    Every write to a versioned model (tasks, feedback and holiday calendars)
+    bumps it in the same transaction as the write, so read endpoints can
+    tell whether anything changed (e.g. for ETags) with one primary-key
+    lookup instead of reading the data. The single row is created by the
+    migration.
+    """
+    SINGLETON_ID = 1
+    
+    version = models.BigIntegerField(default=0)
+    
+    class Meta:
+        app_label = 'tasks'
+    
+    def __str__(self):
+        return f"Dataset version {self.version}"
+    
+    @classmethod
+    def current(cls):
+        """Return the current version (0 if nothing was ever written)."""
+        version = cls.objects.filter(pk=cls.SINGLETON_ID).values_list('version', flat=True).first()
+        return version or 0
+    
+    @classmethod
+    async def acurrent(cls):
+        """Async version of current()."""
+        version = await cls.objects.filter(pk=cls.SINGLETON_ID).values_list('version', flat=True).afirst()
+        return version or 0
+    
+    @classmethod
+    def bump(cls):
+        """Increment the version atomically."""
+        if not cls.objects.filter(pk=cls.SINGLETON_ID).update(version=models.F('version') + 1):
+            cls.objects.get_or_create(pk=cls.SINGLETON_ID)
+            cls.objects.filter(pk=cls.SINGLETON_ID).update(version=models.F('version') + 1)
+
+
+class VersionedQuerySet(models.QuerySet):
+    """
+    QuerySet whose bulk writes bump DatasetVersion.
+    
+    Single-row writes go through VersionedModel.save()/delete(); these are
+    the bulk paths that bypass them. Each write and its bump run in one
+    transaction, and a write that matched no rows leaves the version alone.
+    """
+    
+    def bulk_create(self, *args, **kwargs):
+        with transaction.atomic(using=self.db):
+            result = super().bulk_create(*args, **kwargs)
+            if result:
+                DatasetVersion.bump()
+        return result
+    
+    def bulk_update(self, *args, **kwargs):
+        with transaction.atomic(using=self.db):
+            result = super().bulk_update(*args, **kwargs)
+            if result:
+                DatasetVersion.bump()
+        return result
+    
+    def update(self, **kwargs):
+        with transaction.atomic(using=self.db):
+            result = super().update(**kwargs)
+            if result:
+                DatasetVersion.bump()
+        return result
+    
+    def delete(self):
+        with transaction.atomic(using=self.db):
+            result = super().delete()
+            if result[0]:
+                DatasetVersion.bump()
+        return result
+
+
+class VersionedModel(models.Model):
+    """Abstract base for models whose writes bump DatasetVersion (in the write's transaction)."""
+    
+    objects = VersionedQuerySet.as_manager()
+    
+    class Meta:
+        abstract = True
+    
+    def save(self, *args, **kwargs):
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+            DatasetVersion.bump()
+    
+    def delete(self, *args, **kwargs):
+        with transaction.atomic(using=kwargs.get('using')):
+            result = super().delete(*args, **kwargs)
+            DatasetVersion.bump()
+        return result
+
+
+class Task(VersionedModel):
     """
     Task model for storing task information in SQLite database.
     
@@ -43,26 +142,47 @@ class Task(models.Model):
         indexes = [
             models.Index(fields=['due_date']),
             models.Index(fields=['importance']),
+            # Keyset pagination of the task list (see pagination.keyset_page).
+            models.Index(fields=['created_at', 'id']),
         ]
     
     def __str__(self):
         return f"{self.pk}. {self.title}"
     
-    def to_dict(self):
-        """Convert task to dictionary for API responses."""
-        from datetime import date
-        due_date_str = self.due_date if isinstance(self.due_date, str) else self.due_date.strftime('%Y-%m-%d')
+    # Columns that to_dict() is built from, in row_to_dict() order.
+    DICT_FIELDS = ('id', 'title', 'due_date', 'estimated_hours', 'importance', 'dependencies')
+    
+    @staticmethod
+    def row_to_dict(row, due_date_strings=None):
+        """
+        Build the to_dict() representation from a values_list(*DICT_FIELDS) row.
+        
+        Lets large querysets be converted without loading model instances.
+        due_date_strings optionally memoizes formatted dates across rows.
+        """
+        pk, title, due_date, estimated_hours, importance, dependencies = row[:6]
+        if not isinstance(due_date, str):
+            due_date_str = due_date_strings.get(due_date) if due_date_strings is not None else None
+            if due_date_str is None:
+                due_date_str = due_date.strftime('%Y-%m-%d')
+                if due_date_strings is not None:
+                    due_date_strings[due_date] = due_date_str
+            due_date = due_date_str
         return {
-            'id': self.pk,
-            'title': self.title,
-            'due_date': due_date_str,
-            'estimated_hours': float(self.estimated_hours),
-            'importance': self.importance,
-            'dependencies': self.dependencies if self.dependencies else []
+            'id': pk,
+            'title': title,
+            'due_date': due_date,
+            'estimated_hours': float(estimated_hours),
+            'importance': importance,
+            'dependencies': dependencies if dependencies else []
         }
+    
+    def to_dict(self):
+        """Convert task to dictionary for API responses."""
+        return self.row_to_dict(tuple(getattr(self, field) for field in self.DICT_FIELDS))
 
 
-class TaskFeedback(models.Model):
+class TaskFeedback(VersionedModel):
     """
     Model to store user feedback on task suggestions for learning system.
     """
@@ -82,3 +202,129 @@ class TaskFeedback(models.Model):
     
     def __str__(self):
         return f"Feedback for Task {self.task_id}: {'Helpful' if self.was_helpful else 'Not Helpful'}"
+
+
+class HolidayCalendar(VersionedModel):
+    """
+    Custom working-day calendar stored in the database.
+    
+    A calendar optionally extends a built-in rule set (e.g. 'us', 'uk') with
+    extra holiday dates. Compiled calendars are cached by the calendar
+    registry; saving or deleting a row invalidates its cached entry.
+    """
+    name = models.CharField(max_length=64, unique=True, help_text="Calendar name used as selector")
+    base_calendar = models.CharField(
+        max_length=32,
+        blank=True,
+        default='',
+        help_text="Built-in calendar this one extends (empty for weekends only)"
+    )
+    holidays = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="List of extra holiday dates (YYYY-MM-DD)"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        app_label = 'tasks'
+        ordering = ['name']
+    
+    def __str__(self):
+        return self.name
+    
+    def save(self, *args, **kwargs):
+        self.name = self.name.strip().lower()
+        super().save(*args, **kwargs)
+        from .calendars import calendar_registry
+        calendar_registry.invalidate(self.name)
+    
+    def delete(self, *args, **kwargs):
+        name = self.name
+        result = super().delete(*args, **kwargs)
+        from .calendars import calendar_registry
+        calendar_registry.invalidate(name)
+        return result
+    
+    def to_dict(self):
+        """Convert calendar to dictionary for API responses."""
+        return {
+            'name': self.name,
+            'base_calendar': self.base_calendar,
+            'holidays': self.holidays if self.holidays else [],
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+
+class Job(models.Model):
+    """
+    Background job: an analysis or import run by a worker process.
+    
+    The table is the queue: workers claim the oldest queued job with a
+    conditional UPDATE, so several worker processes can share it without
+    an external broker. Jobs are not versioned - queueing or finishing a
+    job does not change the stored tasks.
+    """
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (QUEUED, 'Queued'),
+        (RUNNING, 'Running'),
+        (SUCCEEDED, 'Succeeded'),
+        (FAILED, 'Failed'),
+    ]
+    FINISHED = (SUCCEEDED, FAILED)
+    
+    kind = models.CharField(max_length=32, help_text="Job kind (see jobs.JOB_KINDS)")
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=QUEUED)
+    payload = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    result_status = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text="HTTP status the equivalent endpoint would have returned"
+    )
+    error = models.TextField(blank=True, default='')
+    progress = models.FloatField(default=0.0, help_text="Completed fraction, 0 to 1")
+    progress_message = models.CharField(max_length=255, blank=True, default='')
+    worker = models.CharField(max_length=64, blank=True, default='')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True, help_text="When the finished job is purged")
+    
+    class Meta:
+        app_label = 'tasks'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'id']),
+            models.Index(fields=['expires_at']),
+        ]
+    
+    def __str__(self):
+        return f"Job {self.pk} ({self.kind}, {self.status})"
+    
+    def to_dict(self, include_result=True):
+        """Convert job to dictionary for API responses."""
+        data = {
+            'id': self.pk,
+            'kind': self.kind,
+            'status': self.status,
+            'progress': self.progress,
+            'progress_message': self.progress_message,
+            'attempts': self.attempts,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'expires_at': self.expires_at.isoformat() if self.expires_at else None
+        }
+        if self.error:
+            data['error'] = self.error
+        if include_result and self.status in self.FINISHED:
+            data['result_status'] = self.result_status
+            data['result'] = self.result
+        return data
@@ -0,0 +1,233 @@
+"""
+Cursor pagination for task lists and ranked analysis results.
+
+Stored tasks are paged with keyset cursors on (created_at, id): each page is
+an index range scan starting after the last row of the previous page, so
+page N costs the same as page 1 and rows inserted or deleted meanwhile never
+shift later pages.
+
+Ranked results cannot be paged that way, because a task's rank depends on
+every other task and on the evaluation date. The first page scores the tasks
+once and keeps the ranking in a RankingSnapshotStore; later pages are sliced
+from that snapshot, so they are consistent with the first page even if tasks
+change in between, and are never rescored. Snapshots expire after a TTL.
+"""
+import base64
+import binascii
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from django.db.models import Q
+
+from .scoring import PriorityCalculator
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(payload: Dict) -> str:
+    """Encode a cursor payload as an opaque URL-safe token."""
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str) -> Dict:
+    """
+    Decode a token produced by encode_cursor.
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        payload = json.loads(raw.decode('utf-8'))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Malformed cursor")
+    if not isinstance(payload, dict):
+        raise ValueError("Malformed cursor")
+    return payload
+
+
+def parse_page_size(raw_value, default: int = DEFAULT_PAGE_SIZE, maximum: int = MAX_PAGE_SIZE) -> int:
+    """
+    Validate a requested page size.
+
+    Raises:
+        ValueError: If the value is not an integer between 1 and maximum
+    """
+    if raw_value is None or raw_value == '':
+        return default
+    try:
+        page_size = int(raw_value)
+    except (TypeError, ValueError):
+        page_size = 0
+    if not 1 <= page_size <= maximum:
+        raise ValueError(f"limit must be an integer between 1 and {maximum}, got: {raw_value}")
+    return page_size
+
+
+def keyset_page(queryset, cursor: Optional[str], page_size: int) -> Tuple[List[Dict], Optional[str]]:
+    """
+    One page of tasks, newest first, after the position encoded in cursor.
+
+    Rows are ordered by (-created_at, -id), so tasks created in the same
+    instant still have a total order, and read with values_list() like
+    load_task_versions.
+
+    Args:
+        queryset: Task queryset to page through
+        cursor: Token from a previous page, or None for the first page
+        page_size: Maximum number of tasks returned
+
+    Returns:
+        Tuple of (tasks, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    from .models import Task
+
+    if cursor:
+        payload = decode_cursor(cursor)
+        try:
+            created_at = datetime.fromisoformat(payload['created_at'])
+            last_id = int(payload['id'])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("Malformed cursor")
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=last_id)
+        )
+
+    # One extra row tells whether there is a next page without a COUNT query.
+    rows = list(
+        queryset.order_by('-created_at', '-id')
+        .values_list(*Task.DICT_FIELDS, 'created_at')[:page_size + 1]
+    )
+    due_date_strings = {}
+    tasks = [Task.row_to_dict(row, due_date_strings) for row in rows[:page_size]]
+
+    next_cursor = None
+    if len(rows) > page_size:
+        last = rows[page_size - 1]
+        next_cursor = encode_cursor({'created_at': last[-1].isoformat(), 'id': last[0]})
+    return tasks, next_cursor
+
+
+class RankingSnapshot:
+    """
+    A frozen ranking: the scored tasks and their order.
+
+    Only the score arrays and the order are kept; the response entries of a
+    page are built when the page is requested.
+    """
+
+    __slots__ = ('snapshot_id', 'tasks', 'scores', 'priority_scores', 'order', 'expires_at')
+
+    def __init__(
+        self,
+        snapshot_id: str,
+        tasks: List[Dict],
+        scores: Dict[str, np.ndarray],
+        priority_scores: np.ndarray,
+        order: np.ndarray,
+        expires_at: float
+    ):
+        self.snapshot_id = snapshot_id
+        self.tasks = tasks
+        self.scores = scores
+        self.priority_scores = priority_scores
+        self.order = order
+        self.expires_at = expires_at
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def page(self, offset: int, page_size: int) -> List[Dict]:
+        """Ranked task entries [offset, offset + page_size), as analyze_tasks returns them."""
+        return PriorityCalculator._materialize(
+            self.tasks, self.scores, self.priority_scores, self.order[offset:offset + page_size]
+        )
+
+
+class RankingSnapshotStore:
+    """
+    Process-local store of ranking snapshots with a TTL.
+
+    At most max_snapshots are kept; the oldest one is dropped first. A
+    snapshot is not refreshed by reading it, so a client paging slowly gets
+    an expired-cursor error after ttl seconds rather than an ever older ranking.
+    """
+
+    def __init__(self, ttl: float = 300, max_snapshots: int = 32, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            ttl: Seconds a snapshot can be paged after it was created
+            max_snapshots: Maximum number of live snapshots
+            clock: Monotonic time source (overridable in tests)
+        """
+        self.ttl = ttl
+        self.max_snapshots = max_snapshots
+        self.clock = clock
+        self._snapshots = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict_expired(self, now: float):
+        """Drop expired snapshots (callers hold the lock)."""
+        while self._snapshots:
+            snapshot = next(iter(self._snapshots.values()))
+            if snapshot.expires_at > now:
+                break
+            self._snapshots.popitem(last=False)
+
+    def create(
+        self,
+        tasks: List[Dict],
+        scores: Dict[str, np.ndarray],
+        priority_scores: np.ndarray,
+        keep: bool = True
+    ) -> RankingSnapshot:
+        """
+        Rank scored tasks (ties keep input order, as in analyze_tasks).
+
+        Args:
+            tasks: Scored task dictionaries
+            scores: Score arrays from PriorityCalculator.score_tasks
+            priority_scores: Rounded priority scores from score_tasks
+            keep: Whether to store the snapshot for later pages
+
+        Returns:
+            The new snapshot
+        """
+        order = np.argsort(-priority_scores, kind='stable')
+        now = self.clock()
+        snapshot = RankingSnapshot(uuid.uuid4().hex, tasks, scores, priority_scores, order, now + self.ttl)
+        if not keep:
+            return snapshot
+        with self._lock:
+            self._evict_expired(now)
+            self._snapshots[snapshot.snapshot_id] = snapshot
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return snapshot
+
+    def get(self, snapshot_id: str) -> Optional[RankingSnapshot]:
+        """The live snapshot with this ID, or None if it is unknown or expired."""
+        with self._lock:
+            self._evict_expired(self.clock())
+            return self._snapshots.get(snapshot_id)
+
+    def clear(self):
+        """Drop every snapshot."""
+        with self._lock:
+            self._snapshots.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._evict_expired(self.clock())
+            return len(self._snapshots)
@@ -0,0 +1,231 @@
+"""
+Streaming JSON rendering for large list responses.
+
+JSONRenderer encodes a response into one string, so a 100k-task analysis
+holds every result dict and a multi-megabyte JSON string at the same time,
+and the client sees nothing until both exist. StreamingJSONRenderer encodes
+the same document piece by piece: the containers of the response are
+walked, list elements are encoded a batch at a time, and the output is
+yielded in buffers of at least chunk_size bytes. The bytes are identical to
+JSONRenderer's.
+
+A list value can be a LazyList, which builds its elements one page at a
+time (e.g. from a ranking's score arrays), so only one page of result
+dicts exists at any moment. Views opt in with StreamingResponseMixin; lists
+shorter than the streaming threshold are rendered in one piece as before.
+"""
+from collections.abc import Iterator
+from itertools import islice
+from typing import Callable, List
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+DEFAULT_CHUNK_SIZE = 65536
+DEFAULT_STREAMING_THRESHOLD = 1000
+LAZY_PAGE_SIZE = 1000
+# List elements encoded per encoder call.
+ENCODE_BATCH = 1000
+
+
+class LazyList:
+    """
+    A list whose elements are built on demand, one page at a time.
+
+    Args:
+        length: Number of elements
+        page: Callable (offset, size) -> list of the elements
+            [offset, offset + size), e.g. RankingSnapshot.page
+        page_size: Elements built per call of page
+    """
+
+    __slots__ = ('length', 'page', 'page_size')
+
+    def __init__(self, length: int, page: Callable[[int, int], List], page_size: int = LAZY_PAGE_SIZE):
+        self.length = length
+        self.page = page
+        self.page_size = page_size
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self):
+        for offset in range(0, self.length, self.page_size):
+            yield from self.page(offset, min(self.page_size, self.length - offset))
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyList)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __getitem__(self, index):
+        """Slices build only the elements they cover; used for top-k summaries."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step != 1:
+                return list(self)[index]
+            return self.page(start, stop - start) if stop > start else []
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('LazyList index out of range')
+        return self.page(index, 1)[0]
+
+
+class StreamingJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that can also encode a document incrementally.
+
+    render() returns the whole document like JSONRenderer; iter_render()
+    yields it as byte chunks. Dicts and lists are walked; everything else,
+    and each batch of list elements, is encoded in one call.
+    """
+
+    chunk_size = DEFAULT_CHUNK_SIZE
+
+    def _encoder(self):
+        separators = (',', ':') if self.compact else (', ', ': ')
+        return JSONEncoder(
+            ensure_ascii=self.ensure_ascii,
+            allow_nan=not self.strict,
+            separators=separators
+        ), separators
+
+    def can_stream(self, accepted_media_type=None, renderer_context=None) -> bool:
+        """Indented (browsable) output is always rendered in one piece."""
+        return self.get_indent(accepted_media_type, renderer_context or {}) is None
+
+    def _iter_parts(self, value, encode, item_separator, key_separator):
+        """Yield the JSON text of value in parts."""
+        if isinstance(value, dict):
+            if not all(isinstance(key, str) for key in value):
+                # Non-string keys: let the encoder apply its key coercion.
+                yield encode(value)
+                return
+            yield '{'
+            for index, (key, item) in enumerate(value.items()):
+                if index:
+                    yield item_separator
+                yield encode(key)
+                yield key_separator
+                if isinstance(item, dict):
+                    yield from self._iter_parts(item, encode, item_separator, key_separator)
+                elif isinstance(item, (list, tuple, LazyList, Iterator)):
+                    yield from self._iter_list(item, encode, item_separator)
+                else:
+                    yield encode(item)
+            yield '}'
+        elif isinstance(value, (list, tuple, LazyList, Iterator)):
+            yield from self._iter_list(value, encode, item_separator)
+        else:
+            yield encode(value)
+
+    @staticmethod
+    def _iter_list(items, encode, item_separator):
+        # Elements are encoded ENCODE_BATCH at a time: one encoder call per
+        # batch keeps the per-element overhead of JSONRenderer's single call.
+        yield '['
+        iterator = iter(items)
+        first = True
+        while True:
+            batch = list(islice(iterator, ENCODE_BATCH))
+            if not batch:
+                break
+            if not first:
+                yield item_separator
+            yield encode(batch)[1:-1]
+            first = False
+        yield ']'
+
+    def iter_render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data as JSON, yielding bytes in chunks of at least chunk_size.
+
+        Only the current chunk and the batch being encoded are held in
+        memory (plus one page of a LazyList).
+        """
+        if data is None:
+            return
+        encoder, (item_separator, key_separator) = self._encoder()
+        buffer = []
+        size = 0
+        for part in self._iter_parts(data, encoder.encode, item_separator, key_separator):
+            buffer.append(part)
+            size += len(part)
+            if size >= self.chunk_size:
+                yield self._finish(''.join(buffer))
+                buffer = []
+                size = 0
+        if buffer:
+            yield self._finish(''.join(buffer))
+
+    @staticmethod
+    def _finish(text: str) -> bytes:
+        # Same escaping as JSONRenderer.render.
+        return text.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029').encode()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not self.can_stream(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        return b''.join(self.iter_render(data, accepted_media_type, renderer_context))
+
+
+def longest_list(data) -> int:
+    """Length of the longest list among the top-level values of a response."""
+    if isinstance(data, (list, tuple, LazyList)):
+        return len(data)
+    if not isinstance(data, dict):
+        return 0
+    return max(
+        (len(value) for value in data.values() if isinstance(value, (list, tuple, LazyList))),
+        default=0
+    )
+
+
+def streaming_json_response(response: Response) -> StreamingHttpResponse:
+    """Stream a finalized DRF response with its StreamingJSONRenderer, keeping status and headers."""
+    renderer = response.accepted_renderer
+    streamed = StreamingHttpResponse(
+        renderer.iter_render(response.data, response.accepted_media_type, response.renderer_context),
+        status=response.status_code,
+        content_type=renderer.media_type
+    )
+    for header, value in response.items():
+        if header.lower() != 'content-type':
+            streamed[header] = value
+    return streamed
+
+
+class StreamingResponseMixin:
+    """
+    Opt an APIView into streamed JSON responses.
+
+    Successful responses with a top-level list of at least
+    streaming_threshold elements (default TASK_STREAMING_RESPONSE_THRESHOLD)
+    are sent as a StreamingHttpResponse; smaller ones, errors and indented
+    output are rendered in one piece. Either way the body is the same JSON.
+    """
+
+    renderer_classes = [StreamingJSONRenderer]
+    streaming_threshold = None
+
+    def get_streaming_threshold(self) -> int:
+        if self.streaming_threshold is not None:
+            return self.streaming_threshold
+        return getattr(settings, 'TASK_STREAMING_RESPONSE_THRESHOLD', DEFAULT_STREAMING_THRESHOLD)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if (
+            isinstance(response, Response)
+            and not response.exception
+            and response.status_code == 200
+            and isinstance(response.accepted_renderer, StreamingJSONRenderer)
+            and response.accepted_renderer.can_stream(response.accepted_media_type, response.renderer_context)
+            and longest_list(response.data) >= self.get_streaming_threshold()
+        ):
+            return streaming_json_response(response)
+        return response
@@ -0,0 +1,303 @@
+"""
+Weight-sweep sensitivity analysis.
+
+Every weight vector scores tasks as the same linear combination of the four
+raw factor scores, so a sweep over N vectors needs the factors only once:
+the (tasks x 4) factor matrix is combined with the (4 x N) weight matrix.
+Parsing and factor evaluation - the expensive part of an analysis - happen
+once, whatever N is.
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .scoring import PriorityCalculator, ScoreCache, TaskGraph, WEIGHTS, round_array
+
+FACTORS = ('urgency', 'importance', 'effort', 'dependencies')
+RAW_COLUMNS = ('urgency_raw', 'importance_raw', 'effort_raw', 'dependency_raw')
+
+MAX_SWEEP_VECTORS = 300
+# Most (vector, task) ranks a sweep keeps for the rank correlation: 40 MB of
+# int32, e.g. 300 vectors on 33k tasks or 100 vectors on 100k tasks.
+MAX_SWEEP_RANK_CELLS = 10_000_000
+# Weight vectors combined per step, bounding the (tasks x vectors) totals kept in memory.
+SWEEP_CHUNK_SIZE = 16
+# Size of the ranking whose stability is reported.
+STABLE_TOP = 3
+
+
+def _compositions(total: int, ranges: List[Tuple[int, int]]):
+    """Yield every tuple of integers within ranges (inclusive) summing to total."""
+    low, high = ranges[0]
+    if len(ranges) == 1:
+        if low <= total <= high:
+            yield (total,)
+        return
+    for first in range(low, min(high, total) + 1):
+        for rest in _compositions(total - first, ranges[1:]):
+            yield (first,) + rest
+
+
+def _count_compositions(total: int, ranges: List[Tuple[int, int]]) -> int:
+    """Number of tuples _compositions(total, ranges) yields, without enumerating them."""
+    # ways[s]: number of ways the factors seen so far sum to s.
+    ways = [1] + [0] * total
+    for low, high in ranges:
+        ways = [
+            sum(ways[s - count] for count in range(low, min(high, s) + 1))
+            for s in range(total + 1)
+        ]
+    return ways[total]
+
+
+def grid_units(step: float) -> int:
+    """
+    Number of grid steps in 1.0.
+
+    Raises:
+        ValueError: If 1/step is not a whole number (the grid would not reach 1.0)
+    """
+    units = int(round(1 / step))
+    if units < 1 or abs(units * step - 1.0) > 1e-6:
+        raise ValueError(f"1/step must be a whole number (e.g. 0.1, 0.125, 0.2, 0.25), got step {step}")
+    return units
+
+
+def weight_grid(
+    step: float,
+    bounds: Dict[str, Tuple[float, float]] = None,
+    max_vectors: int = MAX_SWEEP_VECTORS
+) -> List[Dict[str, float]]:
+    """
+    Enumerate weight vectors on a grid over the simplex (weights sum to 1.0).
+
+    Weights are multiples of 1/units (units = 1/step) built from integer
+    counts that sum to units, so every vector sums to exactly 1.0.
+
+    Args:
+        step: Grid spacing, e.g. 0.1; 1/step must be a whole number
+        bounds: Optional (min, max) per factor; unbounded factors range over [0, 1]
+        max_vectors: Largest grid accepted; larger ones are rejected before
+            any vector is built
+
+    Returns:
+        List of weight dictionaries
+
+    Raises:
+        ValueError: If the step is invalid or the grid has more than max_vectors vectors
+    """
+    bounds = bounds or {}
+    units = grid_units(step)
+    ranges = []
+    for factor in FACTORS:
+        low, high = bounds.get(factor, (0.0, 1.0))
+        ranges.append((max(0, int(np.ceil(low * units - 1e-9))), min(units, int(np.floor(high * units + 1e-9)))))
+
+    count = _count_compositions(units, ranges)
+    if count > max_vectors:
+        raise ValueError(f"At most {max_vectors} weight vectors can be compared, the grid has {count}")
+
+    return [
+        {factor: round(value / units, 6) for factor, value in zip(FACTORS, counts)}
+        for counts in _compositions(units, ranges)
+    ]
+
+
+class WeightSweep:
+    """
+    Scores one task list under many weight vectors at once.
+
+    Totals are accumulated factor by factor in the same order as
+    PriorityCalculator.score_batch (a column-wise (tasks x 4) . (4 x N)
+    product), so each vector's ranking is exactly the one analyze_tasks
+    would return for it.
+    """
+
+    def __init__(self, calculator: PriorityCalculator, k: int = 3):
+        """
+        Args:
+            calculator: Calculator providing calendar, evaluation date and
+                dependency mode (its weights are not used)
+            k: Number of top tasks reported per vector
+        """
+        self.calculator = calculator
+        self.k = k
+
+    @staticmethod
+    def _weight_matrix(vectors: List[Dict[str, float]]) -> np.ndarray:
+        """Validate weight vectors and stack them into a (4 x N) matrix."""
+        rows = []
+        for vector in vectors:
+            weights = PriorityCalculator(weights=vector).weights
+            rows.append([weights[factor] for factor in FACTORS])
+        return np.array(rows, dtype=np.float64).T
+
+    @staticmethod
+    def _totals(factors: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Rounded priority scores, one row per weight column and one column per task."""
+        totals = factors[:, 0] * weights[0][:, None]
+        for j in range(1, len(FACTORS)):
+            totals = totals + factors[:, j] * weights[j][:, None]
+        return round_array(totals)
+
+    def _stable_ranges(
+        self,
+        factors: np.ndarray,
+        current: np.ndarray,
+        top: np.ndarray
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Range of each weight over which the current top tasks keep their order.
+
+        One weight is moved while the others keep their proportions (and the
+        sum stays 1.0), so every task's total is a line in that weight. The
+        top tasks stay in place while each of them stays above the next one
+        and the last of them stays above every other task: one linear
+        inequality per task, solved in O(tasks) per factor.
+        """
+        others = np.ones(len(factors), dtype=bool)
+        others[top] = False
+        ranges = {}
+        for j, factor in enumerate(FACTORS):
+            rest = np.delete(np.arange(len(FACTORS)), j)
+            remaining = 1.0 - current[j]
+            if remaining > 1e-9:
+                shares = current[rest] / remaining
+            else:
+                shares = np.full(len(rest), 1.0 / len(rest))
+            intercepts = factors[:, rest] @ shares
+            slopes = factors[:, j] - intercepts
+
+            pairs_above = [top[i] for i in range(len(top) - 1)]
+            pairs_below = [top[i + 1] for i in range(len(top) - 1)]
+            intercept_gap = np.concatenate([
+                intercepts[pairs_above] - intercepts[pairs_below],
+                intercepts[top[-1]] - intercepts[others]
+            ])
+            slope_gap = np.concatenate([
+                slopes[pairs_above] - slopes[pairs_below],
+                slopes[top[-1]] - slopes[others]
+            ])
+
+            low, high = 0.0, 1.0
+            rising = slope_gap > 1e-12
+            falling = slope_gap < -1e-12
+            if rising.any():
+                low = max(low, float(np.max(-intercept_gap[rising] / slope_gap[rising])))
+            if falling.any():
+                high = min(high, float(np.min(-intercept_gap[falling] / slope_gap[falling])))
+            # Ties broken by input order can put the current weight on a boundary.
+            low = min(low, float(current[j]))
+            high = max(high, float(current[j]))
+            ranges[factor] = {
+                'current': float(current[j]),
+                'min': round(low, 4),
+                'max': round(high, 4)
+            }
+        return ranges
+
+    def run(
+        self,
+        tasks: List[Dict],
+        vectors: List[Dict[str, float]],
+        current_weights: Optional[Dict[str, float]] = None,
+        cache: ScoreCache = None,
+        versions: Dict[int, object] = None,
+        graph: TaskGraph = None
+    ) -> Dict:
+        """
+        Score tasks under every weight vector.
+
+        Args:
+            tasks: List of task dictionaries
+            vectors: Weight vectors to compare (at most MAX_SWEEP_VECTORS, and
+                at most MAX_SWEEP_RANK_CELLS vectors x tasks)
+            current_weights: Weights whose top tasks' stability is reported
+                (default: WEIGHTS)
+            cache: Optional ScoreCache for the factor scores of stored tasks
+            versions: Dictionary mapping task_id to its version (see score_tasks)
+            graph: TaskGraph of tasks, if the caller already built it
+
+        Returns:
+            Dictionary with:
+            - vectors: Each weight vector with its top-k tasks
+            - rank_correlation: Spearman correlation between the full rankings
+            - stability: Current top tasks and the range of each weight
+              over which they stay the top tasks, in the same order
+
+        Raises:
+            ValueError: If tasks or a weight vector are invalid, or there are
+                no or too many vectors
+        """
+        if not vectors:
+            raise ValueError("At least one weight vector is required")
+        if len(vectors) > MAX_SWEEP_VECTORS:
+            raise ValueError(f"At most {MAX_SWEEP_VECTORS} weight vectors can be compared, got {len(vectors)}")
+        if len(vectors) * len(tasks) > MAX_SWEEP_RANK_CELLS:
+            raise ValueError(
+                f"Too large a sweep: {len(vectors)} weight vectors over {len(tasks)} tasks; "
+                f"at most {max(1, MAX_SWEEP_RANK_CELLS // max(1, len(tasks)))} vectors can be compared on this many tasks"
+            )
+        weights = self._weight_matrix(vectors)
+        current = self._weight_matrix([current_weights or WEIGHTS])[:, 0]
+
+        scores, _ = self.calculator.score_tasks(tasks, cache, versions, graph)
+        factors = np.column_stack([scores[column] for column in RAW_COLUMNS])
+        n = len(tasks)
+        positions = np.arange(n)
+
+        results = []
+        count = weights.shape[1]
+        ranks = np.empty((count, n), dtype=np.int32)
+        # Cross-products of the rank rows, accumulated a block at a time so
+        # no float copy of the whole rank matrix is made.
+        gram = np.empty((count, count), dtype=np.float64)
+        for start in range(0, count, SWEEP_CHUNK_SIZE):
+            chunk = weights[:, start:start + SWEEP_CHUNK_SIZE]
+            end = start + chunk.shape[1]
+            totals = self._totals(factors, chunk)
+            for offset, row in enumerate(totals):
+                order = np.argsort(-row, kind='stable')
+                ranks[start + offset, order] = positions
+                results.append({
+                    'weights': {factor: float(value) for factor, value in zip(FACTORS, chunk[:, offset])},
+                    'top': [
+                        {
+                            'id': tasks[i].get('id'),
+                            'title': tasks[i].get('title'),
+                            'priority_score': float(row[i])
+                        }
+                        for i in order[:self.k].tolist()
+                    ]
+                })
+
+            block = ranks[start:end].astype(np.float64)
+            for other in range(0, end, SWEEP_CHUNK_SIZE):
+                other_end = min(other + SWEEP_CHUNK_SIZE, end)
+                products = block @ ranks[other:other_end].astype(np.float64).T
+                gram[start:end, other:other_end] = products
+                gram[other:other_end, start:end] = products.T
+
+        if n > 1:
+            # Every rank row is a permutation of 0..n-1, so all rows share the
+            # mean (n - 1) / 2 and variance (n^2 - 1) / 12: Pearson correlation
+            # of the ranks (Spearman) follows from the cross-products alone.
+            mean = (n - 1) / 2
+            correlation = (gram - n * mean * mean) / (n * (n * n - 1) / 12)
+        else:
+            correlation = np.ones((count, count))
+
+        current_totals = self._totals(factors, current[:, None])[0]
+        current_top = np.argsort(-current_totals, kind='stable')[:STABLE_TOP]
+        stability = {
+            'weights': {factor: float(value) for factor, value in zip(FACTORS, current)},
+            'top_tasks': [tasks[i].get('id') for i in current_top.tolist()],
+            'ranges': self._stable_ranges(factors, current, current_top)
+        }
+
+        return {
+            'vectors': results,
+            'rank_correlation': np.round(correlation, 4).tolist(),
+            'stability': stability,
+            'task_count': n
+        }
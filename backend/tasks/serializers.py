@@ -1,8 +1,14 @@
 """
 Serializers for task data validation and transformation.
 """
+from collections import OrderedDict
+from collections.abc import Mapping
+from django.conf import settings
 from rest_framework import serializers
 from datetime import datetime
+from .scoring import TaskGraph
+from .sensitivity import grid_units
+from .validation import fast_validate_tasks, DEFAULT_FAST_VALIDATION_THRESHOLD
 
 
 class TaskSerializer(serializers.Serializer):
@@ -147,11 +153,35 @@ class TaskSerializer(serializers.Serializer):
         return attrs
 
 
+class TaskCreateSerializer(TaskSerializer):
+    """Serializer for a new task to store: the database assigns the ID."""
+    
+    id = None
+
+
 class TaskListSerializer(serializers.Serializer):
     """Serializer for a list of tasks with comprehensive validation."""
     
     tasks = TaskSerializer(many=True, required=True)
     
+    def to_internal_value(self, data):
+        """
+        Validate lists of TASK_FAST_VALIDATION_THRESHOLD tasks or more on the fast path.
+        
+        The result is the same as DRF validation. Any invalid task (or a
+        duplicate ID) sends the whole payload through DRF, which reports the
+        errors in the usual format.
+        """
+        rows = data.get('tasks') if isinstance(data, Mapping) else None
+        threshold = getattr(settings, 'TASK_FAST_VALIDATION_THRESHOLD', DEFAULT_FAST_VALIDATION_THRESHOLD)
+        if isinstance(rows, list) and rows and len(rows) >= threshold:
+            tasks = fast_validate_tasks(rows, self.fields['tasks'].child)
+            if tasks is not None:
+                self.task_graph = TaskGraph(tasks)
+                if not self.task_graph.duplicate_ids:
+                    return OrderedDict(tasks=tasks)
+        return super().to_internal_value(data)
+    
     def validate_tasks(self, value):
         """Validate tasks list."""
         if value is None:
@@ -167,17 +197,12 @@ class TaskListSerializer(serializers.Serializer):
                 "Tasks list cannot be empty"
             )
         
-       
-        task_ids = []
-        for task in value:
-            task_id = task.get('id') if isinstance(task, dict) else None
-            if task_id is not None:
-                task_ids.append(task_id)
         
-        if len(task_ids) != len(set(task_ids)):
-            duplicates = [tid for tid in task_ids if task_ids.count(tid) > 1]
+        # Views reuse this graph for dependency validation and scoring.
+        self.task_graph = TaskGraph(value)
+        if self.task_graph.duplicate_ids:
             raise serializers.ValidationError(
-                f"Duplicate task IDs found: {list(set(duplicates))}"
+                f"Duplicate task IDs found: {self.task_graph.duplicate_ids}"
             )
         
         return value
@@ -220,6 +245,161 @@ class WeightConfigSerializer(serializers.Serializer):
         return attrs
 
 
+class WeightGridSerializer(serializers.Serializer):
+    """Serializer for a weight grid: a step and optional per-factor bounds."""
+    
+    step = serializers.FloatField(required=True, min_value=0.01, max_value=0.5)
+    bounds = serializers.DictField(
+        child=serializers.ListField(
+            child=serializers.FloatField(min_value=0.0, max_value=1.0),
+            min_length=2,
+            max_length=2
+        ),
+        required=False,
+        default=dict
+    )
+    
+    def validate_step(self, value):
+        """Validate that the grid steps add up to exactly 1.0."""
+        try:
+            grid_units(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+        return value
+    
+    def validate_bounds(self, value):
+        """Validate bound keys and that each range is ordered."""
+        valid_keys = {'urgency', 'importance', 'effort', 'dependencies'}
+        invalid_keys = set(value) - valid_keys
+        if invalid_keys:
+            raise serializers.ValidationError(
+                f"Invalid weight keys: {invalid_keys}. Valid keys are: {valid_keys}"
+            )
+        for key, (low, high) in value.items():
+            if low > high:
+                raise serializers.ValidationError(
+                    f"Bounds for '{key}' must be [min, max], got: [{low}, {high}]"
+                )
+        return value
+
+
+class WeightSweepSerializer(serializers.Serializer):
+    """Serializer for weight-sweep requests: explicit vectors or a grid."""
+    
+    vectors = serializers.ListField(
+        child=WeightConfigSerializer(),
+        required=False,
+        allow_empty=False
+    )
+    grid = WeightGridSerializer(required=False)
+    weights = WeightConfigSerializer(required=False)
+    k = serializers.IntegerField(required=False, min_value=1, max_value=100, default=3)
+    
+    def validate(self, attrs):
+        """Require exactly one of vectors and grid."""
+        if ('vectors' in attrs) == ('grid' in attrs):
+            raise serializers.ValidationError(
+                "Provide either 'vectors' (a list of weight configurations) or 'grid'"
+            )
+        return attrs
+
+
+class DailyPlanSerializer(serializers.Serializer):
+    """Serializer for daily-plan options."""
+    
+    hours_per_day = serializers.FloatField(required=False, min_value=0.5, max_value=24, default=8.0)
+    days = serializers.IntegerField(required=False, min_value=1, max_value=365)
+    local_search = serializers.BooleanField(required=False, default=False)
+    weights = WeightConfigSerializer(required=False)
+
+
+class TaskPatchSerializer(serializers.Serializer):
+    """Serializer for one hypothetical edit of a stored task."""
+    
+    id = serializers.IntegerField(required=True)
+    due_date = serializers.DateField(required=False, format='%Y-%m-%d')
+    shift_days = serializers.IntegerField(required=False, min_value=-3650, max_value=3650)
+    estimated_hours = serializers.FloatField(required=False, min_value=0.1, max_value=1000)
+    hours_scale = serializers.FloatField(required=False, min_value=0.01, max_value=100)
+    importance = serializers.IntegerField(required=False, min_value=1, max_value=10)
+    dependencies = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=True
+    )
+    
+    def validate(self, attrs):
+        """Require at least one edit and no conflicting edits."""
+        if 'due_date' in attrs and 'shift_days' in attrs:
+            raise serializers.ValidationError("Use either due_date or shift_days, not both")
+        if 'estimated_hours' in attrs and 'hours_scale' in attrs:
+            raise serializers.ValidationError("Use either estimated_hours or hours_scale, not both")
+        if len(attrs) == 1:
+            raise serializers.ValidationError(f"Patch for task {attrs['id']} does not change anything")
+        if attrs['id'] in attrs.get('dependencies', []):
+            raise serializers.ValidationError(f"Task {attrs['id']} cannot depend on itself")
+        return attrs
+
+
+class ScenarioSerializer(serializers.Serializer):
+    """Serializer for a what-if scenario: a named set of task patches."""
+    
+    name = serializers.CharField(required=False, allow_blank=True, max_length=255)
+    patches = TaskPatchSerializer(many=True, allow_empty=False)
+
+
+class WhatIfSerializer(serializers.Serializer):
+    """Serializer for what-if simulation requests."""
+    
+    scenarios = serializers.ListField(
+        child=ScenarioSerializer(),
+        allow_empty=False,
+        max_length=100
+    )
+    weights = WeightConfigSerializer(required=False)
+    limit = serializers.IntegerField(required=False, min_value=0, max_value=1000, default=50)
+    top = serializers.IntegerField(required=False, min_value=1, max_value=100, default=3)
+
+
+class HolidayCalendarSerializer(serializers.Serializer):
+    """Serializer for custom holiday calendars."""
+    
+    name = serializers.CharField(required=True, max_length=64)
+    base_calendar = serializers.CharField(required=False, allow_blank=True, default='', max_length=32)
+    holidays = serializers.ListField(
+        child=serializers.DateField(format='%Y-%m-%d'),
+        required=False,
+        default=list,
+        allow_empty=True
+    )
+    
+    def validate_name(self, value):
+        """Validate name is not empty and does not shadow a built-in calendar."""
+        from .calendars import BUILTIN_CALENDARS
+        name = value.strip().lower()
+        if not name:
+            raise serializers.ValidationError("Calendar name cannot be empty or whitespace only")
+        if name in BUILTIN_CALENDARS:
+            raise serializers.ValidationError(
+                f"'{name}' is a built-in calendar and cannot be redefined"
+            )
+        return name
+    
+    def validate_base_calendar(self, value):
+        """Validate base calendar refers to a built-in rule set."""
+        from .calendars import BUILTIN_CALENDARS
+        base = (value or '').strip().lower()
+        if base and base not in BUILTIN_CALENDARS:
+            raise serializers.ValidationError(
+                f"Unknown base calendar: {base}. Available: {sorted(BUILTIN_CALENDARS)}"
+            )
+        return base
+    
+    def validate_holidays(self, value):
+        """Store holidays as sorted, de-duplicated YYYY-MM-DD strings."""
+        return sorted({d.strftime('%Y-%m-%d') for d in value})
+
+
 class ScoredTaskSerializer(serializers.Serializer):
     """Serializer for task with priority score."""
     
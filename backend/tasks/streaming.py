@@ -0,0 +1,234 @@
+"""
+Streaming analysis of newline-delimited JSON (NDJSON) task feeds.
+
+The pipeline is a chain of generators, so memory stays bounded by the chunk
+size (plus the dependent-count map) no matter how long the feed is:
+
+    lines -> iter_records -> validated tasks -> chunks -> scored records
+
+Each chunk goes through the batch engine (build_batch/score_batch), so a
+streamed task gets exactly the scores analyze_tasks would give it for the
+same dependent count. Dependent counts are the only input that needs the
+whole feed; they come from a first pass (count_stream_dependents) or from
+the client.
+"""
+import heapq
+import json
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .scoring import PriorityCalculator
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def iter_records(lines: Iterable, start_line: int = 1) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    """
+    Parse NDJSON lines lazily.
+
+    Args:
+        lines: Iterable of str or bytes lines
+        start_line: Line number of the first line (for error reporting)
+
+    Yields:
+        (line_number, record, error) where exactly one of record and error is
+        set; blank lines are skipped
+    """
+    for line_number, line in enumerate(lines, start_line):
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, f"Expected a JSON object, got: {type(record).__name__}"
+            continue
+        yield line_number, record, None
+
+
+def count_stream_dependents(lines: Iterable) -> Dict[int, int]:
+    """
+    First pass over a feed: count direct dependents of every referenced task.
+
+    Only dependency IDs are kept, so memory is proportional to the number of
+    distinct tasks that something depends on, not to the feed size. Lines that
+    are not valid task objects are ignored here and reported by the scoring pass.
+    """
+    counts = defaultdict(int)
+    for _, record, _ in iter_records(lines):
+        dependencies = record.get('dependencies') if record else None
+        if isinstance(dependencies, list):
+            for dep_id in dependencies:
+                if isinstance(dep_id, int):
+                    counts[dep_id] += 1
+    return dict(counts)
+
+
+class StreamAnalyzer:
+    """
+    Scores a stream of task records chunk by chunk.
+
+    Output records are emitted in input order: the scored task (same shape as
+    an analyze_tasks entry) or {'line': n, 'error': ...} for a rejected line.
+    When top is set, a final {'summary': ...} record lists the top-N tasks,
+    ranked exactly like analyze_tasks (ties keep input order); only N
+    candidates are kept while streaming.
+    """
+
+    def __init__(
+        self,
+        calculator: PriorityCalculator,
+        dependent_counts: Optional[Dict[int, int]] = None,
+        top: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        validate: Callable[[Dict], Tuple[Optional[Dict], Optional[object]]] = None
+    ):
+        """
+        Args:
+            calculator: Calculator used to score every chunk
+            dependent_counts: Dictionary mapping task_id to dependent count;
+                None reads each task's own 'dependent_count' field (default 0)
+            top: Size of the trailing ranked summary (0 for none)
+            chunk_size: Number of tasks scored per batch
+            validate: Optional callable returning (task, errors) for a record
+        """
+        self.calculator = calculator
+        self.dependent_counts = dependent_counts
+        self.top = top
+        self.chunk_size = chunk_size
+        self.validate = validate
+        self.count = 0
+        self.error_count = 0
+        self._leaders: List[Tuple[float, int, Dict]] = []
+
+    def _tasks(self, records: Iterable) -> Iterator[Tuple[int, Optional[Dict], Optional[Dict]]]:
+        """Validate parsed records, yielding (line_number, task, error_record)."""
+        for line_number, record, error in records:
+            if error is not None:
+                yield line_number, None, {'line': line_number, 'error': error}
+                continue
+            if self.validate is not None:
+                record, details = self.validate(record)
+                if details:
+                    yield line_number, None, {'line': line_number, 'error': 'Invalid task data', 'details': details}
+                    continue
+            yield line_number, record, None
+
+    def _score_chunk(self, chunk: List[Tuple[int, Optional[Dict], Optional[Dict]]]) -> Iterator[Dict]:
+        """Score the valid tasks of a chunk and yield all of its output records in order."""
+        calculator = self.calculator
+        tasks = [task for _, task, _ in chunk if task is not None]
+        if self.dependent_counts is not None:
+            counts = {task.get('id'): self.dependent_counts.get(task.get('id'), 0) for task in tasks}
+        else:
+            counts = {task.get('id'): int(task.get('dependent_count') or 0) for task in tasks}
+
+        batch, errors = calculator._collect_batch(tasks, counts)
+        rejected = {error['index']: error['error'] for error in errors}
+        scored = iter(())
+        if rejected:
+            # Rejected rows hold no parsed values: score the valid rows only.
+            batch = batch.take(np.array([i for i in range(len(tasks)) if i not in rejected], dtype=np.int64))
+        if len(batch):
+            scores = calculator.score_batch(batch)
+            priority_scores = calculator._round_totals(scores)
+            scored = iter(calculator._materialize(
+                batch.tasks, scores, priority_scores, np.arange(len(batch), dtype=np.int64)
+            ))
+
+        position = 0
+        for line_number, task, error_record in chunk:
+            if task is None:
+                self.error_count += 1
+                yield error_record
+                continue
+            if position in rejected:
+                self.error_count += 1
+                yield {'line': line_number, 'error': 'Invalid task data', 'message': rejected[position]}
+            else:
+                scored_task = next(scored)
+                self._offer(scored_task)
+                yield scored_task
+            position += 1
+
+    def _offer(self, scored_task: Dict):
+        """Keep the task if it is among the top-N seen so far."""
+        self.count += 1
+        if not self.top:
+            return
+        # Earlier tasks win ties, so the sequence number is negated.
+        entry = (
+            scored_task['priority_score'],
+            -self.count,
+            {
+                'id': scored_task.get('id'),
+                'title': scored_task.get('title'),
+                'priority_score': scored_task['priority_score']
+            }
+        )
+        if len(self._leaders) < self.top:
+            heapq.heappush(self._leaders, entry)
+        elif entry[:2] > self._leaders[0][:2]:
+            heapq.heapreplace(self._leaders, entry)
+
+    def summary(self) -> Dict:
+        """Trailing summary: counts and the ranked top-N tasks."""
+        ranked = sorted(self._leaders, key=lambda entry: (-entry[0], -entry[1]))
+        return {
+            'count': self.count,
+            'errors': self.error_count,
+            'top': [entry[2] for entry in ranked]
+        }
+
+    def run(self, records: Iterable) -> Iterator[Dict]:
+        """
+        Score parsed records (see iter_records) lazily.
+
+        Yields:
+            Output records in input order, then the summary if top is set
+        """
+        chunk = []
+        for item in self._tasks(records):
+            chunk.append(item)
+            if len(chunk) >= self.chunk_size:
+                yield from self._score_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield from self._score_chunk(chunk)
+        if self.top:
+            yield {'summary': self.summary()}
+
+
+def _json_default(value):
+    """Serialize dates the way the JSON API does (YYYY-MM-DD)."""
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_ndjson(records: Iterable[Dict], buffer_size: int = 65536) -> Iterator[bytes]:
+    """
+    Encode records as NDJSON, yielding buffers of about buffer_size bytes.
+
+    Grouping lines keeps per-write overhead low without holding more than
+    one buffer in memory.
+    """
+    buffer = []
+    size = 0
+    for record in records:
+        line = json.dumps(record, default=_json_default) + '\n'
+        buffer.append(line)
+        size += len(line)
+        if size >= buffer_size:
+            yield ''.join(buffer).encode('utf-8')
+            buffer = []
+            size = 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
@@ -1,9 +1,25 @@
 """
 Tests for task analyzer functionality.
 """
-from django.test import TestCase
+from django.db import OperationalError
+from django.test import TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
 from datetime import date, timedelta
-from .scoring import PriorityCalculator, WEIGHTS, DependencyValidator
+from unittest.mock import patch
+import json
+import numpy as np
+from .scoring import PriorityCalculator, WEIGHTS, DependencyValidator, WorkingDayCalendar, ScoreCache, ShardedScorer, TaskGraph
+from .calendars import calendar_registry, get_uk_holidays
+from .scheduling import CriticalPathAnalyzer, DailyPlanner
+from .sensitivity import WeightSweep, weight_grid
+from .whatif import WhatIfSimulator
+from .streaming import StreamAnalyzer
+from .models import DatasetVersion, HolidayCalendar, Job, Task
+from .jobs import claim_job, requeue_stale_jobs, run_job, work
+from .renderers import LazyList, StreamingJSONRenderer
+from .serializers import TaskCreateSerializer, TaskListSerializer
+from . import bulk, jobs, views
 
 
 class PriorityCalculatorTestCase(TestCase):
@@ -285,6 +301,1537 @@ class PriorityCalculatorTestCase(TestCase):
         with self.assertRaises(ValueError):
             self.calculator.analyze_tasks([incomplete_task])
 
+    
+    def test_batch_scores_match_per_task_path(self):
+        """Test that the batch engine reproduces calculate_priority_score exactly."""
+        today = date.today()
+        tasks = []
+        task_id = 1
+        for offset in (-40, -7, -1, 0, 1, 2, 3, 5, 9, 12, 20, 35, 60, 400):
+            for hours in (0.5, 1, 1.5, 3, 6.25, 12, 30):
+                tasks.append({
+                    'id': task_id,
+                    'title': f'Task {task_id}',
+                    'due_date': (today + timedelta(days=offset)).strftime('%Y-%m-%d'),
+                    'estimated_hours': hours,
+                    'importance': task_id % 10 + 1,
+                    'dependencies': [task_id - 1] * (task_id % 3) if task_id > 1 else []
+                })
+                task_id += 1
+        
+        counts = DependencyValidator.count_dependents(tasks)
+        analyzed = {task['id']: task for task in self.calculator.analyze_tasks(tasks)}
+        
+        for task in tasks:
+            expected = self.calculator.calculate_priority_score(task, counts[task['id']])
+            result = analyzed[task['id']]
+            self.assertEqual(result['priority_score'], expected['priority_score'])
+            self.assertEqual(result['score_breakdown'], expected['score_breakdown'])
+            self.assertEqual(result['metadata'], expected['metadata'])
+    
+    def test_top_tasks_matches_full_sort(self):
+        """Test that top-k selection equals the head of the full ranking, ties included."""
+        today = date.today()
+        tasks = [
+            {
+                'id': i,
+                'title': f'Task {i}',
+                'due_date': today + timedelta(days=i % 4),
+                'estimated_hours': 1 + i % 3,
+                'importance': 5 + i % 2,
+                'dependencies': []
+            }
+            for i in range(1, 60)
+        ]
+        
+        full = self.calculator.analyze_tasks(tasks)
+        for k in (1, 3, 7, 59, 100):
+            top = self.calculator.top_tasks(tasks, k=k)
+            self.assertEqual([t['id'] for t in top], [t['id'] for t in full[:k]])
+            self.assertEqual(top, full[:k])
+        
+        with self.assertRaises(ValueError):
+            self.calculator.top_tasks(tasks, k=0)
+    
+    def test_cached_calculator_is_shared_per_configuration(self):
+        """Test that calculators are reused per weight vector and evaluation date."""
+        weights = {'urgency': 0.25, 'importance': 0.25, 'effort': 0.25, 'dependencies': 0.25}
+        first = PriorityCalculator.cached(weights=weights)
+        self.assertIs(PriorityCalculator.cached(weights=dict(weights)), first)
+        self.assertIsNot(PriorityCalculator.cached(), first)
+        self.assertIsNot(
+            PriorityCalculator.cached(weights=weights, evaluation_date=date.today() + timedelta(days=1)),
+            first
+        )
+        with self.assertRaises(ValueError):
+            PriorityCalculator.cached(weights={'urgency': 2.0})
+    
+    def test_memoized_factors_match_fresh_calculator(self):
+        """Test that urgency memoized by an earlier batch gives the same scores."""
+        today = date.today()
+        tasks = [
+            {
+                'id': i,
+                'title': f'Task {i}',
+                'due_date': (today + timedelta(days=i % 25 - 5)).strftime('%Y-%m-%d'),
+                'estimated_hours': 0.5 * (i % 7 + 1),
+                'importance': i % 10 + 1,
+                'dependencies': []
+            }
+            for i in range(1, 200)
+        ]
+        
+        calculator = PriorityCalculator()
+        calculator.analyze_tasks(tasks[:50])
+        self.assertEqual(len(calculator._urgency_table), 25)
+        self.assertEqual(calculator.analyze_tasks(tasks), PriorityCalculator().analyze_tasks(tasks))
+    
+    def test_analyze_tasks_reports_invalid_values(self):
+        """Test that the batch engine reports every invalid task."""
+        tasks = [
+            {'id': 1, 'title': 'Bad date', 'due_date': '2025-13-45', 'estimated_hours': 2, 'importance': 5},
+            {'id': 2, 'title': 'Bad importance', 'due_date': '2025-01-01', 'estimated_hours': 2, 'importance': 42},
+        ]
+        
+        with self.assertRaises(ValueError) as ctx:
+            self.calculator.analyze_tasks(tasks)
+        self.assertIn('Failed to analyze 2 task(s)', str(ctx.exception))
+
+
+class WorkingDayCalendarTestCase(TestCase):
+    """Test cases for the prefix-sum working-day calendar."""
+    
+    def _brute_force_count(self, start, end):
+        holidays = set()
+        for year in range(start.year, end.year + 1):
+            holidays |= PriorityCalculator._get_us_holidays(year)
+        count = 0
+        current = start
+        while current <= end:
+            if current.weekday() < 5 and current not in holidays:
+                count += 1
+            current += timedelta(days=1)
+        return count
+    
+    def test_counts_holidays_across_multiple_years(self):
+        """Test that holidays of every intermediate year are excluded."""
+        calendar = WorkingDayCalendar(start_year=2024, end_year=2028)
+        start, end = date(2024, 3, 15), date(2027, 8, 2)
+        self.assertEqual(calendar.count_working_days(start, end), self._brute_force_count(start, end))
+    
+    def test_range_grows_on_demand(self):
+        """Test that dates outside the built range extend the index."""
+        calendar = WorkingDayCalendar(start_year=2025, end_year=2025)
+        start, end = date(2023, 12, 20), date(2031, 1, 10)
+        self.assertEqual(calendar.count_working_days(start, end), self._brute_force_count(start, end))
+        self.assertLessEqual(calendar.start_year, 2023)
+        self.assertGreaterEqual(calendar.end_year, 2031)
+    
+    def test_concurrent_growth_is_consistent(self):
+        """Test that threads growing a shared calendar in different directions get exact counts."""
+        from concurrent.futures import ThreadPoolExecutor
+        import time
+        
+        def slow_holidays(year):
+            time.sleep(0.001)  # widen the window between a rebuild's reads and its publication
+            return PriorityCalculator._get_us_holidays(year)
+        
+        calendar = WorkingDayCalendar(start_year=2025, end_year=2025, holiday_provider=slow_holidays)
+        ranges = [(date(2025 - i, 2, 1), date(2025 + i, 11, 30)) for i in range(1, 13)]
+        ranges += [(date(2025, 1, 1), date(2025 + i, 6, 30)) for i in range(1, 13)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            counts = list(executor.map(lambda bounds: calendar.count_working_days(*bounds), ranges))
+        self.assertEqual(counts, [self._brute_force_count(start, end) for start, end in ranges])
+    
+    def test_reversed_range_is_zero(self):
+        """Test that an end date before the start date counts zero days."""
+        calendar = WorkingDayCalendar()
+        self.assertEqual(calendar.count_working_days(date(2025, 5, 2), date(2025, 5, 1)), 0)
+        self.assertFalse(calendar.is_working_day(date(2025, 12, 25)))
+
+
+class CalendarRegistryTestCase(TestCase):
+    """Test cases for named holiday calendars."""
+    
+    def test_uk_bank_holidays(self):
+        """Test UK rules, including Easter and weekend substitutes."""
+        self.assertEqual(
+            sorted(get_uk_holidays(2025)),
+            [
+                date(2025, 1, 1), date(2025, 4, 18), date(2025, 4, 21), date(2025, 5, 5),
+                date(2025, 5, 26), date(2025, 8, 25), date(2025, 12, 25), date(2025, 12, 26)
+            ]
+        )
+        # Christmas 2021 fell on a Saturday: observed on the 27th and 28th.
+        holidays = get_uk_holidays(2021)
+        self.assertIn(date(2021, 12, 27), holidays)
+        self.assertIn(date(2021, 12, 28), holidays)
+    
+    def test_builtin_calendars_are_cached(self):
+        """Test that the registry compiles each calendar only once."""
+        self.assertIs(calendar_registry.get('uk'), calendar_registry.get('UK'))
+        self.assertIs(calendar_registry.get(None), calendar_registry.get('us'))
+        with self.assertRaises(KeyError):
+            calendar_registry.get('atlantis')
+    
+    def test_custom_calendar_invalidated_on_edit(self):
+        """Test that editing a custom calendar recompiles it."""
+        row = HolidayCalendar.objects.create(name='office', base_calendar='', holidays=['2025-06-02'])
+        calendar = calendar_registry.get('office')
+        self.assertFalse(calendar.is_working_day(date(2025, 6, 2)))
+        self.assertTrue(calendar.is_working_day(date(2025, 6, 3)))
+        
+        row.holidays = ['2025-06-03']
+        row.save()
+        calendar = calendar_registry.get('office')
+        self.assertTrue(calendar.is_working_day(date(2025, 6, 2)))
+        self.assertFalse(calendar.is_working_day(date(2025, 6, 3)))
+    
+    def test_analyze_endpoint_calendar_selector(self):
+        """Test that analyze accepts a calendar and rejects unknown ones."""
+        client = APIClient()
+        payload = {
+            'tasks': [{
+                'id': 1,
+                'title': 'Ship release',
+                'due_date': (date.today() + timedelta(days=10)).strftime('%Y-%m-%d'),
+                'estimated_hours': 3,
+                'importance': 7,
+                'dependencies': []
+            }],
+            'calendar': 'uk'
+        }
+        response = client.post('/api/tasks/analyze/', payload, format='json')
+        self.assertEqual(response.status_code, 200)
+        
+        payload['calendar'] = 'atlantis'
+        response = client.post('/api/tasks/analyze/', payload, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('uk', response.data['available'])
+        
+        for name in (5, ['uk'], {'name': 'uk'}):
+            payload['calendar'] = name
+            response = client.post('/api/tasks/analyze/', payload, format='json')
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data['error'], 'Unknown calendar')
+
+
+class SuggestViewTestCase(TestCase):
+    """Test cases for the suggest endpoints."""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.payload = {
+            'tasks': [
+                {
+                    'id': i,
+                    'title': f'Task {i}',
+                    'due_date': (date.today() + timedelta(days=i)).strftime('%Y-%m-%d'),
+                    'estimated_hours': 2,
+                    'importance': 5,
+                    'dependencies': []
+                }
+                for i in range(1, 11)
+            ]
+        }
+    
+    def test_default_returns_three(self):
+        """Test that suggest returns three tasks by default."""
+        response = self.client.post('/api/tasks/suggest/', self.payload, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['suggestions']), 3)
+    
+    def test_k_parameter(self):
+        """Test that ?k= controls the number of suggestions and is validated."""
+        response = self.client.post('/api/tasks/suggest/?k=5', self.payload, format='json')
+        self.assertEqual([s['task']['id'] for s in response.data['suggestions']], [1, 2, 3, 4, 5])
+        
+        response = self.client.post('/api/tasks/suggest/?k=0', self.payload, format='json')
+        self.assertEqual(response.status_code, 400)
+
+
+class ScoreCacheTestCase(TestCase):
+    """Test cases for incremental rescoring."""
+    
+    def setUp(self):
+        self.calculator = PriorityCalculator()
+        self.tasks = [
+            {
+                'id': i,
+                'title': f'Task {i}',
+                'due_date': (date.today() + timedelta(days=i)).strftime('%Y-%m-%d'),
+                'estimated_hours': i,
+                'importance': i,
+                'dependencies': [i - 1] if i > 1 else []
+            }
+            for i in range(1, 6)
+        ]
+        self.versions = {task['id']: 1 for task in self.tasks}
+    
+    def test_unchanged_tasks_are_cache_hits(self):
+        """Test that a repeated analysis is served from the cache."""
+        cache = ScoreCache()
+        first = self.calculator.analyze_tasks(self.tasks, cache=cache, versions=self.versions)
+        second = self.calculator.analyze_tasks(self.tasks, cache=cache, versions=self.versions)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(first, self.calculator.analyze_tasks(self.tasks))
+        self.assertEqual(cache.stats()['misses'], 5)
+        self.assertEqual(cache.stats()['hits'], 5)
+    
+    def test_edits_and_dependent_changes_are_rescored(self):
+        """Test that only edited tasks and tasks whose dependents changed miss."""
+        cache = ScoreCache()
+        self.calculator.analyze_tasks(self.tasks, cache=cache, versions=self.versions)
+        cache.hits = cache.misses = 0
+        
+        self.tasks[4]['importance'] = 1
+        self.versions[5] = 2
+        self.tasks[2]['dependencies'] = [1]
+        self.versions[3] = 2
+        result = self.calculator.analyze_tasks(self.tasks, cache=cache, versions=self.versions)
+        
+        # Tasks 3 and 5 were edited; task 1 gained and task 2 lost a dependent.
+        self.assertEqual(cache.stats()['misses'], 4)
+        self.assertEqual(result, self.calculator.analyze_tasks(self.tasks))
+    
+    def test_weights_are_part_of_the_key(self):
+        """Test that a different weight vector does not reuse cached scores."""
+        cache = ScoreCache()
+        self.calculator.analyze_tasks(self.tasks, cache=cache, versions=self.versions)
+        other = PriorityCalculator(weights={'urgency': 0.1, 'importance': 0.7, 'effort': 0.1, 'dependencies': 0.1})
+        other.analyze_tasks(self.tasks, cache=cache, versions=self.versions)
+        self.assertEqual(cache.stats()['hits'], 0)
+    
+    def test_load_task_versions_matches_to_dict(self):
+        """Test that rows loaded without model instances equal Task.to_dict()."""
+        from .views import load_task_versions
+        for task in self.tasks:
+            Task.objects.create(
+                title=task['title'],
+                due_date=task['due_date'],
+                estimated_hours=task['estimated_hours'],
+                importance=task['importance'],
+                dependencies=[1, 2] if task['id'] == 3 else []
+            )
+        task_list, versions = load_task_versions(Task.objects.all())
+        stored = list(Task.objects.all())
+        self.assertEqual(task_list, [task.to_dict() for task in stored])
+        self.assertEqual(versions, {task.pk: task.updated_at for task in stored})
+    
+    def test_stored_endpoints_use_cache(self):
+        """Test that steady-state stored analysis is served from the cache."""
+        from .views import stored_score_cache
+        stored_score_cache.clear()
+        for task in self.tasks:
+            Task.objects.create(
+                title=task['title'],
+                due_date=task['due_date'],
+                estimated_hours=task['estimated_hours'],
+                importance=task['importance']
+            )
+        client = APIClient()
+        client.get('/api/tasks/analyze-stored/')
+        client.get('/api/tasks/eisenhower-matrix/')
+        response = client.get('/api/tasks/score-cache/')
+        self.assertEqual(response.data['misses'], 5)
+        self.assertEqual(response.data['hits'], 5)
+
+
+class ShardedScorerTestCase(TestCase):
+    """Test cases for multi-process sharded scoring."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.scorer = ShardedScorer(threshold=10, max_workers=3)
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.scorer.shutdown()
+        super().tearDownClass()
+    
+    def setUp(self):
+        today = date.today()
+        self.tasks = [
+            {
+                'id': i,
+                'title': f'Task {i}',
+                'due_date': (today + timedelta(days=i % 9 - 3)).strftime('%Y-%m-%d'),
+                'estimated_hours': 1 + i % 4,
+                'importance': 1 + i % 5,
+                'dependencies': [i - 7] if i > 7 else []
+            }
+            for i in range(1, 101)
+        ]
+    
+    def test_sharded_results_match_serial(self):
+        """Test that sharded analysis and top-k equal the serial path, ties included."""
+        calculator = PriorityCalculator(dependency_mode='transitive_count')
+        serial = calculator.analyze_tasks(self.tasks)
+        self.assertEqual(calculator.analyze_tasks(self.tasks, scorer=self.scorer), serial)
+        self.assertEqual(calculator.top_tasks(self.tasks, k=15, scorer=self.scorer), serial[:15])
+    
+    def test_custom_calendar_is_sent_to_workers(self):
+        """Test that database calendars can be used by worker processes."""
+        HolidayCalendar.objects.create(
+            name='shard-office',
+            base_calendar='uk',
+            holidays=[(date.today() + timedelta(days=d)).strftime('%Y-%m-%d') for d in range(1, 4)]
+        )
+        calculator = PriorityCalculator(calendar=calendar_registry.get('shard-office'))
+        self.assertEqual(calculator.analyze_tasks(self.tasks, scorer=self.scorer), calculator.analyze_tasks(self.tasks))
+    
+    def test_invalid_tasks_are_reported_across_shards(self):
+        """Test that errors from every shard are reported like the serial path."""
+        self.tasks[5]['importance'] = 42
+        self.tasks[90]['due_date'] = 'not-a-date'
+        calculator = PriorityCalculator()
+        with self.assertRaises(ValueError) as serial:
+            calculator.analyze_tasks(self.tasks)
+        with self.assertRaises(ValueError) as sharded:
+            calculator.analyze_tasks(self.tasks, scorer=self.scorer)
+        self.assertEqual(str(sharded.exception), str(serial.exception))
+        self.assertIn('Failed to analyze 2 task(s)', str(sharded.exception))
+    
+    def test_small_lists_stay_serial(self):
+        """Test that lists below the threshold do not start the pool."""
+        scorer = ShardedScorer(threshold=1000, max_workers=4)
+        PriorityCalculator().analyze_tasks(self.tasks, scorer=scorer)
+        self.assertIsNone(scorer._executor)
+
+    def test_views_score_in_process_by_default(self):
+        """Test that the views' scorer does not shard unless workers are configured."""
+        self.assertEqual(views.sharded_scorer.max_workers, 1)
+        self.assertFalse(views.sharded_scorer.applies_to([{}] * 100000))
+
+
+class AnalyzeStreamViewTestCase(TestCase):
+    """Test cases for the streaming NDJSON analyze endpoint."""
+    
+    def setUp(self):
+        today = date.today()
+        self.tasks = [
+            {
+                'id': i,
+                'title': f'Task {i}',
+                'due_date': (today + timedelta(days=i % 6 - 1)).strftime('%Y-%m-%d'),
+                'estimated_hours': 1 + i % 3,
+                'importance': 1 + i % 10,
+                'dependencies': [i - 1] if i % 4 and i > 1 else []
+            }
+            for i in range(1, 41)
+        ]
+        self.client = APIClient()
+    
+    def _stream(self, lines):
+        body = '\n'.join(json.dumps(line) if not isinstance(line, str) else line for line in lines)
+        response = self.client.post('/api/tasks/analyze/stream/', body, content_type='application/x-ndjson')
+        if not response.streaming:
+            return response, []
+        return response, [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+    
+    def test_stream_matches_batch_analysis(self):
+        """Test that streamed scores and the top-N summary match analyze_tasks."""
+        response, records = self._stream([{'options': {'top': 5}}] + self.tasks)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        
+        expected = PriorityCalculator().analyze_tasks(self.tasks)
+        by_id = {task['id']: task for task in expected}
+        self.assertEqual([r['id'] for r in records[:-1]], [t['id'] for t in self.tasks])
+        for record in records[:-1]:
+            self.assertEqual(record['priority_score'], by_id[record['id']]['priority_score'])
+            self.assertEqual(record['score_breakdown'], by_id[record['id']]['score_breakdown'])
+        
+        summary = records[-1]['summary']
+        self.assertEqual(summary['count'], 40)
+        self.assertEqual([t['id'] for t in summary['top']], [t['id'] for t in expected[:5]])
+    
+    def test_invalid_lines_are_reported_in_place(self):
+        """Test that bad lines become error records without stopping the stream."""
+        lines = [self.tasks[0], 'not json', {'id': 2, 'title': 'No date'}, self.tasks[2]]
+        response, records = self._stream(lines)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(records[0]['id'], 1)
+        self.assertEqual(records[1]['line'], 2)
+        self.assertIn('Invalid JSON', records[1]['error'])
+        self.assertEqual(records[2]['line'], 3)
+        self.assertIn('due_date', records[2]['details'])
+        self.assertEqual(records[3]['id'], 3)
+    
+    def test_unparseable_rows_are_not_scored(self):
+        """Test that only the rows that parsed reach score_batch when a chunk has rejects."""
+        records = [(1, self.tasks[0], None), (2, dict(self.tasks[1], due_date='someday'), None), (3, self.tasks[2], None)]
+        calculator = PriorityCalculator()
+        score_batch = calculator.score_batch
+        batch_sizes = []
+        
+        def scored(batch):
+            batch_sizes.append(len(batch))
+            return score_batch(batch)
+        
+        with patch.object(calculator, 'score_batch', side_effect=scored):
+            output = list(StreamAnalyzer(calculator, dependent_counts={}).run(records))
+        self.assertEqual(batch_sizes, [2])
+        self.assertEqual([record.get('id') for record in output], [1, None, 3])
+        self.assertEqual(output[1]['line'], 2)
+        self.assertEqual(
+            output[2]['priority_score'],
+            calculator.calculate_priority_score(self.tasks[2], 0)['priority_score']
+        )
+    
+    def test_client_supplied_dependent_counts(self):
+        """Test that per-task dependent counts are used without a first pass."""
+        task = dict(self.tasks[4], dependencies=[], dependent_count=3)
+        _, records = self._stream([{'options': {'dependent_counts': 'per_task'}}, task])
+        expected = PriorityCalculator().calculate_priority_score(task, 3)
+        self.assertEqual(records[0]['priority_score'], expected['priority_score'])
+    
+    def test_invalid_options_are_rejected(self):
+        """Test that bad options fail before streaming starts."""
+        response, _ = self._stream([{'options': {'dependency_mode': 'transitive_count'}}] + self.tasks)
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/tasks/analyze/stream/', '', content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 400)
+
+
+class WeightSweepTestCase(TestCase):
+    """Test cases for weight-sweep sensitivity analysis."""
+    
+    def setUp(self):
+        today = date.today()
+        self.tasks = [
+            {
+                'id': i,
+                'title': f'Task {i}',
+                'due_date': (today + timedelta(days=(i * 7) % 23 - 3)).strftime('%Y-%m-%d'),
+                'estimated_hours': 0.5 + (i * 5) % 11,
+                'importance': 1 + (i * 3) % 10,
+                'dependencies': [i - 2] if i > 2 and i % 3 == 0 else []
+            }
+            for i in range(1, 61)
+        ]
+    
+    def _rescaled(self, weights, factor, value):
+        """Move one weight, keeping the others' proportions."""
+        rest = 1.0 - weights[factor]
+        return {
+            key: value if key == factor else weight * (1.0 - value) / rest
+            for key, weight in weights.items()
+        }
+    
+    def test_sweep_matches_analyze_per_vector(self):
+        """Test that every vector's top-k equals analyze_tasks with those weights."""
+        vectors = weight_grid(0.25)
+        result = WeightSweep(PriorityCalculator(), k=5).run(self.tasks, vectors)
+        
+        self.assertEqual(len(result['vectors']), len(vectors))
+        for entry in result['vectors']:
+            expected = PriorityCalculator(weights=entry['weights']).analyze_tasks(self.tasks)[:5]
+            self.assertEqual(
+                [(t['id'], t['priority_score']) for t in entry['top']],
+                [(t['id'], t['priority_score']) for t in expected]
+            )
+        
+        correlation = result['rank_correlation']
+        self.assertEqual(len(correlation), len(vectors))
+        for i in range(len(vectors)):
+            self.assertAlmostEqual(correlation[i][i], 1.0)
+            for j in range(len(vectors)):
+                self.assertAlmostEqual(correlation[i][j], correlation[j][i])
+        
+        # Same as the Pearson correlation of the full analyze_tasks rankings.
+        position = {task['id']: i for i, task in enumerate(self.tasks)}
+        ranks = np.empty((len(vectors), len(self.tasks)))
+        for row, vector in enumerate(vectors):
+            for rank, task in enumerate(PriorityCalculator(weights=vector).analyze_tasks(self.tasks)):
+                ranks[row, position[task['id']]] = rank
+        np.testing.assert_allclose(correlation, np.round(np.corrcoef(ranks), 4), atol=1e-4)
+    
+    def test_sweep_size_is_capped(self):
+        """Test that a sweep whose rank matrix exceeds MAX_SWEEP_RANK_CELLS is rejected."""
+        with patch('tasks.sensitivity.MAX_SWEEP_RANK_CELLS', len(self.tasks) * 2):
+            WeightSweep(PriorityCalculator()).run(self.tasks, weight_grid(0.5)[:2])
+            with self.assertRaisesRegex(ValueError, 'at most 2 vectors'):
+                WeightSweep(PriorityCalculator()).run(self.tasks, weight_grid(0.5)[:3])
+            response = APIClient().post(
+                '/api/tasks/weights/sweep/',
+                {'tasks': self.tasks, 'grid': {'step': 0.5}},
+                format='json'
+            )
+        self.assertEqual((response.status_code, response.data['error']), (400, 'Invalid sweep'))
+    
+    def test_stability_ranges_bound_top_three(self):
+        """Test that the top 3 hold inside each reported range and change past its ends."""
+        result = WeightSweep(PriorityCalculator()).run(self.tasks, [WEIGHTS])
+        stability = result['stability']
+        top = stability['top_tasks']
+        self.assertEqual(top, [t['id'] for t in PriorityCalculator().analyze_tasks(self.tasks)[:3]])
+        
+        def top_three(weights):
+            return [t['id'] for t in PriorityCalculator(weights=weights).analyze_tasks(self.tasks)[:3]]
+        
+        for factor, bounds in stability['ranges'].items():
+            self.assertLessEqual(bounds['min'], bounds['current'])
+            self.assertGreaterEqual(bounds['max'], bounds['current'])
+            inside = (bounds['min'] + bounds['max']) / 2
+            self.assertEqual(top_three(self._rescaled(WEIGHTS, factor, inside)), top)
+            if bounds['max'] < 0.98:
+                self.assertNotEqual(top_three(self._rescaled(WEIGHTS, factor, bounds['max'] + 0.02)), top)
+            if bounds['min'] > 0.02:
+                self.assertNotEqual(top_three(self._rescaled(WEIGHTS, factor, bounds['min'] - 0.02)), top)
+    
+    def test_sweep_endpoint(self):
+        """Test the sweep endpoint with a grid and its validation."""
+        client = APIClient()
+        response = client.post(
+            '/api/tasks/weights/sweep/',
+            {'tasks': self.tasks, 'grid': {'step': 0.5}, 'k': 2},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['vectors']), 10)
+        self.assertEqual(len(response.data['vectors'][0]['top']), 2)
+        
+        response = client.post(
+            '/api/tasks/weights/sweep/',
+            {'tasks': self.tasks, 'grid': {'step': 0.5}, 'vectors': [WEIGHTS]},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        
+        response = client.post(
+            '/api/tasks/weights/sweep/',
+            {'tasks': self.tasks, 'grid': {'step': 0.05}},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+    
+    def test_sweep_endpoint_reuses_serializer_graph(self):
+        """Test that the sweep scores with the graph the serializer built instead of building another."""
+        built = []
+        init = TaskGraph.__init__
+        
+        def counting_init(graph, *args, **kwargs):
+            built.append(graph)
+            init(graph, *args, **kwargs)
+        
+        with patch.object(TaskGraph, '__init__', counting_init):
+            response = APIClient().post(
+                '/api/tasks/weights/sweep/',
+                {'tasks': self.tasks, 'vectors': [WEIGHTS], 'dependency_mode': 'transitive_count'},
+                format='json'
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(built), 1)
+    
+    def test_grid_sums_to_one(self):
+        """Test that grid vectors sum to 1.0 and invalid or oversized grids are rejected up front."""
+        for step in (0.1, 0.125, 0.2):
+            for vector in weight_grid(step, {'urgency': (0.2, 0.6)}):
+                self.assertAlmostEqual(sum(vector.values()), 1.0, places=9)
+                self.assertGreaterEqual(vector['urgency'], 0.2)
+        with self.assertRaises(ValueError):
+            weight_grid(0.01)
+        
+        client = APIClient()
+        for step in (0.15, 0.3):
+            response = client.post(
+                '/api/tasks/weights/sweep/',
+                {'tasks': self.tasks, 'grid': {'step': step}},
+                format='json'
+            )
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('step', response.data['details']['grid'])
+
+
+class WhatIfSimulatorTestCase(TestCase):
+    """Test cases for what-if simulation."""
+    
+    def setUp(self):
+        today = date.today()
+        self.tasks = [
+            {
+                'id': i,
+                'title': f'Task {i}',
+                'due_date': (today + timedelta(days=(i * 5) % 17 - 2)).strftime('%Y-%m-%d'),
+                'estimated_hours': 1 + (i * 3) % 7,
+                'importance': 1 + (i * 7) % 10,
+                'dependencies': [i - 1] if i > 1 and i % 4 == 0 else []
+            }
+            for i in range(1, 31)
+        ]
+    
+    def _ranking(self, calculator, tasks):
+        """Map task ID to (rank, priority score) from analyze_tasks."""
+        return {
+            task['id']: (rank, task['priority_score'])
+            for rank, task in enumerate(calculator.analyze_tasks(tasks), 1)
+        }
+    
+    def test_scenarios_match_reanalysis(self):
+        """Test that each scenario ranks tasks exactly like analyzing the edited list."""
+        patches = [
+            {'id': 3, 'shift_days': 7},
+            {'id': 5, 'hours_scale': 0.5},
+            {'id': 9, 'importance': 10, 'dependencies': [2, 6]},
+            {'id': 12, 'dependencies': []},
+        ]
+        edited = [dict(task) for task in self.tasks]
+        edited[2]['due_date'] = (date.fromisoformat(edited[2]['due_date']) + timedelta(days=7)).strftime('%Y-%m-%d')
+        edited[4]['estimated_hours'] *= 0.5
+        edited[8].update(importance=10, dependencies=[2, 6])
+        edited[11]['dependencies'] = []
+        
+        for mode in ('direct', 'transitive_count', 'transitive_hours'):
+            calculator = PriorityCalculator(dependency_mode=mode)
+            result = WhatIfSimulator(calculator, self.tasks).simulate(patches, limit=100, top=30)
+            
+            baseline = self._ranking(calculator, self.tasks)
+            expected = self._ranking(calculator, edited)
+            changed = {task_id for task_id in expected if expected[task_id] != baseline[task_id]}
+            self.assertEqual(result['top'], sorted(expected, key=expected.get))
+            self.assertEqual(result['changed_count'], len(changed))
+            self.assertEqual({change['id'] for change in result['changes']}, changed)
+            for change in result['changes']:
+                self.assertEqual((change['baseline_rank'], change['baseline_score']), baseline[change['id']])
+                self.assertEqual((change['rank'], change['priority_score']), expected[change['id']])
+    
+    def test_hours_patch_in_transitive_hours_mode(self):
+        """Test that changing a dependent's hours rescores the tasks it depends on."""
+        due = (date.today() + timedelta(days=10)).isoformat()
+        tasks = [
+            {'id': 1, 'title': 'Base', 'due_date': due, 'estimated_hours': 2, 'importance': 5, 'dependencies': []},
+            {'id': 2, 'title': 'Big', 'due_date': due, 'estimated_hours': 40, 'importance': 5, 'dependencies': [1]}
+        ]
+        calculator = PriorityCalculator(dependency_mode='transitive_hours')
+        result = WhatIfSimulator(calculator, tasks).simulate([{'id': 2, 'hours_scale': 0.1}])
+        
+        edited = [tasks[0], dict(tasks[1], estimated_hours=4.0)]
+        expected = self._ranking(calculator, edited)
+        self.assertEqual({change['id']: change['priority_score'] for change in result['changes']}, {
+            task_id: expected[task_id][1] for task_id in (1, 2)
+        })
+    
+    def test_invalid_scenarios_are_rejected(self):
+        """Test that unknown tasks and circular patches are reported with the scenario name."""
+        simulator = WhatIfSimulator(PriorityCalculator(), self.tasks)
+        with self.assertRaises(ValueError) as ctx:
+            simulator.run([{'name': 'Ghost', 'patches': [{'id': 999, 'importance': 5}]}])
+        self.assertIn('Ghost', str(ctx.exception))
+        with self.assertRaises(ValueError) as ctx:
+            simulator.run([{'patches': [{'id': 3, 'dependencies': [4]}]}])
+        self.assertIn('circular', str(ctx.exception))
+    
+    def test_what_if_endpoint_does_not_write(self):
+        """Test the endpoint against stored tasks leaves the database unchanged."""
+        for task in self.tasks[:10]:
+            Task.objects.create(
+                title=task['title'],
+                due_date=task['due_date'],
+                estimated_hours=task['estimated_hours'],
+                importance=task['importance']
+            )
+        target = Task.objects.order_by('pk').first()
+        client = APIClient()
+        response = client.post(
+            '/api/tasks/what-if/',
+            {'scenarios': [{'name': 'Slip', 'patches': [{'id': target.pk, 'shift_days': 30}]}]},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['scenarios'][0]['patched'], [target.pk])
+        self.assertEqual(Task.objects.get(pk=target.pk).due_date, target.due_date)
+        
+        response = client.post(
+            '/api/tasks/what-if/',
+            {'scenarios': [{'patches': [{'id': target.pk}]}]},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class DailyPlannerTestCase(TestCase):
+    """Test cases for the capacity-aware daily planner."""
+    
+    def setUp(self):
+        # Monday 2025-06-02, no holidays that week.
+        self.calculator = PriorityCalculator(
+            calendar=WorkingDayCalendar(start_year=2025, end_year=2026),
+            evaluation_date=date(2025, 6, 2)
+        )
+    
+    def _task(self, task_id, hours, due, importance=5, dependencies=()):
+        return {
+            'id': task_id,
+            'title': f'Task {task_id}',
+            'due_date': due,
+            'estimated_hours': hours,
+            'importance': importance,
+            'dependencies': list(dependencies)
+        }
+    
+    def test_packs_days_in_dependency_order(self):
+        """Test that a dependency goes first and a long task continues the next day."""
+        tasks = [
+            self._task(1, 4, '2025-06-30', importance=10, dependencies=[2]),
+            self._task(2, 6, '2025-06-30', importance=1)
+        ]
+        result = DailyPlanner(self.calculator, hours_per_day=8).plan(tasks)
+        
+        self.assertEqual([t['id'] for t in result['tasks']], [2, 1])
+        self.assertEqual(result['days'][0]['tasks'], [
+            {'id': 2, 'title': 'Task 2', 'hours': 6.0},
+            {'id': 1, 'title': 'Task 1', 'hours': 2.0}
+        ])
+        self.assertEqual(result['days'][1]['date'], '2025-06-03')
+        self.assertEqual(result['days'][1]['hours'], 2.0)
+        self.assertEqual(result['tasks'][1]['finish_date'], '2025-06-03')
+        self.assertEqual(result['summary']['working_days'], 2)
+        self.assertEqual(result['late'], [])
+    
+    def test_reports_missed_due_dates(self):
+        """Test that tasks finishing after their due date are listed as late."""
+        tasks = [
+            self._task(1, 16, '2025-06-02'),
+            self._task(2, 2, '2025-06-30')
+        ]
+        result = DailyPlanner(self.calculator, hours_per_day=8).plan(tasks, days=1)
+        
+        self.assertEqual(len(result['days']), 1)
+        self.assertEqual(result['late'], [{
+            'id': 1,
+            'title': 'Task 1',
+            'due_date': '2025-06-02',
+            'finish_date': '2025-06-03',
+            'days_late': 1
+        }])
+        self.assertEqual(result['summary']['late_count'], 1)
+    
+    def test_local_search_reduces_lateness_and_keeps_dependencies(self):
+        """Test that local search never increases lateness or breaks dependency order."""
+        tasks = [
+            self._task(
+                i,
+                1 + (i * 7) % 11,
+                (date(2025, 6, 2) + timedelta(days=(i * 13) % 40)).isoformat(),
+                importance=1 + (i * 3) % 10,
+                dependencies=[i - 5] if i > 5 and i % 4 == 0 else []
+            )
+            for i in range(1, 81)
+        ]
+        planner = DailyPlanner(self.calculator, hours_per_day=6)
+        baseline = planner.plan(tasks)
+        improved = planner.plan(tasks, local_search=True)
+        
+        self.assertGreater(improved['summary']['local_search']['swaps'], 0)
+        self.assertLess(improved['summary']['weighted_lateness'], baseline['summary']['weighted_lateness'])
+        position = {t['id']: t['position'] for t in improved['tasks']}
+        for task in tasks:
+            for dep_id in task['dependencies']:
+                self.assertLess(position[dep_id], position[task['id']])
+    
+    def test_endpoint_plans_request_tasks(self):
+        """Test the plan endpoint with options in the request body."""
+        payload = {
+            'tasks': [
+                self._task(1, 3, '2030-01-10'),
+                self._task(2, 3, '2030-01-10', dependencies=[1])
+            ],
+            'hours_per_day': 4,
+            'days': 1
+        }
+        response = APIClient().post('/api/tasks/plan/', payload, format='json')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['hours_per_day'], 4.0)
+        self.assertEqual(response.data['days'][0]['hours'], 4.0)
+        self.assertEqual(response.data['summary']['total_hours'], 6.0)
+        
+        payload['hours_per_day'] = 0
+        response = APIClient().post('/api/tasks/plan/', payload, format='json')
+        self.assertEqual(response.status_code, 400)
+
+
+class DashboardViewTestCase(TestCase):
+    """Test cases for the single-pass dashboard endpoint."""
+    
+    def setUp(self):
+        self.client = APIClient()
+        today = date.today()
+        self.tasks = [
+            {
+                'id': i,
+                'title': f'Task {i}',
+                'due_date': (today + timedelta(days=(i * 5) % 17 - 3)).isoformat(),
+                'estimated_hours': 1 + i % 6,
+                'importance': 1 + (i * 7) % 10,
+                'dependencies': [i - 1] if i % 3 == 0 else []
+            }
+            for i in range(1, 13)
+        ]
+    
+    def test_matches_individual_endpoints(self):
+        """Test that every section equals the response of its own endpoint."""
+        payload = {'tasks': self.tasks}
+        dashboard = self.client.post('/api/tasks/dashboard/?k=4', payload, format='json')
+        
+        self.assertEqual(dashboard.status_code, 200)
+        self.assertEqual(dashboard.data['tasks'], self.client.post('/api/tasks/analyze/', payload, format='json').data['tasks'])
+        self.assertEqual(
+            dashboard.data['suggestions'],
+            self.client.post('/api/tasks/suggest/?k=4', payload, format='json').data['suggestions']
+        )
+        self.assertEqual(dashboard.data['graph'], self.client.post('/api/tasks/dependency-graph/', payload, format='json').data)
+        self.assertEqual(
+            dashboard.data['matrix'],
+            self.client.post('/api/tasks/eisenhower-matrix/', payload, format='json').data['matrix']
+        )
+    
+    def test_stored_tasks_and_cycles(self):
+        """Test the GET variant on stored tasks and that cycles are rejected."""
+        for task in self.tasks:
+            Task.objects.create(**task)
+        
+        response = self.client.get('/api/tasks/dashboard/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['tasks']), len(self.tasks))
+        self.assertEqual(len(response.data['suggestions']), 3)
+        self.assertFalse(response.data['graph']['hasCycle'])
+        
+        payload = {'tasks': self.tasks[:2]}
+        payload['tasks'][0] = dict(payload['tasks'][0], dependencies=[2])
+        payload['tasks'][1] = dict(payload['tasks'][1], dependencies=[1])
+        response = self.client.post('/api/tasks/dashboard/', payload, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['cycles'], [[1, 2, 1]])
+
+
+class ConditionalGetTestCase(TestCase):
+    """Test cases for ETags driven by the dataset version."""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.task = {'title': 'Task', 'due_date': '2030-01-10', 'estimated_hours': 2, 'importance': 5}
+        Task.objects.create(**self.task)
+    
+    def _etag(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response['ETag']
+    
+    def test_not_modified_without_scoring(self):
+        """Test that a matching If-None-Match gets a 304 without scoring."""
+        etag = self._etag('/api/tasks/analyze-stored/')
+        
+        with patch.object(PriorityCalculator, 'score_tasks', side_effect=AssertionError('scored')):
+            response = self.client.get('/api/tasks/analyze-stored/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        
+        weighted = '/api/tasks/analyze-stored/?weights={"urgency": 0.25, "importance": 0.25, "effort": 0.25, "dependencies": 0.25}'
+        self.assertNotEqual(self._etag(weighted), etag)
+    
+    def test_writes_change_the_etag(self):
+        """Test that single, bulk and clear writes and feedback all invalidate ETags."""
+        etags = [self._etag('/api/tasks/')]
+        
+        Task.objects.create(**self.task)
+        etags.append(self._etag('/api/tasks/'))
+        Task.objects.bulk_create([Task(**self.task)])
+        etags.append(self._etag('/api/tasks/'))
+        Task.objects.filter(importance=5).update(importance=6)
+        etags.append(self._etag('/api/tasks/'))
+        self.client.post('/api/tasks/feedback/', {'task_id': Task.objects.first().pk, 'was_helpful': True}, format='json')
+        etags.append(self._etag('/api/tasks/'))
+        self.client.delete('/api/tasks/clear/')
+        
+        response = self.client.get('/api/tasks/', HTTP_IF_NONE_MATCH=etags[-1])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(set(etags + [response['ETag']])), 6)
+    
+    def test_writes_without_rows_keep_the_version(self):
+        """Test that bulk writes matching no rows do not bump the version (and invalidate nothing)."""
+        version = DatasetVersion.current()
+        Task.objects.filter(importance=10).update(importance=1)
+        Task.objects.filter(importance=10).delete()
+        Task.objects.bulk_create([])
+        Task.objects.bulk_update([], ['importance'])
+        self.assertEqual(DatasetVersion.current(), version)
+        
+        Task.objects.filter(importance=5).update(importance=6)
+        self.assertEqual(DatasetVersion.current(), version + 1)
+
+
+class PaginationTestCase(TestCase):
+    """Test cases for keyset pagination and ranking snapshots."""
+    
+    def setUp(self):
+        self.client = APIClient()
+        for i in range(1, 8):
+            Task.objects.create(
+                title=f'Task {i}',
+                due_date=date.today() + timedelta(days=i),
+                estimated_hours=i,
+                importance=i
+            )
+    
+    def _pages(self, url, limit):
+        items, cursor = [], None
+        while True:
+            params = {'limit': limit}
+            if cursor:
+                params['cursor'] = cursor
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            items.append([task['id'] for task in response.data['tasks']])
+            cursor = response.data['next_cursor']
+            if cursor is None:
+                return items
+    
+    def test_keyset_pages_task_list(self):
+        """Test that pages follow (-created_at, -id) and ignore later inserts."""
+        # Identical timestamps must still page in a total order.
+        Task.objects.filter(pk__lte=4).update(created_at=Task.objects.get(pk=4).created_at)
+        expected = list(Task.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        
+        first = self.client.get('/api/tasks/', {'limit': 3})
+        self.assertEqual([task['id'] for task in first.data['tasks']], expected[:3])
+        Task.objects.create(title='Late', due_date=date.today(), estimated_hours=1, importance=1)
+        rest = self.client.get('/api/tasks/', {'limit': 10, 'cursor': first.data['next_cursor']})
+        self.assertEqual([task['id'] for task in rest.data['tasks']], expected[3:])
+        self.assertIsNone(rest.data['next_cursor'])
+        
+        self.assertEqual(sum(self._pages('/api/tasks/', 2), []), [Task.objects.latest('id').pk] + expected)
+        self.assertEqual(self.client.get('/api/tasks/', {'limit': 1001}).status_code, 400)
+        self.assertEqual(self.client.get('/api/tasks/', {'cursor': 'not-a-cursor'}).status_code, 400)
+    
+    def test_ranking_snapshot_pages(self):
+        """Test that later pages come from the snapshot, unchanged and unscored."""
+        expected = [task['id'] for task in self.client.get('/api/tasks/analyze-stored/', {'limit': 100}).data['tasks']]
+        first = self.client.get('/api/tasks/analyze-stored/', {'limit': 3})
+        self.assertEqual(first.data['total'], 7)
+        self.assertEqual([task['id'] for task in first.data['tasks']], expected[:3])
+        
+        Task.objects.filter(pk=expected[-1]).update(importance=10, due_date=date.today())
+        with patch.object(PriorityCalculator, 'score_tasks', side_effect=AssertionError('scored')):
+            second = self.client.get('/api/tasks/analyze-stored/', {'limit': 3, 'cursor': first.data['next_cursor']})
+            third = self.client.get('/api/tasks/analyze-stored/', {'limit': 3, 'cursor': second.data['next_cursor']})
+        self.assertEqual([task['id'] for task in second.data['tasks'] + third.data['tasks']], expected[3:])
+        self.assertIsNone(third.data['next_cursor'])
+        
+        with patch.object(views.ranking_snapshots, 'clock', return_value=10 ** 9):
+            response = self.client.get('/api/tasks/analyze-stored/', {'limit': 3, 'cursor': first.data['next_cursor']})
+        self.assertEqual(response.status_code, 410)
+    
+    def test_paged_first_page_is_not_revalidated(self):
+        """Test that a first page with a cursor is never a 304, so an expired cursor can be replaced."""
+        first = self.client.get('/api/tasks/analyze-stored/', {'limit': 3})
+        self.assertIsNotNone(first.data['next_cursor'])
+        self.assertFalse(first.has_header('ETag'))
+        
+        views.ranking_snapshots.clear()
+        expired = self.client.get('/api/tasks/analyze-stored/', {'limit': 3, 'cursor': first.data['next_cursor']})
+        self.assertEqual(expired.status_code, 410)
+        # '*' matches any ETag, including the one the page would have had.
+        again = self.client.get('/api/tasks/analyze-stored/', {'limit': 3}, HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(again.status_code, 200)
+        second = self.client.get('/api/tasks/analyze-stored/', {'limit': 3, 'cursor': again.data['next_cursor']})
+        self.assertEqual(second.status_code, 200)
+        
+        whole = self.client.get('/api/tasks/analyze-stored/', {'limit': 10})
+        self.assertIsNone(whole.data['next_cursor'])
+        self.assertEqual(
+            self.client.get('/api/tasks/analyze-stored/', {'limit': 10}, HTTP_IF_NONE_MATCH=whole['ETag']).status_code,
+            304
+        )
+
+
+class BulkCreateViewTestCase(TestCase):
+    """Test cases for transactional bulk task import."""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.rows = [
+            {'title': 'First', 'due_date': '2030-01-10', 'estimated_hours': 2, 'importance': 5},
+            {'title': 'Second', 'due_date': '2030-01-11', 'estimated_hours': 3, 'importance': 7, 'dependencies': [1]},
+            {'title': 'Broken', 'due_date': '10/01/2030', 'estimated_hours': 3, 'importance': 11},
+            'not a task'
+        ]
+    
+    def test_best_effort_stores_valid_rows(self):
+        """Test that valid rows are stored with IDs and invalid ones reported by index."""
+        response = self.client.post('/api/tasks/bulk/', {'tasks': self.rows}, format='json')
+        
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(
+            [task['id'] for task in response.data['tasks']],
+            list(Task.objects.order_by('id').values_list('id', flat=True))
+        )
+        self.assertEqual(response.data['tasks'][1]['dependencies'], [1])
+        self.assertEqual([error['index'] for error in response.data['errors']], [2, 3])
+        self.assertEqual(set(response.data['errors'][0]['details']), {'due_date', 'importance'})
+        self.assertEqual(response.data['failed'], 2)
+    
+    def test_all_or_nothing_stores_nothing_on_error(self):
+        """Test that one invalid row rejects the whole import."""
+        payload = {'tasks': self.rows[:3], 'mode': 'all_or_nothing'}
+        response = self.client.post('/api/tasks/bulk/', payload, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['created'], 0)
+        self.assertEqual(Task.objects.count(), 0)
+        
+        payload['tasks'] = self.rows[:2]
+        response = self.client.post('/api/tasks/bulk/', payload, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Task.objects.count(), 2)
+        
+        payload['mode'] = 'partial'
+        self.assertEqual(self.client.post('/api/tasks/bulk/', payload, format='json').status_code, 400)
+
+
+class TaskBatchViewTestCase(TestCase):
+    """Test cases for batched task updates and deletes."""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.ids = [
+            Task.objects.create(title=f'Task {i}', due_date='2030-01-10', estimated_hours=i, importance=i).pk
+            for i in range(1, 6)
+        ]
+    
+    def test_best_effort_batch(self):
+        """Test that valid items are applied and each item gets a result."""
+        views.stored_score_cache.clear()
+        self.client.get('/api/tasks/analyze-stored/')
+        version = DatasetVersion.current()
+        payload = {
+            'update': [
+                {'id': self.ids[0], 'importance': 9, 'title': '  Renamed  ', 'dependencies': [self.ids[2]]},
+                {'id': self.ids[1], 'importance': 11},
+                {'id': 999, 'importance': 2}
+            ],
+            'delete': [self.ids[4], self.ids[0]]
+        }
+        response = self.client.patch('/api/tasks/batch/', payload, format='json')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['updated'], response.data['deleted']), (1, 1))
+        self.assertEqual(
+            [(result['op'], result['status']) for result in response.data['results']],
+            [('update', 'updated'), ('update', 'error'), ('update', 'error'), ('delete', 'deleted'), ('delete', 'error')]
+        )
+        task = Task.objects.get(pk=self.ids[0])
+        self.assertEqual((task.title, task.importance, task.dependencies), ('Renamed', 9, [self.ids[2]]))
+        self.assertFalse(Task.objects.filter(pk=self.ids[4]).exists())
+        self.assertGreater(DatasetVersion.current(), version)
+        
+        # Only the updated task and its new dependency (one more dependent) are rescored.
+        views.stored_score_cache.hits = views.stored_score_cache.misses = 0
+        self.client.get('/api/tasks/analyze-stored/')
+        self.assertEqual(views.stored_score_cache.stats()['misses'], 2)
+    
+    def test_non_object_body_is_rejected(self):
+        """Test that a JSON array or scalar body gets a 400, not a 500."""
+        for body in ([{'id': self.ids[0], 'importance': 9}], 'update', 5):
+            response = self.client.patch('/api/tasks/batch/', body, format='json')
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('error', response.data)
+        self.assertEqual(Task.objects.get(pk=self.ids[0]).importance, 1)
+    
+    def test_all_or_nothing_batch(self):
+        """Test that one failing item leaves every task untouched."""
+        payload = {
+            'update': [{'id': self.ids[0], 'importance': 9}],
+            'delete': [self.ids[1], 999],
+            'mode': 'all_or_nothing'
+        }
+        response = self.client.patch('/api/tasks/batch/', payload, format='json')
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [result['status'] for result in response.data['results']],
+            ['skipped', 'skipped', 'error']
+        )
+        self.assertEqual(Task.objects.get(pk=self.ids[0]).importance, 1)
+        self.assertEqual(Task.objects.count(), 5)
+        self.assertEqual(self.client.patch('/api/tasks/batch/', {}, format='json').status_code, 400)
+
+
+class AsyncViewsTestCase(TestCase):
+    """Test cases for the async analysis endpoints."""
+    
+    def setUp(self):
+        self.tasks = [
+            {
+                'id': i,
+                'title': f'Task {i}',
+                'due_date': (date.today() + timedelta(days=i)).isoformat(),
+                'estimated_hours': i,
+                'importance': 11 - i,
+                'dependencies': [i - 1] if i > 1 else []
+            }
+            for i in range(1, 6)
+        ]
+    
+    async def test_submitted_tasks_match_sync_views(self):
+        """Test that async analyze and suggest return what the sync views return."""
+        payload = json.dumps({'tasks': self.tasks})
+        for path in ('analyze/', 'suggest/?k=2'):
+            sync = await self.async_client.post(f'/api/tasks/{path}', payload, content_type='application/json')
+            response = await self.async_client.post(f'/api/tasks/async/{path}', payload, content_type='application/json')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.content, sync.content)
+        
+        response = await self.async_client.post('/api/tasks/async/analyze/', '{"tasks": []}', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+    
+    async def test_streamed_results_are_encoded_on_the_executor(self):
+        """Test that a result above the streaming threshold comes back whole, as the sync view's."""
+        payload = json.dumps({'tasks': self.tasks})
+        with override_settings(TASK_STREAMING_RESPONSE_THRESHOLD=2):
+            sync = await self.async_client.post('/api/tasks/analyze/', payload, content_type='application/json')
+            response = await self.async_client.post('/api/tasks/async/analyze/', payload, content_type='application/json')
+        self.assertTrue(sync.streaming)
+        self.assertFalse(response.streaming)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], sync['Content-Type'])
+        self.assertEqual(response.content, b''.join(sync.streaming_content))
+    
+    async def test_stored_tasks_match_sync_views(self):
+        """Test the stored-task variants, including their ETags."""
+        response = await self.async_client.get('/api/tasks/async/suggest/')
+        self.assertEqual(response.status_code, 404)
+        for task in self.tasks:
+            await Task.objects.acreate(**{key: value for key, value in task.items() if key != 'id'})
+        
+        for path in ('analyze-stored/', 'suggest/?k=2'):
+            sync = await self.async_client.get(f'/api/tasks/{path}')
+            response = await self.async_client.get(f'/api/tasks/async/{path}')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.content, sync.content)
+            
+            not_modified = await self.async_client.get(f'/api/tasks/async/{path}', headers={'If-None-Match': response['ETag']})
+            self.assertEqual(not_modified.status_code, 304)
+
+
+class JobQueueTestCase(TestCase):
+    """Test cases for background jobs."""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.tasks = [
+            {
+                'id': i,
+                'title': f'Task {i}',
+                'due_date': (date.today() + timedelta(days=i)).isoformat(),
+                'estimated_hours': i,
+                'importance': 11 - i,
+                'dependencies': [i - 1] if i > 1 else []
+            }
+            for i in range(1, 4)
+        ]
+    
+    def test_jobs_return_endpoint_results(self):
+        """Test that a job's result is what its endpoint returns, errors included."""
+        analyze = self.client.post('/api/tasks/jobs/', {'kind': 'analyze', 'payload': {'tasks': self.tasks}}, format='json')
+        self.assertEqual(analyze.status_code, 202)
+        self.assertEqual(analyze.data['job']['status'], 'queued')
+        bulk = self.client.post(
+            '/api/tasks/jobs/',
+            {'kind': 'bulk_import', 'payload': {'tasks': [dict(task, dependencies=[]) for task in self.tasks]}},
+            format='json'
+        )
+        invalid = self.client.post('/api/tasks/jobs/', {'kind': 'analyze', 'payload': {'tasks': []}}, format='json')
+        self.assertEqual(self.client.post('/api/tasks/jobs/', {'kind': 'nope'}, format='json').status_code, 400)
+        
+        self.assertEqual(work(worker_id='test', stop_when_idle=True), 3)
+        
+        job = self.client.get(f"/api/tasks/jobs/{analyze.data['job']['id']}/").data
+        expected = self.client.post('/api/tasks/analyze/', {'tasks': self.tasks}, format='json')
+        self.assertEqual((job['status'], job['progress'], job['result_status']), ('succeeded', 1.0, 200))
+        self.assertEqual(job['result'], expected.json())
+        
+        job = self.client.get(f"/api/tasks/jobs/{bulk.data['job']['id']}/").data
+        self.assertEqual((job['status'], job['result']['created']), ('succeeded', 3))
+        self.assertEqual(Task.objects.count(), 3)
+        
+        job = self.client.get(f"/api/tasks/jobs/{invalid.data['job']['id']}/").data
+        self.assertEqual((job['status'], job['result_status']), ('failed', 400))
+        self.assertIn('error', job)
+        
+        # Finished jobs can be deleted; expired ones are gone.
+        Job.objects.filter(pk=job['id']).update(expires_at=Job.objects.get(pk=job['id']).finished_at)
+        self.assertEqual(self.client.get(f"/api/tasks/jobs/{job['id']}/").status_code, 404)
+        self.assertEqual(self.client.delete(f"/api/tasks/jobs/{bulk.data['job']['id']}/").status_code, 200)
+        self.assertEqual(len(self.client.get('/api/tasks/jobs/').data['jobs']), 2)
+    
+    def test_stale_jobs_are_requeued(self):
+        """Test claiming, and recovery of jobs whose worker stopped responding."""
+        job_id = self.client.post('/api/tasks/jobs/', {'kind': 'dashboard'}, format='json').data['job']['id']
+        self.assertEqual(claim_job('first').pk, job_id)
+        self.assertIsNone(claim_job('second'))
+        self.assertEqual(self.client.delete(f'/api/tasks/jobs/{job_id}/').status_code, 409)
+        
+        self.assertEqual(requeue_stale_jobs(stale_after=60), 0)
+        Job.objects.filter(pk=job_id).update(heartbeat_at=Job.objects.get(pk=job_id).heartbeat_at - timedelta(minutes=5))
+        self.assertEqual(requeue_stale_jobs(stale_after=60, max_attempts=2), 1)
+        job = claim_job('second')
+        self.assertEqual((job.pk, job.worker, job.attempts), (job_id, 'second', 2))
+        
+        Job.objects.filter(pk=job_id).update(heartbeat_at=job.heartbeat_at - timedelta(minutes=5))
+        requeue_stale_jobs(stale_after=60, max_attempts=2)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.error), ('failed', 'Worker stopped responding'))
+    
+    def test_requeued_job_is_not_overwritten(self):
+        """Test that a worker whose job was reclaimed meanwhile does not store its outcome."""
+        job_id = self.client.post('/api/tasks/jobs/', {'kind': 'analyze', 'payload': {'tasks': self.tasks}}, format='json').data['job']['id']
+        stalled = claim_job('first')
+        Job.objects.filter(pk=job_id).update(heartbeat_at=stalled.heartbeat_at - timedelta(minutes=5))
+        requeue_stale_jobs(stale_after=60)
+        self.assertEqual(claim_job('second').pk, job_id)
+        
+        job = run_job(stalled)
+        self.assertEqual((job.status, job.worker, job.result), ('running', 'second', None))
+    
+    def test_worker_survives_database_errors(self):
+        """Test that an OperationalError while polling is retried instead of killing the worker."""
+        self.client.post('/api/tasks/jobs/', {'kind': 'analyze', 'payload': {'tasks': self.tasks}}, format='json')
+        with patch('tasks.jobs.purge_expired_jobs', side_effect=[OperationalError('database is locked'), 0, 0]), \
+                self.assertLogs('tasks.jobs', 'ERROR'):
+            self.assertEqual(work(worker_id='test', poll_interval=0, stop_when_idle=True), 1)
+        self.assertEqual(Job.objects.get().status, Job.SUCCEEDED)
+    
+    def test_requeued_import_is_not_stored_twice(self):
+        """Test that an import requeued after committing returns its result instead of importing again."""
+        payload = {'tasks': [dict(task, dependencies=[]) for task in self.tasks]}
+        job_id = self.client.post('/api/tasks/jobs/', {'kind': 'bulk_import', 'payload': payload}, format='json').data['job']['id']
+        stalled = claim_job('first')
+        # The import commits, then the worker stalls before finishing the job.
+        data, _ = jobs._bulk_import(stalled, jobs.JobProgress(job_id))
+        Job.objects.filter(pk=job_id).update(heartbeat_at=stalled.heartbeat_at - timedelta(minutes=5))
+        requeue_stale_jobs(stale_after=60)
+        
+        job = run_job(claim_job('second'))
+        self.assertEqual((job.status, job.result), (Job.SUCCEEDED, data))
+        self.assertEqual(Task.objects.count(), 3)
+        
+        # A worker that lost its claim before committing rolls its import back.
+        job_id = self.client.post('/api/tasks/jobs/', {'kind': 'bulk_import', 'payload': payload}, format='json').data['job']['id']
+        stalled = claim_job('first')
+        Job.objects.filter(pk=job_id).update(heartbeat_at=stalled.heartbeat_at - timedelta(minutes=5))
+        requeue_stale_jobs(stale_after=60)
+        claim_job('second')
+        run_job(stalled)
+        self.assertEqual(Task.objects.count(), 3)
+    
+    @patch('tasks.jobs.FINISH_RETRY_DELAY', 0)
+    def test_locked_finish_is_retried_then_left_for_requeue(self):
+        """Test that storing a job's outcome survives a locked database."""
+        claimed = jobs._claimed
+        failures = []
+        
+        def locked(times):
+            def claimed_or_locked(job_id, worker=None):
+                if len(failures) < times:
+                    failures.append(job_id)
+                    raise OperationalError('database is locked')
+                return claimed(job_id, worker)
+            return claimed_or_locked
+        
+        self.client.post('/api/tasks/jobs/', {'kind': 'analyze', 'payload': {'tasks': self.tasks}}, format='json')
+        with patch('tasks.jobs._claimed', side_effect=locked(1)):
+            job = run_job(claim_job('test'))
+        self.assertEqual((job.status, Job.objects.get(pk=job.pk).status), (Job.SUCCEEDED, Job.SUCCEEDED))
+        
+        failures.clear()
+        self.client.post('/api/tasks/jobs/', {'kind': 'analyze', 'payload': {'tasks': self.tasks}}, format='json')
+        with patch('tasks.jobs._claimed', side_effect=locked(jobs.FINISH_ATTEMPTS)), \
+                self.assertLogs('tasks.jobs', 'ERROR'):
+            job = run_job(claim_job('test'))
+        self.assertEqual(Job.objects.get(pk=job.pk).status, Job.RUNNING)
+
+
+class StreamingRendererTestCase(TestCase):
+    """Test cases for streamed JSON responses."""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.tasks = [
+            {
+                'id': i,
+                'title': f'Task {i} \u2028 \u00e9',
+                'due_date': (date.today() + timedelta(days=i)).isoformat(),
+                'estimated_hours': i,
+                'importance': 1 + i % 10,
+                'dependencies': [i - 1] if i > 1 else []
+            }
+            for i in range(1, 41)
+        ]
+    
+    def test_renderer_matches_json_renderer(self):
+        """Test that chunked output is byte-identical and lazy lists are built a page at a time."""
+        pages = []
+        
+        def page(offset, size):
+            pages.append((offset, size))
+            return [{'n': n, 'day': date(2030, 1, 1), 'score': n / 3} for n in range(offset, offset + size)]
+        
+        data = {'tasks': LazyList(25, page, page_size=10), 'nested': {'empty': [], 'text': 'a\u2029b', 1: 'x'}, 'count': 25}
+        renderer = StreamingJSONRenderer()
+        renderer.chunk_size = 64
+        chunks = list(renderer.iter_render(data))
+        
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(pages, [(0, 10), (10, 10), (20, 5)])
+        self.assertEqual(b''.join(chunks), JSONRenderer().render({**data, 'tasks': list(data['tasks'])}))
+        self.assertEqual(data['tasks'][3:5], page(3, 2))
+    
+    @override_settings(TASK_STREAMING_RESPONSE_THRESHOLD=10)
+    def test_large_responses_are_streamed(self):
+        """Test that views stream long lists (keeping headers) and render short ones as before."""
+        response = self.client.post('/api/tasks/analyze/', {'tasks': self.tasks}, format='json')
+        self.assertTrue(response.streaming)
+        streamed = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(streamed['tasks'], json.loads(json.dumps(PriorityCalculator().analyze_tasks(self.tasks), default=str)))
+        
+        small = self.client.post('/api/tasks/analyze/', {'tasks': self.tasks[:5]}, format='json')
+        self.assertFalse(small.streaming)
+        self.assertEqual(
+            [task['id'] for task in small.json()['tasks']],
+            [task['id'] for task in PriorityCalculator().analyze_tasks(self.tasks[:5])]
+        )
+        
+        for task in self.tasks:
+            Task.objects.create(**{key: value for key, value in task.items() if key not in ('id', 'dependencies')})
+        response = self.client.get('/api/tasks/dependency-graph/')
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(len(json.loads(b''.join(response.streaming_content))['nodes']), 40)
+        self.assertEqual(self.client.get('/api/tasks/dependency-graph/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+
+
+class FastValidationTestCase(TestCase):
+    """Test cases for the fast-path task validator."""
+    
+    def setUp(self):
+        self.tasks = [
+            {
+                'id': i,
+                'title': f'  Task {i}  ',
+                'due_date': (date.today() + timedelta(days=i)).isoformat(),
+                'estimated_hours': i if i % 2 else i / 4,
+                'importance': 1 + i % 10,
+                'dependencies': [i - 1] if i > 1 else [],
+                'extra': 'ignored'
+            }
+            for i in range(1, 21)
+        ]
+        # Valid but unusual rows take the serializer path.
+        self.tasks[3].update(id='4', importance=5.0, due_date='2030-1-5')
+        self.tasks[5].pop('dependencies')
+    
+    def validate(self, payload, threshold):
+        with override_settings(TASK_FAST_VALIDATION_THRESHOLD=threshold):
+            serializer = TaskListSerializer(data=payload)
+            if serializer.is_valid():
+                return [dict(task) for task in serializer.validated_data['tasks']], None
+            return None, json.loads(json.dumps(serializer.errors))
+    
+    def test_fast_path_matches_serializer(self):
+        """Test that valid payloads validate to the same data on both paths."""
+        fast, _ = self.validate({'tasks': self.tasks}, threshold=1)
+        self.assertEqual(fast, self.validate({'tasks': self.tasks}, threshold=10 ** 6)[0])
+        self.assertEqual(fast[0]['title'], 'Task 1')
+        self.assertNotIn('extra', fast[0])
+        
+        rows = [{key: value for key, value in task.items() if key != 'id'} for task in self.tasks]
+        rows[1]['importance'] = 0
+        valid, errors = bulk.validate_rows(rows)
+        self.assertEqual([index for index, _ in valid], [i for i in range(20) if i != 1])
+        self.assertEqual(valid[0][1], dict(TaskCreateSerializer().run_validation(rows[0])))
+        self.assertEqual(errors[0]['index'], 1)
+    
+    def test_errors_match_serializer(self):
+        """Test that invalid payloads get exactly the serializer's errors."""
+        invalid = [
+            dict(self.tasks[0], importance=11),
+            dict(self.tasks[0], dependencies=[1]),
+            dict(self.tasks[0], title='   '),
+            dict(self.tasks[0], due_date='2030-02-30'),
+            dict(self.tasks[1], id=1),
+            'not a task'
+        ]
+        for row in invalid:
+            payload = {'tasks': self.tasks[:1] + [row] + self.tasks[2:]}
+            fast = self.validate(payload, threshold=1)
+            self.assertIsNotNone(fast[1])
+            self.assertEqual(fast, self.validate(payload, threshold=10 ** 6))
+
+
+class CriticalPathAnalyzerTestCase(TestCase):
+    """Test cases for critical-path and deadline analysis."""
+    
+    def setUp(self):
+        # Monday 2025-06-02, no holidays that week.
+        self.analyzer = CriticalPathAnalyzer(
+            calendar=WorkingDayCalendar(start_year=2025, end_year=2026),
+            evaluation_date=date(2025, 6, 2)
+        )
+    
+    def _task(self, task_id, hours, due, dependencies=()):
+        return {
+            'id': task_id,
+            'title': f'Task {task_id}',
+            'due_date': due,
+            'estimated_hours': hours,
+            'importance': 5,
+            'dependencies': list(dependencies)
+        }
+    
+    def test_critical_path_and_slack(self):
+        """Test earliest times, float and the critical path on a small DAG."""
+        tasks = [
+            self._task(1, 8, '2025-06-30'),
+            self._task(2, 16, '2025-06-30', [1]),
+            self._task(3, 4, '2025-06-30', [1]),
+            self._task(4, 8, '2025-06-30', [2, 3])
+        ]
+        result = self.analyzer.analyze(tasks)
+        schedule = {t['id']: t for t in result['tasks']}
+        
+        self.assertEqual(result['critical_path'], [1, 2, 4])
+        self.assertEqual(result['project_duration'], 4)
+        self.assertEqual(result['project_finish_date'], '2025-06-05')
+        self.assertEqual(schedule[4]['earliest_start'], 3)
+        self.assertEqual(schedule[3]['total_float'], 1.5)
+        self.assertTrue(schedule[2]['is_critical'])
+        self.assertFalse(schedule[3]['is_critical'])
+    
+    def test_upstream_chain_makes_deadline_infeasible(self):
+        """Test that a deadline broken only by upstream work is flagged."""
+        tasks = [
+            self._task(1, 24, '2025-06-30'),
+            self._task(2, 4, '2025-06-03', [1]),
+            self._task(3, 40, '2025-06-03')
+        ]
+        result = self.analyzer.analyze(tasks)
+        
+        self.assertEqual(result['infeasible'], [2])
+        self.assertEqual(sorted(result['late']), [2, 3])
+    
+    def test_endpoint_rejects_cycles(self):
+        """Test that the endpoint reports cycles instead of a schedule."""
+        payload = {'tasks': [
+            self._task(1, 2, '2025-06-30', [2]),
+            self._task(2, 2, '2025-06-30', [1])
+        ]}
+        response = APIClient().post('/api/tasks/critical-path/', payload, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['cycles'], [[1, 2, 1]])
+
 
 class DependencyValidatorTestCase(TestCase):
     """Test cases for dependency validation."""
@@ -311,6 +1858,84 @@ class DependencyValidatorTestCase(TestCase):
         has_cycle, _ = DependencyValidator.detect_circular_dependencies(tasks)
         self.assertFalse(has_cycle)
     
+    def test_find_every_cyclic_component(self):
+        """Test that all independent cycles are reported in one pass."""
+        tasks = [
+            {'id': 1, 'dependencies': [2]},
+            {'id': 2, 'dependencies': [1]},
+            {'id': 3, 'dependencies': [1]},
+            {'id': 4, 'dependencies': [5]},
+            {'id': 5, 'dependencies': [6]},
+            {'id': 6, 'dependencies': [4]}
+        ]
+        
+        components = DependencyValidator.find_cyclic_components(tasks)
+        self.assertEqual([c['tasks'] for c in components], [[1, 2], [4, 5, 6]])
+        self.assertEqual(components[0]['cycle'], [1, 2, 1])
+        self.assertEqual(components[1]['cycle'], [4, 5, 6, 4])
+    
+    def test_deep_chain_does_not_recurse(self):
+        """Test that very long chains are handled without recursion limits."""
+        n = 200000
+        tasks = [{'id': i, 'dependencies': [i + 1] if i < n else [1]} for i in range(1, n + 1)]
+        
+        components = DependencyValidator.find_cyclic_components(tasks)
+        self.assertEqual(len(components), 1)
+        self.assertEqual(len(components[0]['tasks']), n)
+        
+        tasks[-1]['dependencies'] = []
+        has_cycle, _ = DependencyValidator.detect_circular_dependencies(tasks)
+        self.assertFalse(has_cycle)
+    
+    def test_downstream_impact_chain_and_diamond(self):
+        """Test transitive impact on a chain and on shared descendants."""
+        chain = [{'id': i, 'dependencies': [i - 1] if i > 1 else []} for i in range(1, 41)]
+        impact = DependencyValidator.downstream_impact(chain)
+        self.assertEqual(impact[1], 39)
+        self.assertEqual(impact[40], 0)
+        
+        diamond = [
+            {'id': 1, 'dependencies': [], 'estimated_hours': 1},
+            {'id': 2, 'dependencies': [1], 'estimated_hours': 2},
+            {'id': 3, 'dependencies': [1], 'estimated_hours': 3},
+            {'id': 4, 'dependencies': [2, 3], 'estimated_hours': 4}
+        ]
+        self.assertEqual(DependencyValidator.downstream_impact(diamond)[1], 3)
+        self.assertEqual(DependencyValidator.downstream_impact(diamond, weight='hours')[1], 9)
+    
+    def test_downstream_impact_large_graph(self):
+        """Test that impact is computed in one linear pass on 100k tasks."""
+        n = 100000
+        tasks = [{'id': i, 'dependencies': [i // 2] if i > 1 else []} for i in range(1, n + 1)]
+        impact = DependencyValidator.downstream_impact(tasks)
+        self.assertEqual(impact[1], n - 1)
+    
+    def test_transitive_dependency_mode(self):
+        """Test that transitive mode rewards tasks blocking long chains."""
+        today = date.today().strftime('%Y-%m-%d')
+        chain = [
+            {'id': i, 'title': f'Task {i}', 'due_date': today, 'estimated_hours': 2,
+             'importance': 5, 'dependencies': [i - 1] if i > 1 else []}
+            for i in range(1, 41)
+        ]
+        direct = {t['id']: t for t in PriorityCalculator().analyze_tasks(chain)}
+        transitive = {
+            t['id']: t for t in PriorityCalculator(dependency_mode='transitive_count').analyze_tasks(chain)
+        }
+        self.assertEqual(direct[1]['score_breakdown']['dependency_raw'], 30)
+        self.assertEqual(transitive[1]['score_breakdown']['dependency_raw'], 100)
+        self.assertEqual(transitive[40]['score_breakdown']['dependency_raw'], 0)
+        
+        with self.assertRaises(ValueError):
+            PriorityCalculator(dependency_mode='sideways')
+        
+        # 39 tasks of 2h downstream: 78h is 10 task-equivalents at 8h, 39 at 2h.
+        self.assertEqual(PriorityCalculator(dependency_mode='transitive_hours').dependent_counts(chain)[1], 10)
+        hours = PriorityCalculator(dependency_mode='transitive_hours', impact_hours_per_task=2)
+        self.assertEqual(hours.dependent_counts(chain)[1], 39)
+        with self.assertRaises(ValueError):
+            PriorityCalculator(dependency_mode='transitive_hours', impact_hours_per_task=0)
+    
     def test_validate_missing_dependency(self):
         """Test validation catches missing dependencies."""
         tasks = [
@@ -331,5 +1956,57 @@ class DependencyValidatorTestCase(TestCase):
         counts = DependencyValidator.count_dependents(tasks)
         self.assertEqual(counts[1], 2) 
         self.assertEqual(counts[2], 0)  
+    
+    def test_task_graph_csr_layout(self):
+        """Test interning, forward/reverse CSR edges and recorded problems."""
+        tasks = [
+            {'id': 10, 'dependencies': []},
+            {'id': 20, 'dependencies': [10, 99]},
+            {'id': 30, 'dependencies': [10, 20, 30]},
+            {'id': 20, 'dependencies': []}
+        ]
+        graph = TaskGraph(tasks)
+        
+        self.assertEqual(graph.ids, [10, 20, 30])
+        self.assertEqual(graph.duplicate_ids, [20])
+        self.assertEqual(graph.invalid_references, [(20, 99), (30, 30)])
+        self.assertEqual(graph.dependency_offsets.tolist(), [0, 0, 1, 4])
+        self.assertEqual(graph.dependency_indices.tolist(), [0, 0, 1, 2])
+        self.assertEqual(graph.dependent_offsets.tolist(), [0, 2, 3, 4])
+        self.assertEqual(graph.dependent_indices.tolist(), [1, 2, 2, 2])
+        self.assertEqual(graph.dependent_counts().tolist(), [2, 1, 1])
+        self.assertEqual(graph.topological_order(), [0, 1])
+    
+    def test_shared_graph_gives_same_results(self):
+        """Test that consumers give the same answers with a prebuilt graph."""
+        tasks = [
+            {'id': i, 'estimated_hours': i, 'dependencies': [j for j in (i - 1, i - 3) if j > 0]}
+            for i in range(1, 30)
+        ]
+        tasks.append({'id': 30, 'estimated_hours': 1, 'dependencies': [31]})
+        tasks.append({'id': 31, 'estimated_hours': 1, 'dependencies': [30]})
+        graph = TaskGraph(tasks)
+        
+        self.assertEqual(DependencyValidator.count_dependents(tasks, graph), DependencyValidator.count_dependents(tasks))
+        self.assertEqual(
+            DependencyValidator.downstream_impact(tasks, 'hours', graph),
+            DependencyValidator.downstream_impact(tasks, 'hours')
+        )
+        self.assertEqual(
+            DependencyValidator.find_cyclic_components(tasks, graph),
+            [{'tasks': [30, 31], 'cycle': [30, 31, 30]}]
+        )
+        self.assertEqual(DependencyValidator.validate_dependencies(tasks, graph), (True, ""))
+    
+    def test_serializer_reports_duplicates_from_graph(self):
+        """Test that the task list serializer builds the graph and rejects duplicate IDs."""
+        task = {'title': 'T', 'due_date': '2030-01-01', 'estimated_hours': 1, 'importance': 5}
+        serializer = TaskListSerializer(data={'tasks': [dict(task, id=1), dict(task, id=2, dependencies=[1])]})
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.task_graph.ids, [1, 2])
+        
+        serializer = TaskListSerializer(data={'tasks': [dict(task, id=1), dict(task, id=1)]})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('Duplicate task IDs found: [1]', str(serializer.errors))
 
 
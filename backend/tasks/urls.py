@@ -4,19 +4,32 @@ URL routing for task analyzer API.
 from django.urls import path
 from .views import (
     AnalyzeTasksView,
+    AnalyzeTasksStreamView,
     SuggestTasksView,
     HealthCheckView,
     TaskListCreateView,
     TaskDetailView,
     TaskBulkCreateView,
+    TaskBatchView,
     TaskClearAllView,
     AnalyzeStoredTasksView,
     WeightConfigView,
+    WeightSweepView,
+    WhatIfView,
     DependencyGraphView,
     EisenhowerMatrixView,
     TaskFeedbackView,
-    LearningAdjustedSuggestView
+    LearningAdjustedSuggestView,
+    HolidayCalendarListView,
+    HolidayCalendarDetailView,
+    ScoreCacheView,
+    CriticalPathView,
+    DailyPlanView,
+    DashboardView,
+    JobListCreateView,
+    JobDetailView
 )
+from . import async_views
 
 urlpatterns = [
    
@@ -24,15 +37,30 @@ urlpatterns = [
     
     
     path('tasks/analyze/', AnalyzeTasksView.as_view(), name='analyze-tasks'),
+    path('tasks/analyze/stream/', AnalyzeTasksStreamView.as_view(), name='analyze-tasks-stream'),
     path('tasks/suggest/', SuggestTasksView.as_view(), name='suggest-tasks'),
+    path('tasks/async/analyze/', async_views.analyze_tasks, name='analyze-tasks-async'),
+    path('tasks/async/analyze-stored/', async_views.analyze_stored_tasks, name='analyze-stored-tasks-async'),
+    path('tasks/async/suggest/', async_views.suggest_tasks, name='suggest-tasks-async'),
     path('tasks/weights/', WeightConfigView.as_view(), name='weight-config'),
+    path('tasks/weights/sweep/', WeightSweepView.as_view(), name='weight-sweep'),
     path('tasks/bulk/', TaskBulkCreateView.as_view(), name='task-bulk-create'),
+    path('tasks/batch/', TaskBatchView.as_view(), name='task-batch'),
     path('tasks/clear/', TaskClearAllView.as_view(), name='task-clear-all'),
     path('tasks/analyze-stored/', AnalyzeStoredTasksView.as_view(), name='analyze-stored-tasks'),
+    path('tasks/dashboard/', DashboardView.as_view(), name='dashboard'),
     path('tasks/dependency-graph/', DependencyGraphView.as_view(), name='dependency-graph'),
     path('tasks/eisenhower-matrix/', EisenhowerMatrixView.as_view(), name='eisenhower-matrix'),
     path('tasks/feedback/', TaskFeedbackView.as_view(), name='task-feedback'),
     path('tasks/suggest-learning/', LearningAdjustedSuggestView.as_view(), name='suggest-learning'),
+    path('tasks/what-if/', WhatIfView.as_view(), name='what-if'),
+    path('tasks/critical-path/', CriticalPathView.as_view(), name='critical-path'),
+    path('tasks/plan/', DailyPlanView.as_view(), name='daily-plan'),
+    path('tasks/score-cache/', ScoreCacheView.as_view(), name='score-cache'),
+    path('tasks/jobs/', JobListCreateView.as_view(), name='job-list-create'),
+    path('tasks/jobs/<int:pk>/', JobDetailView.as_view(), name='job-detail'),
+    path('tasks/calendars/', HolidayCalendarListView.as_view(), name='calendar-list'),
+    path('tasks/calendars/<str:name>/', HolidayCalendarDetailView.as_view(), name='calendar-detail'),
     path('tasks/<int:pk>/', TaskDetailView.as_view(), name='task-detail'),
     
    
@@ -1,26 +1,401 @@
 """
 API views for task analysis and suggestions.
 """
+import hashlib
 import json
+import tempfile
+from datetime import date
+from itertools import chain
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.decorators import method_decorator
+from django.utils.http import quote_etag
+from django.views.decorators.http import condition
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.shortcuts import get_object_or_404
-from .models import Task, TaskFeedback
+from .models import Task, TaskFeedback, HolidayCalendar, DatasetVersion, Job
 from .serializers import (
+    TaskSerializer,
     TaskListSerializer,
     ScoredTaskSerializer,
     TaskSuggestionSerializer,
-    WeightConfigSerializer
+    WeightConfigSerializer,
+    WeightSweepSerializer,
+    DailyPlanSerializer,
+    WhatIfSerializer,
+    HolidayCalendarSerializer
 )
-from .scoring import PriorityCalculator, WEIGHTS, DependencyValidator
+from django.conf import settings
+from .scoring import (
+    PriorityCalculator, WEIGHTS, DependencyValidator, ScoreCache, ShardedScorer, TaskGraph, DEPENDENCY_MODES,
+    IMPACT_HOURS_PER_TASK
+)
+from .calendars import calendar_registry, BUILTIN_CALENDARS
+from .scheduling import CriticalPathAnalyzer, DailyPlanner, DEFAULT_HOURS_PER_DAY
+from .sensitivity import WeightSweep, weight_grid
+from .whatif import WhatIfSimulator
+from .streaming import StreamAnalyzer, iter_records, count_stream_dependents, encode_ndjson
+from .bulk import import_tasks, apply_task_mutations, BULK_MODES, BULK_CREATE_CHUNK_SIZE, DEFAULT_BULK_MODE
+from .jobs import submit_job
+from .renderers import LazyList, StreamingResponseMixin
+from .pagination import (
+    RankingSnapshotStore,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+    parse_page_size,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE
+)
+
+
+# Downstream hours counted as one blocked task by dependency_mode=transitive_hours.
+IMPACT_HOURS = getattr(settings, 'TASK_IMPACT_HOURS_PER_TASK', IMPACT_HOURS_PER_TASK)
+
+# Scores of stored tasks, reused across requests until a task is edited.
+stored_score_cache = ScoreCache(max_entries=getattr(settings, 'TASK_SCORE_CACHE_SIZE', 100000))
+
+# Worker pool for very large submitted task lists.
+sharded_scorer = ShardedScorer(
+    threshold=getattr(settings, 'TASK_PARALLEL_SCORING_THRESHOLD', 20000),
+    max_workers=getattr(settings, 'TASK_PARALLEL_SCORING_WORKERS', 1)
+)
+
+# Rankings of stored tasks that later pages of analyze-stored are served from.
+ranking_snapshots = RankingSnapshotStore(
+    ttl=getattr(settings, 'TASK_RANKING_SNAPSHOT_TTL', 300),
+    max_snapshots=getattr(settings, 'TASK_RANKING_SNAPSHOT_LIMIT', 32)
+)
+
+
+def dataset_etag(request, *args, **kwargs):
+    """
+    ETag for a read endpoint over stored data.
+    
+    Derived from the dataset version, the evaluation date (urgency changes
+    daily), the path and the query parameters (weights, calendar, k, ...),
+    so it costs one primary-key lookup and no scoring.
+    """
+    return dataset_etag_for_version(DatasetVersion.current(), request)
+
+
+def dataset_etag_for_version(version, request):
+    """ETag of a request at a given dataset version (see dataset_etag)."""
+    key = json.dumps([
+        version,
+        date.today().isoformat(),
+        request.path,
+        sorted(request.query_params.lists())
+    ])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+# Answers If-None-Match with 304 Not Modified before the view runs.
+conditional_get = method_decorator(condition(etag_func=dataset_etag))
+
+
+def single_page_etag(version, task_count, request, page_size):
+    """
+    ETag of an analyze-stored request, or None if it must not be revalidated.
+    
+    A ranking longer than one page hands out a cursor into a snapshot that
+    can expire while the dataset ETag still matches, and a 304 would leave
+    the client holding that cursor. Only a first page with the whole ranking
+    is revalidated; cursor pages never are.
+    """
+    if request.query_params.get('cursor') or task_count > page_size:
+        return None
+    return quote_etag(dataset_etag_for_version(version, request))
+
+
+def load_task_versions(tasks):
+    """
+    Convert stored tasks to dictionaries and collect their versions.
+    
+    Rows are read with values_list() instead of as model instances, so
+    large boards do not allocate a Task object per row.
+    
+    Returns:
+        Tuple of (task_list, versions) where versions maps task ID to updated_at
+    """
+    task_list = []
+    versions = {}
+    due_date_strings = {}
+    for row in tasks.values_list(*Task.DICT_FIELDS, 'updated_at').iterator(chunk_size=2000):
+        task_list.append(Task.row_to_dict(row, due_date_strings))
+        versions[row[0]] = row[-1]
+    return task_list, versions
+
+
+def circular_dependency_response(cyclic_components):
+    """Build the 400 response listing every circular dependency found."""
+    cycles = [component['cycle'] for component in cyclic_components]
+    return Response(
+        {
+            'error': 'Circular dependency detected',
+            'cycle': cycles[0],
+            'cycles': cycles,
+            'components': [component['tasks'] for component in cyclic_components],
+            'message': "Circular dependency found: " + "; ".join(
+                ' -> '.join(map(str, cycle)) for cycle in cycles
+            )
+        },
+        status=status.HTTP_400_BAD_REQUEST
+    )
+
+
+def resolve_page_size(request):
+    """
+    Read the page size from the optional 'limit' query parameter.
+    
+    Returns:
+        Tuple of (page_size, error_response); error_response is None on success
+    """
+    try:
+        page_size = parse_page_size(
+            request.query_params.get('limit'),
+            default=getattr(settings, 'TASK_PAGE_SIZE', DEFAULT_PAGE_SIZE),
+            maximum=getattr(settings, 'TASK_MAX_PAGE_SIZE', MAX_PAGE_SIZE)
+        )
+    except ValueError as e:
+        return None, Response(
+            {'error': 'Invalid page size', 'message': str(e)},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return page_size, None
+
+
+def invalid_cursor_response(message):
+    """Build the 400 response for a cursor that cannot be decoded."""
+    return Response(
+        {'error': 'Invalid cursor', 'message': message},
+        status=status.HTTP_400_BAD_REQUEST
+    )
+
+
+DEFAULT_SUGGESTION_COUNT = 3
+MAX_SUGGESTION_COUNT = 100
+
+
+def parse_suggestion_count(request):
+    """
+    Read the number of suggestions from the optional 'k' query parameter.
+    
+    Returns:
+        Tuple of (k, error_response); error_response is None on success
+    """
+    raw_k = request.query_params.get('k')
+    if raw_k is None or raw_k == '':
+        return DEFAULT_SUGGESTION_COUNT, None
+    try:
+        k = int(raw_k)
+    except (TypeError, ValueError):
+        k = 0
+    if not 1 <= k <= MAX_SUGGESTION_COUNT:
+        return None, Response(
+            {
+                'error': 'Invalid suggestion count',
+                'message': f"k must be an integer between 1 and {MAX_SUGGESTION_COUNT}, got: {raw_k}"
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return k, None
+
+
+def build_suggestions(calculator, top_tasks):
+    """Turn ranked tasks into suggestion entries with explanations."""
+    suggestions = []
+    for task in top_tasks:
+        explanation = calculator.generate_task_explanation(task)
+        task_dict = {
+            'id': task['id'],
+            'title': task['title'],
+            'due_date': task['due_date'].strftime('%Y-%m-%d') if hasattr(task['due_date'], 'strftime') else task['due_date'],
+            'priority_score': task['priority_score']
+        }
+        if 'metadata' in task:
+            task_dict['is_overdue'] = task['metadata'].get('is_overdue', False)
+            task_dict['days_overdue'] = task['metadata'].get('days_overdue', 0)
+        
+        suggestions.append({
+            'task': task_dict,
+            'reason': explanation
+        })
+    return suggestions
+
+
+def build_dependency_graph(tasks, cyclic_components=None, graph=None):
+    """
+    Build graph data structure for visualization.
+    
+    Args:
+        tasks: List of task dictionaries
+        cyclic_components: Result of find_cyclic_components, when the caller
+            has already computed it
+        graph: TaskGraph of tasks, if the caller already built it
+    """
+    if graph is None:
+        graph = TaskGraph(tasks)
+    if cyclic_components is None:
+        cyclic_components = DependencyValidator().find_cyclic_components(tasks, graph)
+    
+    component_of = {}
+    for component_index, component in enumerate(cyclic_components):
+        for task_id in component['tasks']:
+            component_of[task_id] = component_index
+
+    nodes = []
+    edges = []
+    
+    for task in tasks:
+        task_id = task.get('id')
+        if task_id is None:
+            continue
+        
+        component_index = component_of.get(task_id)
+        is_in_cycle = component_index is not None
+        
+        nodes.append({
+            'id': task_id,
+            'label': f"{task_id}: {task.get('title', 'Untitled')[:30]}",
+            'title': task.get('title', 'Untitled'),
+            'inCycle': is_in_cycle,
+            'cycleGroup': component_index,
+            'dependencies': task.get('dependencies', [])
+        })
+        
+
+        for dep_id in task.get('dependencies', []):
+            if dep_id in graph.index_of:
+                # Both ends in the same strongly connected component means
+                # the edge lies on a cycle.
+                edge_in_cycle = is_in_cycle and component_of.get(dep_id) == component_index
+                edges.append({
+                    'from': dep_id,
+                    'to': task_id,
+                    'arrows': 'to',
+                    'color': {'color': '#ef4444' if edge_in_cycle else '#64748b'},
+                    'inCycle': edge_in_cycle
+                })
+    
+    cycles = [component['cycle'] for component in cyclic_components]
+    return {
+        'nodes': nodes,
+        'edges': edges,
+        'hasCycle': bool(cycles),
+        'cyclePath': cycles[0] if cycles else [],
+        'cycles': cycles
+    }
+
+
+def categorize_eisenhower(urgency_score, importance_score):
+    """
+    Categorize task into Eisenhower Matrix quadrants.
+    
+    Quadrants:
+    - Q1 (Urgent & Important): High urgency + High importance
+    - Q2 (Not Urgent & Important): Low urgency + High importance
+    - Q3 (Urgent & Not Important): High urgency + Low importance
+    - Q4 (Not Urgent & Not Important): Low urgency + Low importance
+    """
+    is_urgent = urgency_score >= 50
+    is_important = importance_score >= 50
+    
+    if is_urgent and is_important:
+        quadrant = 'Q1'
+    elif not is_urgent and is_important:
+        quadrant = 'Q2' 
+    elif is_urgent and not is_important:
+        quadrant = 'Q3'  
+    else:
+        quadrant = 'Q4' 
+    
+    return {
+        'quadrant': quadrant,
+        'urgency_score': urgency_score,
+        'importance_score': importance_score
+    }
+
+
+def build_eisenhower_matrix(tasks, scores):
+    """
+    Sort tasks into Eisenhower quadrants.
+    
+    Args:
+        tasks: List of task dictionaries
+        scores: score_batch arrays for the tasks (raw urgency and importance are used)
+    """
+    matrix = {
+        'Q1': [], 
+        'Q2': [],  
+        'Q3': [],  
+        'Q4': []  
+    }
+    
+    urgency_scores = scores['urgency_raw'].tolist()
+    importance_scores = scores['importance_raw'].tolist()
+    
+    for task, urgency_score, importance_score in zip(tasks, urgency_scores, importance_scores):
+        category = categorize_eisenhower(urgency_score, importance_score)
+        quadrant = category['quadrant']
+        
+        matrix[quadrant].append({**task, **category})
+    
+    return matrix
+
+
+def resolve_dependency_mode(mode):
+    """
+    Validate the optional dependency mode selector.
+    
+    Returns:
+        Tuple of (mode, error_response); error_response is None on success
+    """
+    if not mode:
+        return 'direct', None
+    if mode not in DEPENDENCY_MODES:
+        return None, Response(
+            {
+                'error': 'Invalid dependency mode',
+                'message': f"dependency_mode must be one of {list(DEPENDENCY_MODES)}, got: {mode}"
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return mode, None
+
+
+def resolve_calendar(name):
+    """
+    Look up a working-day calendar by name.
+    
+    Returns:
+        Tuple of (calendar, error_response); error_response is None on success
+    """
+    try:
+        if name is not None and not isinstance(name, str):
+            raise KeyError(name)
+        return calendar_registry.get(name), None
+    except KeyError:
+        return None, Response(
+            {
+                'error': 'Unknown calendar',
+                'message': f"Calendar '{name}' does not exist",
+                'available': calendar_registry.names()
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
 
 
-class AnalyzeTasksView(APIView):
+class AnalyzeTasksView(StreamingResponseMixin, APIView):
     """
     POST /api/tasks/analyze/
     
     Analyzes a list of tasks and returns them sorted by priority score.
+    Large results are streamed: the ranked entries are built and encoded
+    a page at a time.
     """
     
     def post(self, request):
@@ -69,9 +444,10 @@ class AnalyzeTasksView(APIView):
         tasks = serializer.validated_data['tasks']
         
     
+        graph = serializer.task_graph
         validator = DependencyValidator()
     
-        is_valid, error_msg = validator.validate_dependencies(tasks)
+        is_valid, error_msg = validator.validate_dependencies(tasks, graph)
         if not is_valid:
             return Response(
                 {
@@ -81,16 +457,9 @@ class AnalyzeTasksView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        has_cycle, cycle_path = validator.detect_circular_dependencies(tasks)
-        if has_cycle:
-            return Response(
-                {
-                    'error': 'Circular dependency detected',
-                    'cycle': cycle_path,
-                    'message': f"Circular dependency found: {' -> '.join(map(str, cycle_path))}"
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        cyclic_components = validator.find_cyclic_components(tasks, graph)
+        if cyclic_components:
+            return circular_dependency_response(cyclic_components)
         
      
         custom_weights = request.data.get('weights')
@@ -108,9 +477,23 @@ class AnalyzeTasksView(APIView):
             weights = weight_serializer.validated_data
         
        
+        calendar, error_response = resolve_calendar(request.data.get('calendar'))
+        if error_response:
+            return error_response
+        
+        dependency_mode, error_response = resolve_dependency_mode(request.data.get('dependency_mode'))
+        if error_response:
+            return error_response
+        
         try:
-            calculator = PriorityCalculator(weights=weights)
-            scored_tasks = calculator.analyze_tasks(tasks)
+            calculator = PriorityCalculator.cached(weights=weights, calendar=calendar, dependency_mode=dependency_mode, impact_hours_per_task=IMPACT_HOURS)
+            scores, priority_scores, order = calculator.rank_tasks(tasks, scorer=sharded_scorer, graph=graph)
+            scored_tasks = LazyList(
+                len(order),
+                lambda offset, size: PriorityCalculator._materialize(
+                    tasks, scores, priority_scores, order[offset:offset + size]
+                )
+            )
             
             return Response(
                 {'tasks': scored_tasks},
@@ -134,19 +517,221 @@ class AnalyzeTasksView(APIView):
             )
 
 
+# Largest trailing top-N summary the streaming endpoint will keep.
+MAX_STREAM_TOP = 1000
+# Spooled first-pass copies of a feed stay in memory up to this size.
+STREAM_SPOOL_MEMORY = 16 * 1024 * 1024
+DEPENDENT_COUNT_SOURCES = ('first_pass', 'per_task')
+
+
+def validate_stream_task(record):
+    """
+    Validate one streamed task with TaskSerializer.
+    
+    Returns:
+        Tuple of (task, errors); errors is None for a valid task
+    """
+    serializer = TaskSerializer(data=record)
+    if not serializer.is_valid():
+        return None, serializer.errors
+    task = dict(serializer.validated_data)
+    if 'dependent_count' in record:
+        dependent_count = record['dependent_count']
+        if not isinstance(dependent_count, int) or isinstance(dependent_count, bool) or dependent_count < 0:
+            return None, {'dependent_count': [f"Must be a non-negative integer, got: {dependent_count}"]}
+        task['dependent_count'] = dependent_count
+    return task, None
+
+
+class AnalyzeTasksStreamView(APIView):
+    """
+    POST /api/tasks/analyze/stream/
+    
+    Streaming variant of /api/tasks/analyze/ for very large task feeds.
+    NDJSON in, NDJSON out: tasks are scored in chunks as they are read and
+    written back in input order, so neither the feed nor the result is held
+    in memory.
+    """
+    
+    def post(self, request):
+        """
+        Stream scored tasks.
+        
+        Request body (application/x-ndjson), one JSON object per line. The
+        first line may carry options:
+        {"options": {"weights": {...}, "calendar": "us", "top": 10, "dependent_counts": "first_pass"}}
+        {"id": 1, "title": "Fix login bug", "due_date": "2025-11-30", "estimated_hours": 3, "importance": 8, "dependencies": []}
+        ...
+        
+        dependent_counts selects where dependency counts come from:
+        - "first_pass" (default): the feed is spooled to a temporary file and read twice
+        - "per_task": each task's own "dependent_count" field (default 0); scoring starts immediately
+        - {"<task id>": count, ...}: counts computed by the client
+        
+        Returns (application/x-ndjson), one line per input task:
+        {...task fields..., "priority_score": 85.5, "score_breakdown": {...}, "metadata": {...}}
+        {"line": 7, "error": "Invalid task data", "details": {...}}
+        ...
+        {"summary": {"count": 99999, "errors": 1, "top": [{"id": 42, "title": "...", "priority_score": 97.1}, ...]}}
+        
+        The summary line is only sent when "top" is set. Dependencies are not
+        checked for cycles or missing tasks, which would need the whole graph.
+        """
+        stream = request.stream
+        lines = iter(stream) if stream is not None else iter(())
+        
+        line_number = 0
+        first_line = None
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                first_line = line
+                break
+        if first_line is None:
+            return Response(
+                {
+                    'error': 'Invalid input data',
+                    'message': 'Request body must contain at least one NDJSON line'
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        options = {}
+        body_lines = [first_line]
+        try:
+            first_record = json.loads(first_line)
+        except ValueError:
+            first_record = None
+        if isinstance(first_record, dict) and 'options' in first_record:
+            options = first_record['options']
+            body_lines = []
+            if not isinstance(options, dict):
+                return Response(
+                    {
+                        'error': 'Invalid options',
+                        'message': 'options must be a JSON object'
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
+        weights = None
+        if options.get('weights'):
+            weight_serializer = WeightConfigSerializer(data=options['weights'])
+            if not weight_serializer.is_valid():
+                return Response(
+                    {
+                        'error': 'Invalid weight configuration',
+                        'details': weight_serializer.errors
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            weights = weight_serializer.validated_data
+        
+        calendar, error_response = resolve_calendar(options.get('calendar'))
+        if error_response:
+            return error_response
+        
+        dependency_mode, error_response = resolve_dependency_mode(options.get('dependency_mode'))
+        if error_response:
+            return error_response
+        if dependency_mode != 'direct':
+            return Response(
+                {
+                    'error': 'Invalid dependency mode',
+                    'message': "Streaming analysis only supports dependency_mode 'direct'"
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        top = options.get('top', 0)
+        if not isinstance(top, int) or isinstance(top, bool) or not 0 <= top <= MAX_STREAM_TOP:
+            return Response(
+                {
+                    'error': 'Invalid top',
+                    'message': f"top must be an integer between 0 and {MAX_STREAM_TOP}"
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        source = options.get('dependent_counts', 'first_pass')
+        if isinstance(source, dict):
+            try:
+                dependent_counts = {int(task_id): int(count) for task_id, count in source.items()}
+            except (TypeError, ValueError):
+                return Response(
+                    {
+                        'error': 'Invalid dependent_counts',
+                        'message': 'dependent_counts must map task IDs to integer counts'
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        elif source not in DEPENDENT_COUNT_SOURCES:
+            return Response(
+                {
+                    'error': 'Invalid dependent_counts',
+                    'message': f"dependent_counts must be one of {DEPENDENT_COUNT_SOURCES} or an object"
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        else:
+            dependent_counts = None
+        
+        start_line = line_number if body_lines else line_number + 1
+        feed = chain(body_lines, lines)
+        spool = None
+        if source == 'first_pass':
+            spool = tempfile.SpooledTemporaryFile(max_size=STREAM_SPOOL_MEMORY)
+            
+            def spooled(feed_lines):
+                for line in feed_lines:
+                    spool.write(line)
+                    yield line
+            
+            dependent_counts = count_stream_dependents(spooled(feed))
+            spool.seek(0)
+            feed = spool
+        
+        try:
+            calculator = PriorityCalculator.cached(weights=weights, calendar=calendar, dependency_mode=dependency_mode, impact_hours_per_task=IMPACT_HOURS)
+        except ValueError as e:
+            return Response(
+                {
+                    'error': 'Invalid weight configuration',
+                    'message': str(e)
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        analyzer = StreamAnalyzer(
+            calculator,
+            dependent_counts=dependent_counts,
+            top=top,
+            validate=validate_stream_task
+        )
+        
+        def body():
+            try:
+                yield from encode_ndjson(analyzer.run(iter_records(feed, start_line)))
+            finally:
+                if spool is not None:
+                    spool.close()
+        
+        return StreamingHttpResponse(body(), content_type='application/x-ndjson')
+
+
 class SuggestTasksView(APIView):
     """
     GET /api/tasks/suggest/
     POST /api/tasks/suggest/
     
-    Returns the top 3 tasks to work on with explanations.
+    Returns the top k tasks (default 3, set via ?k=) to work on with explanations.
     GET: Uses tasks from database
     POST: Uses tasks from request body
     """
     
+    @conditional_get
     def get(self, request):
         """
-        Get top 3 task suggestions from database tasks.
+        Get top k task suggestions from database tasks.
         
         Returns:
         {
@@ -169,13 +754,16 @@ class SuggestTasksView(APIView):
             )
         
 
-        task_list = [task.to_dict() for task in tasks]
-        
-     
+        task_list, versions = load_task_versions(tasks)
+        return self._suggest_stored(request, task_list, versions)
+    
+    def _suggest_stored(self, request, task_list, versions):
+        """Validate and score stored tasks, and return the top k suggestions."""
+        graph = TaskGraph(task_list)
         validator = DependencyValidator()
         
        
-        is_valid, error_msg = validator.validate_dependencies(task_list)
+        is_valid, error_msg = validator.validate_dependencies(task_list, graph)
         if not is_valid:
             return Response(
                 {
@@ -186,16 +774,9 @@ class SuggestTasksView(APIView):
             )
         
     
-        has_cycle, cycle_path = validator.detect_circular_dependencies(task_list)
-        if has_cycle:
-            return Response(
-                {
-                    'error': 'Circular dependency detected',
-                    'cycle': cycle_path,
-                    'message': f"Circular dependency found: {' -> '.join(map(str, cycle_path))}"
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        cyclic_components = validator.find_cyclic_components(task_list, graph)
+        if cyclic_components:
+            return circular_dependency_response(cyclic_components)
         
        
         custom_weights = request.query_params.get('weights')
@@ -224,32 +805,22 @@ class SuggestTasksView(APIView):
                 )
         
       
+        calendar, error_response = resolve_calendar(request.query_params.get('calendar'))
+        if error_response:
+            return error_response
+        
+        dependency_mode, error_response = resolve_dependency_mode(request.query_params.get('dependency_mode'))
+        if error_response:
+            return error_response
+        
+        k, error_response = parse_suggestion_count(request)
+        if error_response:
+            return error_response
+        
         try:
-            calculator = PriorityCalculator(weights=weights)
-            scored_tasks = calculator.analyze_tasks(task_list)
-            
-            
-            top_tasks = scored_tasks[:3]
-            
-           
-            suggestions = []
-            for task in top_tasks:
-                explanation = calculator.generate_task_explanation(task)
-                task_dict = {
-                    'id': task['id'],
-                    'title': task['title'],
-                    'due_date': task['due_date'].strftime('%Y-%m-%d') if hasattr(task['due_date'], 'strftime') else task['due_date'],
-                    'priority_score': task['priority_score']
-                }
-               
-                if 'metadata' in task:
-                    task_dict['is_overdue'] = task['metadata'].get('is_overdue', False)
-                    task_dict['days_overdue'] = task['metadata'].get('days_overdue', 0)
-                
-                suggestions.append({
-                    'task': task_dict,
-                    'reason': explanation
-                })
+            calculator = PriorityCalculator.cached(weights=weights, calendar=calendar, dependency_mode=dependency_mode, impact_hours_per_task=IMPACT_HOURS)
+            top_tasks = calculator.top_tasks(task_list, k=k, cache=stored_score_cache, versions=versions, graph=graph)
+            suggestions = build_suggestions(calculator, top_tasks)
             
             return Response(
                 {'suggestions': suggestions},
@@ -274,7 +845,7 @@ class SuggestTasksView(APIView):
     
     def post(self, request):
         """
-        Get top 3 task suggestions.
+        Get top k task suggestions.
         
         Request body: Same as analyze endpoint
         
@@ -304,10 +875,11 @@ class SuggestTasksView(APIView):
         tasks = serializer.validated_data['tasks']
         
        
+        graph = serializer.task_graph
         validator = DependencyValidator()
         
        
-        is_valid, error_msg = validator.validate_dependencies(tasks)
+        is_valid, error_msg = validator.validate_dependencies(tasks, graph)
         if not is_valid:
             return Response(
                 {
@@ -318,16 +890,9 @@ class SuggestTasksView(APIView):
             )
         
        
-        has_cycle, cycle_path = validator.detect_circular_dependencies(tasks)
-        if has_cycle:
-            return Response(
-                {
-                    'error': 'Circular dependency detected',
-                    'cycle': cycle_path,
-                    'message': f"Circular dependency found: {' -> '.join(map(str, cycle_path))}"
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        cyclic_components = validator.find_cyclic_components(tasks, graph)
+        if cyclic_components:
+            return circular_dependency_response(cyclic_components)
         
     
         custom_weights = request.data.get('weights')
@@ -344,31 +909,22 @@ class SuggestTasksView(APIView):
                 )
             weights = weight_serializer.validated_data
         
-        try:
-            calculator = PriorityCalculator(weights=weights)
-            scored_tasks = calculator.analyze_tasks(tasks)
-            
+        calendar, error_response = resolve_calendar(request.data.get('calendar'))
+        if error_response:
+            return error_response
         
-            top_tasks = scored_tasks[:3]
-          
-            suggestions = []
-            for task in top_tasks:
-                explanation = calculator.generate_task_explanation(task)
-                task_dict = {
-                    'id': task['id'],
-                    'title': task['title'],
-                    'due_date': task['due_date'].strftime('%Y-%m-%d') if hasattr(task['due_date'], 'strftime') else task['due_date'],
-                    'priority_score': task['priority_score']
-                }
-              
-                if 'metadata' in task:
-                    task_dict['is_overdue'] = task['metadata'].get('is_overdue', False)
-                    task_dict['days_overdue'] = task['metadata'].get('days_overdue', 0)
-                
-                suggestions.append({
-                    'task': task_dict,
-                    'reason': explanation
-                })
+        dependency_mode, error_response = resolve_dependency_mode(request.data.get('dependency_mode'))
+        if error_response:
+            return error_response
+        
+        k, error_response = parse_suggestion_count(request)
+        if error_response:
+            return error_response
+        
+        try:
+            calculator = PriorityCalculator.cached(weights=weights, calendar=calendar, dependency_mode=dependency_mode, impact_hours_per_task=IMPACT_HOURS)
+            top_tasks = calculator.top_tasks(tasks, k=k, scorer=sharded_scorer, graph=graph)
+            suggestions = build_suggestions(calculator, top_tasks)
             
             return Response(
                 {'suggestions': suggestions},
@@ -409,16 +965,40 @@ class HealthCheckView(APIView):
 
 class TaskListCreateView(APIView):
     """
-    GET /api/tasks/ - List all tasks
+    GET /api/tasks/ - List tasks, newest first, one page at a time
     POST /api/tasks/ - Create a new task
+    
+    Query parameters for GET:
+    - limit: Page size (default 100, at most 1000)
+    - cursor: next_cursor of the previous page
+    
+    Response:
+    {
+        "tasks": [...],
+        "count": 100,
+        "next_cursor": "eyJjcmVhdGVkX2F0Ijo..."
+    }
+    
+    next_cursor is null on the last page. Pages are keyset-paginated on
+    (created_at, id), so tasks added while paging do not shift later pages.
     """
     
+    @conditional_get
     def get(self, request):
-        """Get all tasks from database."""
-        tasks = Task.objects.all()
-        task_list = [task.to_dict() for task in tasks]
+        """Get one page of tasks from database."""
+        page_size, error_response = resolve_page_size(request)
+        if error_response:
+            return error_response
+        
+        try:
+            task_list, next_cursor = keyset_page(
+                Task.objects.all(), request.query_params.get('cursor'), page_size
+            )
+        except ValueError as e:
+            return invalid_cursor_response(str(e))
+        
         return Response(
-            {'tasks': task_list, 'count': len(task_list)},
+            {'tasks': task_list, 'count': len(task_list), 'next_cursor': next_cursor},
             status=status.HTTP_200_OK
         )
     
@@ -522,65 +1102,159 @@ class TaskDetailView(APIView):
 class TaskBulkCreateView(APIView):
     """
     POST /api/tasks/bulk/ - Create multiple tasks at once
+    
+    Request body:
+    {
+        "tasks": [
+            {"title": "...", "due_date": "2025-12-01", "estimated_hours": 3, "importance": 8, "dependencies": []},
+            ...
+        ],
+        "mode": "best_effort"  // or "all_or_nothing"
+    }
+    
+    Response:
+    {
+        "created": 2,
+        "tasks": [...],
+        "failed": 1,
+        "errors": [{"index": 2, "task": "...", "error": "importance: ...", "details": {...}}]
+    }
+    
+    All rows are validated first and the valid ones are written in one
+    transaction. In all_or_nothing mode a single invalid row means nothing is
+    written.
     """
     
     def post(self, request):
         """Create multiple tasks from JSON array."""
-        data = request.data
-        
-        if 'tasks' not in data or not isinstance(data['tasks'], list):
+        return self._import(request.data)
+    
+    def _import(self, data, progress=None):
+        """Validate and store the tasks of a request body (progress: see import_tasks)."""
+        if not isinstance(data, dict) or not isinstance(data.get('tasks'), list):
             return Response(
                 {'error': 'Request must contain a "tasks" array'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        tasks_data = data['tasks']
-        created_tasks = []
-        errors = []
+        mode = data.get('mode') or DEFAULT_BULK_MODE
+        if mode not in BULK_MODES:
+            return Response(
+                {
+                    'error': 'Invalid mode',
+                    'message': f"Invalid mode: {mode}. Valid modes are: {', '.join(BULK_MODES)}"
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        for idx, task_data in enumerate(tasks_data):
-            try:
-              
-                required_fields = ['title', 'due_date', 'estimated_hours', 'importance']
-                for field in required_fields:
-                    if field not in task_data:
-                        raise ValueError(f'Missing required field: {field}')
-                
-         
-                task = Task.objects.create(
-                    title=task_data['title'],
-                    due_date=task_data['due_date'],
-                    estimated_hours=float(task_data['estimated_hours']),
-                    importance=int(task_data['importance']),
-                    dependencies=task_data.get('dependencies', [])
-                )
-                created_tasks.append(task.to_dict())
-                
-            except Exception as e:
-                errors.append({
-                    'index': idx,
-                    'task': task_data.get('title', 'Unknown'),
-                    'error': str(e)
-                })
+        try:
+            result = import_tasks(
+                data['tasks'],
+                mode=mode,
+                chunk_size=getattr(settings, 'TASK_BULK_CREATE_CHUNK_SIZE', BULK_CREATE_CHUNK_SIZE),
+                progress=progress
+            )
+        except Exception as e:
+            return Response(
+                {'error': 'Failed to create tasks', 'message': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
         
         response_data = {
-            'created': len(created_tasks),
-            'tasks': created_tasks
+            'created': result['created'],
+            'tasks': result['tasks']
         }
         
-        if errors:
-            response_data['errors'] = errors
-            response_data['failed'] = len(errors)
+        if result['errors']:
+            response_data['errors'] = result['errors']
+            response_data['failed'] = len(result['errors'])
         
         return Response(
             response_data,
-            status=status.HTTP_201_CREATED if created_tasks else status.HTTP_400_BAD_REQUEST
+            status=status.HTTP_201_CREATED if result['created'] else status.HTTP_400_BAD_REQUEST
         )
 
 
-class TaskClearAllView(APIView):
-    """
-    DELETE /api/tasks/clear/ - Delete all tasks
+class TaskBatchView(APIView):
+    """
+    PATCH /api/tasks/batch/ - Update and delete many tasks in one transaction
+    
+    Request body:
+    {
+        "update": [
+            {"id": 3, "importance": 9},
+            {"id": 7, "due_date": "2025-12-01", "dependencies": [3]}
+        ],
+        "delete": [12, 15],
+        "mode": "best_effort"  // or "all_or_nothing"
+    }
+    
+    Response:
+    {
+        "updated": 2,
+        "deleted": 1,
+        "results": [
+            {"op": "update", "index": 0, "id": 3, "status": "updated", "task": {...}},
+            {"op": "update", "index": 1, "id": 7, "status": "updated", "task": {...}},
+            {"op": "delete", "index": 0, "id": 12, "status": "deleted", "task": {...}},
+            {"op": "delete", "index": 1, "id": 15, "status": "error", "error": "Task 15 does not exist"}
+        ]
+    }
+    
+    Updates are partial: only the fields given change, validated like
+    POST /api/tasks/analyze/ tasks.
+    """
+    
+    def patch(self, request):
+        """Apply a batch of task updates and deletes."""
+        data = request.data
+        if not isinstance(data, dict):
+            return Response(
+                {'error': 'Request must contain an "update" or "delete" array'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        updates = data.get('update', [])
+        deletes = data.get('delete', [])
+        
+        if not isinstance(updates, list) or not isinstance(deletes, list) or not (updates or deletes):
+            return Response(
+                {'error': 'Request must contain an "update" or "delete" array'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        mode = data.get('mode') or DEFAULT_BULK_MODE
+        if mode not in BULK_MODES:
+            return Response(
+                {
+                    'error': 'Invalid mode',
+                    'message': f"Invalid mode: {mode}. Valid modes are: {', '.join(BULK_MODES)}"
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            result = apply_task_mutations(
+                updates,
+                deletes,
+                mode=mode,
+                chunk_size=getattr(settings, 'TASK_BULK_CREATE_CHUNK_SIZE', BULK_CREATE_CHUNK_SIZE)
+            )
+        except Exception as e:
+            return Response(
+                {'error': 'Failed to apply changes', 'message': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        applied = result['updated'] + result['deleted']
+        return Response(
+            result,
+            status=status.HTTP_200_OK if applied else status.HTTP_400_BAD_REQUEST
+        )
+
+
+class TaskClearAllView(APIView):
+    """
+    DELETE /api/tasks/clear/ - Delete all tasks
     """
     
     def delete(self, request):
@@ -665,10 +1339,86 @@ class WeightConfigView(APIView):
 class AnalyzeStoredTasksView(APIView):
     """
     GET /api/tasks/analyze-stored/ - Analyze all tasks from database
+    
+    Query parameters:
+    - weights, calendar, dependency_mode: Scoring parameters (first page only)
+    - limit: Page size (default 100, at most 1000)
+    - cursor: next_cursor of the previous page
+    
+    Response:
+    {
+        "tasks": [...],
+        "total": 2500,
+        "next_cursor": "eyJzbmFwc2hvdCI6..."
+    }
+    
+    The first page scores every task and keeps the ranking as a snapshot;
+    later pages are read from that snapshot without rescoring, so they stay
+    consistent with the first page even if tasks change meanwhile. Snapshots
+    expire after TASK_RANKING_SNAPSHOT_TTL seconds (410 Gone), after which
+    paging restarts from the first page. Only a first page with the whole
+    ranking carries an ETag; one with a next_cursor is never a 304.
     """
     
+    @staticmethod
+    def _page(snapshot, offset, page_size):
+        """Response with one page of a ranking snapshot."""
+        end = offset + page_size
+        next_cursor = None
+        if end < len(snapshot):
+            next_cursor = encode_cursor({'snapshot': snapshot.snapshot_id, 'offset': end})
+        return Response(
+            {
+                'tasks': snapshot.page(offset, page_size),
+                'total': len(snapshot),
+                'next_cursor': next_cursor
+            },
+            status=status.HTTP_200_OK
+        )
+    
+    def _snapshot_page(self, cursor, page_size):
+        """Serve a later page from the snapshot named in the cursor."""
+        try:
+            payload = decode_cursor(cursor)
+            snapshot_id = str(payload['snapshot'])
+            offset = int(payload['offset'])
+        except (KeyError, TypeError, ValueError):
+            return invalid_cursor_response("Malformed cursor")
+        
+        snapshot = ranking_snapshots.get(snapshot_id)
+        if snapshot is None:
+            return Response(
+                {
+                    'error': 'Cursor expired',
+                    'message': 'The ranking snapshot has expired; request the first page again'
+                },
+                status=status.HTTP_410_GONE
+            )
+        if not 0 <= offset <= len(snapshot):
+            return invalid_cursor_response("Malformed cursor")
+        return self._page(snapshot, offset, page_size)
+    
     def get(self, request):
         """Analyze tasks stored in database."""
+        page_size, error_response = resolve_page_size(request)
+        if error_response:
+            return error_response
+        
+        cursor = request.query_params.get('cursor')
+        if cursor:
+            return self._snapshot_page(cursor, page_size)
+        
+        # Answer If-None-Match with 304 only when there is no cursor to expire.
+        etag = single_page_etag(DatasetVersion.current(), Task.objects.count(), request, page_size)
+        response = get_conditional_response(request, etag=etag) if etag else None
+        if response is None:
+            response = self._analyze_stored(request, page_size)
+        if etag:
+            response['ETag'] = etag
+        return response
+    
+    def _analyze_stored(self, request, page_size):
+        """Load the stored tasks and return the first page of their ranking."""
         tasks = Task.objects.all()
         
         if not tasks.exists():
@@ -677,12 +1427,15 @@ class AnalyzeStoredTasksView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        task_list = [task.to_dict() for task in tasks]
-        
-      
+        task_list, versions = load_task_versions(tasks)
+        return self._analyze(request, task_list, versions, page_size)
+    
+    def _analyze(self, request, task_list, versions, page_size):
+        """Validate, score and rank stored tasks, and return the first page."""
+        graph = TaskGraph(task_list)
         validator = DependencyValidator()
      
-        is_valid, error_msg = validator.validate_dependencies(task_list)
+        is_valid, error_msg = validator.validate_dependencies(task_list, graph)
         if not is_valid:
             return Response(
                 {
@@ -693,16 +1446,9 @@ class AnalyzeStoredTasksView(APIView):
             )
         
 
-        has_cycle, cycle_path = validator.detect_circular_dependencies(task_list)
-        if has_cycle:
-            return Response(
-                {
-                    'error': 'Circular dependency detected',
-                    'cycle': cycle_path,
-                    'message': f"Circular dependency found: {' -> '.join(map(str, cycle_path))}"
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        cyclic_components = validator.find_cyclic_components(task_list, graph)
+        if cyclic_components:
+            return circular_dependency_response(cyclic_components)
         
    
         custom_weights = request.query_params.get('weights')
@@ -731,14 +1477,22 @@ class AnalyzeStoredTasksView(APIView):
                 )
         
 
+        calendar, error_response = resolve_calendar(request.query_params.get('calendar'))
+        if error_response:
+            return error_response
+        
+        dependency_mode, error_response = resolve_dependency_mode(request.query_params.get('dependency_mode'))
+        if error_response:
+            return error_response
+        
         try:
-            calculator = PriorityCalculator(weights=weights)
-            scored_tasks = calculator.analyze_tasks(task_list)
-            
-            return Response(
-                {'tasks': scored_tasks},
-                status=status.HTTP_200_OK
+            calculator = PriorityCalculator.cached(weights=weights, calendar=calendar, dependency_mode=dependency_mode, impact_hours_per_task=IMPACT_HOURS)
+            scores, priority_scores = calculator.score_tasks(task_list, stored_score_cache, versions, graph)
+            # A ranking that fits on one page is never paged, so it is not kept.
+            snapshot = ranking_snapshots.create(
+                task_list, scores, priority_scores, keep=len(task_list) > page_size
             )
+            return self._page(snapshot, 0, page_size)
         except ValueError as e:
             return Response(
                 {
@@ -757,63 +1511,603 @@ class AnalyzeStoredTasksView(APIView):
             )
 
 
-class DependencyGraphView(APIView):
+class DashboardView(StreamingResponseMixin, APIView):
+    """
+    GET /api/tasks/dashboard/ - Dashboard data for database tasks
+    POST /api/tasks/dashboard/ - Dashboard data for tasks from request body
+    
+    Everything the results page shows, from one validation and one scoring
+    pass: the ranked task list, the top-k suggestions with explanations, the
+    dependency graph and the Eisenhower matrix. Replaces separate calls to
+    analyze, suggest, dependency-graph and eisenhower-matrix.
+    """
+    
+    def _dashboard(self, request, tasks, params, cache=None, versions=None, graph=None):
+        """Validate once, score once and derive every dashboard section."""
+        if graph is None:
+            graph = TaskGraph(tasks)
+        validator = DependencyValidator()
+        
+        is_valid, error_msg = validator.validate_dependencies(tasks, graph)
+        if not is_valid:
+            return Response(
+                {
+                    'error': 'Invalid dependencies',
+                    'message': error_msg
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        cyclic_components = validator.find_cyclic_components(tasks, graph)
+        if cyclic_components:
+            return circular_dependency_response(cyclic_components)
+        
+        weights = None
+        if params.get('weights'):
+            weight_serializer = WeightConfigSerializer(data=params['weights'])
+            if not weight_serializer.is_valid():
+                return Response(
+                    {
+                        'error': 'Invalid weight configuration',
+                        'details': weight_serializer.errors
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            weights = weight_serializer.validated_data
+        
+        calendar, error_response = resolve_calendar(params.get('calendar'))
+        if error_response:
+            return error_response
+        
+        dependency_mode, error_response = resolve_dependency_mode(params.get('dependency_mode'))
+        if error_response:
+            return error_response
+        
+        k, error_response = parse_suggestion_count(request)
+        if error_response:
+            return error_response
+        
+        try:
+            calculator = PriorityCalculator.cached(weights=weights, calendar=calendar, dependency_mode=dependency_mode, impact_hours_per_task=IMPACT_HOURS)
+            ranked, scores = calculator.analyze_with_scores(tasks, cache, versions, graph)
+        except ValueError as e:
+            return Response(
+                {
+                    'error': 'Invalid task data',
+                    'message': str(e)
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response(
+            {
+                'tasks': ranked,
+                'suggestions': build_suggestions(calculator, ranked[:k]),
+                'graph': build_dependency_graph(tasks, cyclic_components, graph),
+                'matrix': build_eisenhower_matrix(tasks, scores)
+            },
+            status=status.HTTP_200_OK
+        )
+    
+    @conditional_get
+    def get(self, request):
+        """
+        Dashboard for database tasks.
+        
+        Query parameters: k, calendar, dependency_mode and weights (as JSON)
+        """
+        tasks = Task.objects.all()
+        
+        if not tasks.exists():
+            return Response(
+                {'error': 'No tasks found in database'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        params = dict(request.query_params.items())
+        if 'weights' in params:
+            try:
+                params['weights'] = json.loads(params['weights'])
+            except json.JSONDecodeError as e:
+                return Response(
+                    {
+                        'error': 'Invalid weight configuration format',
+                        'message': str(e)
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
+        task_list, versions = load_task_versions(tasks)
+        return self._dashboard(request, task_list, params, cache=stored_score_cache, versions=versions)
+    
+    def post(self, request):
+        """
+        Dashboard for tasks from request body.
+        
+        Request body: Same as analyze endpoint (tasks, weights, calendar,
+        dependency_mode); ?k=<n> sets the number of suggestions (default 3)
+        
+        Returns:
+        {
+            "tasks": [...same as analyze...],
+            "suggestions": [...same as suggest...],
+            "graph": {"nodes": [...], "edges": [...], "hasCycle": false, ...},
+            "matrix": {"Q1": [...], "Q2": [...], "Q3": [...], "Q4": [...]}
+        }
+        """
+        serializer = TaskListSerializer(data=request.data)
+        
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'error': 'Invalid input data',
+                    'details': serializer.errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return self._dashboard(request, serializer.validated_data['tasks'], request.data, graph=serializer.task_graph)
+
+
+class DependencyGraphView(StreamingResponseMixin, APIView):
     """
     GET /api/tasks/dependency-graph/ - Get dependency graph data for visualization
     POST /api/tasks/dependency-graph/ - Get dependency graph from request body
     """
     
-    def _build_graph_data(self, tasks):
-        """Build graph data structure for visualization."""
+    @conditional_get
+    def get(self, request):
+        """Get dependency graph from database tasks."""
+        tasks = Task.objects.all()
+        
+        if not tasks.exists():
+            return Response(
+                {'error': 'No tasks found in database'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        task_list, _ = load_task_versions(tasks)
+        graph_data = build_dependency_graph(task_list)
+        
+        return Response(graph_data, status=status.HTTP_200_OK)
+    
+    def post(self, request):
+        """Get dependency graph from request body."""
+        serializer = TaskListSerializer(data=request.data)
+        
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'error': 'Invalid input data',
+                    'details': serializer.errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        tasks = serializer.validated_data['tasks']
+        graph_data = build_dependency_graph(tasks, graph=serializer.task_graph)
+        
+        return Response(graph_data, status=status.HTTP_200_OK)
+
+
+class EisenhowerMatrixView(APIView):
+    """
+    GET /api/tasks/eisenhower-matrix/ - Get tasks organized in Eisenhower Matrix
+    POST /api/tasks/eisenhower-matrix/ - Get matrix from request body
+    """
+    
+    def _build_matrix(self, tasks, calculator, cache=None, versions=None):
+        """
+        Build Eisenhower Matrix data structure.
+        
+        Raw urgency and importance come from the batch engine (and the score
+        cache for stored tasks) instead of being recomputed per task.
+        """
+        scores, _ = calculator.score_tasks(tasks, cache, versions)
+        return build_eisenhower_matrix(tasks, scores)
+    
+    @conditional_get
+    def get(self, request):
+        """Get Eisenhower Matrix from database tasks."""
+        tasks = Task.objects.all()
+        
+        if not tasks.exists():
+            return Response(
+                {'error': 'No tasks found in database'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        task_list, versions = load_task_versions(tasks)
+        
+       
+        custom_weights = request.query_params.get('weights')
+        weights = None
+        if custom_weights:
+            try:
+                import json
+                weights_dict = json.loads(custom_weights)
+                weight_serializer = WeightConfigSerializer(data=weights_dict)
+                if weight_serializer.is_valid():
+                    weights = weight_serializer.validated_data
+            except (json.JSONDecodeError, ValueError):
+                pass
+        
+        calendar, error_response = resolve_calendar(request.query_params.get('calendar'))
+        if error_response:
+            return error_response
+        
+        dependency_mode, error_response = resolve_dependency_mode(request.query_params.get('dependency_mode'))
+        if error_response:
+            return error_response
+        
+        try:
+            calculator = PriorityCalculator.cached(weights=weights, calendar=calendar, dependency_mode=dependency_mode, impact_hours_per_task=IMPACT_HOURS)
+            matrix = self._build_matrix(task_list, calculator, cache=stored_score_cache, versions=versions)
+        except ValueError as e:
+            return Response(
+                {
+                    'error': 'Invalid task data',
+                    'message': str(e)
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response({'matrix': matrix}, status=status.HTTP_200_OK)
+    
+    def post(self, request):
+        """Get Eisenhower Matrix from request body."""
+        serializer = TaskListSerializer(data=request.data)
+        
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'error': 'Invalid input data',
+                    'details': serializer.errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        tasks = serializer.validated_data['tasks']
+       
+        custom_weights = request.data.get('weights')
+        weights = None
+        if custom_weights:
+            weight_serializer = WeightConfigSerializer(data=custom_weights)
+            if weight_serializer.is_valid():
+                weights = weight_serializer.validated_data
+        
+        calendar, error_response = resolve_calendar(request.data.get('calendar'))
+        if error_response:
+            return error_response
+        
+        dependency_mode, error_response = resolve_dependency_mode(request.data.get('dependency_mode'))
+        if error_response:
+            return error_response
+        
+        try:
+            calculator = PriorityCalculator.cached(weights=weights, calendar=calendar, dependency_mode=dependency_mode, impact_hours_per_task=IMPACT_HOURS)
+            matrix = self._build_matrix(tasks, calculator)
+        except ValueError as e:
+            return Response(
+                {
+                    'error': 'Invalid task data',
+                    'message': str(e)
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response({'matrix': matrix}, status=status.HTTP_200_OK)
+
+
+class CriticalPathView(APIView):
+    """
+    GET /api/tasks/critical-path/ - Schedule analysis of database tasks
+    POST /api/tasks/critical-path/ - Schedule analysis of tasks from request body
+    
+    Returns earliest start/finish on the working-day calendar, slack against
+    each due date, the critical path, and tasks whose upstream chain makes
+    their deadline impossible.
+    """
+    
+    def _analyze(self, tasks, params, graph=None):
+        """Validate the dependency graph and run the critical-path analysis."""
+        if graph is None:
+            graph = TaskGraph(tasks)
         validator = DependencyValidator()
+        is_valid, error_msg = validator.validate_dependencies(tasks, graph)
+        if not is_valid:
+            return Response(
+                {
+                    'error': 'Invalid dependencies',
+                    'message': error_msg
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        cyclic_components = validator.find_cyclic_components(tasks, graph)
+        if cyclic_components:
+            return circular_dependency_response(cyclic_components)
+        
+        calendar, error_response = resolve_calendar(params.get('calendar'))
+        if error_response:
+            return error_response
+        
+        try:
+            hours_per_day = float(params.get('hours_per_day') or DEFAULT_HOURS_PER_DAY)
+            analyzer = CriticalPathAnalyzer(calendar=calendar, hours_per_day=hours_per_day)
+            result = analyzer.analyze(tasks, graph)
+        except (TypeError, ValueError) as e:
+            return Response(
+                {
+                    'error': 'Invalid task data',
+                    'message': str(e)
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    
+    @conditional_get
+    def get(self, request):
+        """Analyze the schedule of database tasks."""
+        tasks = Task.objects.all()
+        
+        if not tasks.exists():
+            return Response(
+                {'error': 'No tasks found in database'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        task_list, _ = load_task_versions(tasks)
+        return self._analyze(task_list, request.query_params)
+    
+    def post(self, request):
+        """Analyze the schedule of tasks from request body."""
+        serializer = TaskListSerializer(data=request.data)
+        
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'error': 'Invalid input data',
+                    'details': serializer.errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return self._analyze(serializer.validated_data['tasks'], request.data, graph=serializer.task_graph)
+
+
+class DailyPlanView(APIView):
+    """
+    GET /api/tasks/plan/ - Daily work plan for database tasks
+    POST /api/tasks/plan/ - Daily work plan for tasks from request body
+    
+    Packs tasks into working days of hours_per_day hours in priority order,
+    respecting dependencies, and reports the due dates the plan misses.
+    """
+    
+    def _plan(self, tasks, params, cache=None, versions=None, graph=None):
+        """Validate the plan options and dependency graph, then plan."""
+        serializer = DailyPlanSerializer(data=params)
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'error': 'Invalid plan configuration',
+                    'details': serializer.errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        config = serializer.validated_data
+        
+        if graph is None:
+            graph = TaskGraph(tasks)
+        validator = DependencyValidator()
+        is_valid, error_msg = validator.validate_dependencies(tasks, graph)
+        if not is_valid:
+            return Response(
+                {
+                    'error': 'Invalid dependencies',
+                    'message': error_msg
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        cyclic_components = validator.find_cyclic_components(tasks, graph)
+        if cyclic_components:
+            return circular_dependency_response(cyclic_components)
+        
+        calendar, error_response = resolve_calendar(params.get('calendar'))
+        if error_response:
+            return error_response
+        
+        dependency_mode, error_response = resolve_dependency_mode(params.get('dependency_mode'))
+        if error_response:
+            return error_response
+        
+        try:
+            calculator = PriorityCalculator.cached(
+                weights=config.get('weights') or None,
+                calendar=calendar,
+                dependency_mode=dependency_mode,
+                impact_hours_per_task=IMPACT_HOURS
+            )
+            planner = DailyPlanner(calculator, hours_per_day=config['hours_per_day'])
+            result = planner.plan(
+                tasks,
+                cache=cache,
+                versions=versions,
+                local_search=config['local_search'],
+                days=config.get('days'),
+                graph=graph
+            )
+        except ValueError as e:
+            return Response(
+                {
+                    'error': 'Invalid task data',
+                    'message': str(e)
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    
+    @conditional_get
+    def get(self, request):
+        """
+        Plan database tasks.
+        
+        Query parameters: hours_per_day, days, local_search, calendar,
+        dependency_mode and weights (as JSON), e.g. ?hours_per_day=6&days=5
+        """
+        tasks = Task.objects.all()
+        
+        if not tasks.exists():
+            return Response(
+                {'error': 'No tasks found in database'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        params = dict(request.query_params.items())
+        if 'weights' in params:
+            try:
+                params['weights'] = json.loads(params['weights'])
+            except json.JSONDecodeError:
+                return Response(
+                    {
+                        'error': 'Invalid plan configuration',
+                        'message': "'weights' must be valid JSON"
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
+        task_list, versions = load_task_versions(tasks)
+        return self._plan(task_list, params, cache=stored_score_cache, versions=versions)
+    
+    def post(self, request):
+        """
+        Plan tasks from request body.
+        
+        Request body:
+        {
+            "tasks": [...],
+            "hours_per_day": 8,
+            "days": 5,
+            "local_search": true,
+            "weights": {...optional...},
+            "calendar": "us"
+        }
+        
+        Returns:
+        {
+            "days": [
+                {"date": "2025-06-02", "hours": 8.0, "tasks": [{"id": 4, "title": "...", "hours": 3.0}, ...]},
+                ...
+            ],
+            "tasks": [
+                {"id": 4, "title": "...", "position": 1, "priority_score": 82.5, "estimated_hours": 3.0,
+                 "start_date": "2025-06-02", "finish_date": "2025-06-02", "due_date": "2025-06-03",
+                 "is_late": false, "days_late": 0},
+                ...
+            ],
+            "late": [{"id": 9, "title": "...", "due_date": "2025-06-03", "finish_date": "2025-06-05", "days_late": 2}],
+            "summary": {"task_count": 42, "total_hours": 180.5, "working_days": 23, "finish_date": "2025-07-02",
+                        "late_count": 1, "weighted_lateness": 990.0, "local_search": {"passes": 2, "swaps": 5}},
+            "hours_per_day": 8.0,
+            "evaluation_date": "2025-06-02"
+        }
+        
+        "days" lists the first "days" working days (default: the whole plan);
+        "tasks" always covers every task. A task longer than the rest of a day
+        continues on the next working day.
+        """
+        serializer = TaskListSerializer(data=request.data)
+        
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'error': 'Invalid input data',
+                    'details': serializer.errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return self._plan(serializer.validated_data['tasks'], request.data, graph=serializer.task_graph)
+
+
+class WeightSweepView(APIView):
+    """
+    GET /api/tasks/weights/sweep/ - Weight sensitivity of database tasks
+    POST /api/tasks/weights/sweep/ - Weight sensitivity of tasks from request body
+    
+    Scores the tasks under many weight vectors in one pass: factor scores are
+    computed once and combined with all vectors as a single matrix product.
+    """
+    
+    def _sweep(self, tasks, params, cache=None, versions=None, graph=None):
+        """Validate the sweep configuration and run it."""
+        serializer = WeightSweepSerializer(data=params)
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'error': 'Invalid sweep configuration',
+                    'details': serializer.errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        config = serializer.validated_data
+        
+        if 'grid' in config:
+            try:
+                vectors = weight_grid(config['grid']['step'], config['grid']['bounds'])
+            except ValueError as e:
+                return Response(
+                    {
+                        'error': 'Invalid sweep',
+                        'message': str(e)
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        else:
+            vectors = [dict(vector) for vector in config['vectors']]
         
-     
-        has_cycle, cycle_path = validator.detect_circular_dependencies(tasks)
-        cycle_set = set(cycle_path) if has_cycle else set()
+        calendar, error_response = resolve_calendar(params.get('calendar'))
+        if error_response:
+            return error_response
         
-
-        nodes = []
-        edges = []
-        task_map = {task.get('id'): task for task in tasks}
+        dependency_mode, error_response = resolve_dependency_mode(params.get('dependency_mode'))
+        if error_response:
+            return error_response
         
-        for task in tasks:
-            task_id = task.get('id')
-            if task_id is None:
-                continue
-            
+        try:
+            calculator = PriorityCalculator.cached(calendar=calendar, dependency_mode=dependency_mode, impact_hours_per_task=IMPACT_HOURS)
+            sweep = WeightSweep(calculator, k=config['k'])
+            result = sweep.run(
+                tasks,
+                vectors,
+                current_weights=dict(config.get('weights') or {}) or None,
+                cache=cache,
+                versions=versions,
+                graph=graph
+            )
+        except ValueError as e:
+            return Response(
+                {
+                    'error': 'Invalid sweep',
+                    'message': str(e)
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-            is_in_cycle = task_id in cycle_set
-            
-            nodes.append({
-                'id': task_id,
-                'label': f"{task_id}: {task.get('title', 'Untitled')[:30]}",
-                'title': task.get('title', 'Untitled'),
-                'inCycle': is_in_cycle,
-                'dependencies': task.get('dependencies', [])
-            })
-            
-    
-            for dep_id in task.get('dependencies', []):
-                if dep_id in task_map:
-            
-                    edge_in_cycle = is_in_cycle and dep_id in cycle_set
-                    edges.append({
-                        'from': dep_id,
-                        'to': task_id,
-                        'arrows': 'to',
-                        'color': {'color': '#ef4444' if edge_in_cycle else '#64748b'},
-                        'inCycle': edge_in_cycle
-                    })
-        
-        return {
-            'nodes': nodes,
-            'edges': edges,
-            'hasCycle': has_cycle,
-            'cyclePath': cycle_path if has_cycle else []
-        }
+        return Response(result, status=status.HTTP_200_OK)
     
+    @conditional_get
     def get(self, request):
-        """Get dependency graph from database tasks."""
+        """
+        Sweep weights over database tasks.
+        
+        Query parameters: vectors, grid and weights as JSON, plus k, calendar
+        and dependency_mode, e.g. ?grid={"step": 0.1}&k=5
+        """
         tasks = Task.objects.all()
         
         if not tasks.exists():
@@ -822,13 +2116,55 @@ class DependencyGraphView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        task_list = [task.to_dict() for task in tasks]
-        graph_data = self._build_graph_data(task_list)
+        params = {}
+        for key, value in request.query_params.items():
+            if key in ('vectors', 'grid', 'weights'):
+                try:
+                    params[key] = json.loads(value)
+                except json.JSONDecodeError:
+                    return Response(
+                        {
+                            'error': 'Invalid sweep configuration',
+                            'message': f"'{key}' must be valid JSON"
+                        },
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+            else:
+                params[key] = value
         
-        return Response(graph_data, status=status.HTTP_200_OK)
+        task_list, versions = load_task_versions(tasks)
+        return self._sweep(task_list, params, cache=stored_score_cache, versions=versions)
     
     def post(self, request):
-        """Get dependency graph from request body."""
+        """
+        Sweep weights over tasks from request body.
+        
+        Request body:
+        {
+            "tasks": [...],
+            "vectors": [{"urgency": 0.4, "importance": 0.3, "effort": 0.15, "dependencies": 0.15}, ...],
+            "grid": {"step": 0.1, "bounds": {"urgency": [0.2, 0.6]}},
+            "weights": {...current weights, default: WEIGHTS...},
+            "k": 3
+        }
+        Exactly one of "vectors" and "grid" is required.
+        
+        Returns:
+        {
+            "vectors": [{"weights": {...}, "top": [{"id": 1, "title": "...", "priority_score": 85.5}, ...]}, ...],
+            "rank_correlation": [[1.0, 0.93, ...], ...],
+            "stability": {
+                "weights": {...},
+                "top_tasks": [1, 4, 2],
+                "ranges": {"urgency": {"current": 0.4, "min": 0.31, "max": 0.55}, ...}
+            },
+            "task_count": 42
+        }
+        
+        rank_correlation is Spearman's rho between the full rankings of every
+        pair of vectors. Each stability range is how far one weight can move
+        (the others keeping their proportions) before the current top 3 change.
+        """
         serializer = TaskListSerializer(data=request.data)
         
         if not serializer.is_valid():
@@ -840,80 +2176,77 @@ class DependencyGraphView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        tasks = serializer.validated_data['tasks']
-        graph_data = self._build_graph_data(tasks)
-        
-        return Response(graph_data, status=status.HTTP_200_OK)
+        return self._sweep(serializer.validated_data['tasks'], request.data, graph=serializer.task_graph)
 
 
-class EisenhowerMatrixView(APIView):
+class WhatIfView(APIView):
     """
-    GET /api/tasks/eisenhower-matrix/ - Get tasks organized in Eisenhower Matrix
-    POST /api/tasks/eisenhower-matrix/ - Get matrix from request body
+    POST /api/tasks/what-if/
+    
+    Simulates hypothetical edits of stored tasks without saving them and
+    reports how each scenario changes the ranking.
     """
     
-    def _categorize_task(self, task, calculator):
-        """
-        Categorize task into Eisenhower Matrix quadrants.
-        
-        Quadrants:
-        - Q1 (Urgent & Important): High urgency + High importance
-        - Q2 (Not Urgent & Important): Low urgency + High importance
-        - Q3 (Urgent & Not Important): High urgency + Low importance
-        - Q4 (Not Urgent & Not Important): Low urgency + Low importance
+    def post(self, request):
         """
-        from datetime import datetime, date
-        
-       
-        due_date_str = task.get('due_date')
-        if isinstance(due_date_str, str):
-            due_date = datetime.strptime(due_date_str, '%Y-%m-%d').date()
-        else:
-            due_date = due_date_str
+        Evaluate what-if scenarios against the stored tasks.
         
-        urgency_score = calculator.calculate_urgency_score(due_date)
-        importance_score = calculator.calculate_importance_score(task.get('importance', 5))
-        
-    
-        is_urgent = urgency_score >= 50
-        is_important = importance_score >= 50
-        
-        if is_urgent and is_important:
-            quadrant = 'Q1'
-        elif not is_urgent and is_important:
-            quadrant = 'Q2' 
-        elif is_urgent and not is_important:
-            quadrant = 'Q3'  
-        else:
-            quadrant = 'Q4' 
-        
-        return {
-            'quadrant': quadrant,
-            'urgency_score': urgency_score,
-            'importance_score': importance_score
+        Request body:
+        {
+            "scenarios": [
+                {
+                    "name": "Slip release by a week",
+                    "patches": [
+                        {"id": 3, "shift_days": 7},
+                        {"id": 5, "hours_scale": 0.5},
+                        {"id": 8, "due_date": "2025-12-01", "importance": 9, "dependencies": [3]}
+                    ]
+                },
+                ...
+            ],
+            "weights": {...optional...},
+            "calendar": "us",
+            "dependency_mode": "direct",
+            "limit": 50,
+            "top": 3
         }
-    
-    def _build_matrix(self, tasks, calculator):
-        """Build Eisenhower Matrix data structure."""
-        matrix = {
-            'Q1': [], 
-            'Q2': [],  
-            'Q3': [],  
-            'Q4': []  
+        
+        Returns:
+        {
+            "baseline": {"top": [4, 1, 7], "task_count": 120},
+            "scenarios": [
+                {
+                    "name": "Slip release by a week",
+                    "patched": [3, 5, 8],
+                    "top": [4, 8, 1],
+                    "changed_count": 14,
+                    "moved_up": 6,
+                    "moved_down": 8,
+                    "changes": [
+                        {"id": 3, "title": "...", "baseline_rank": 2, "rank": 11, "rank_change": -9,
+                         "baseline_score": 71.2, "priority_score": 58.4},
+                        ...
+                    ]
+                },
+                ...
+            ]
         }
         
-        for task in tasks:
-            category = self._categorize_task(task, calculator)
-            quadrant = category['quadrant']
-            
-            task_with_category = task.copy()
-            task_with_category.update(category)
-            matrix[quadrant].append(task_with_category)
+        changes lists at most "limit" tasks whose rank or score changed,
+        largest rank change first.
+        """
+        serializer = WhatIfSerializer(data=request.data)
         
-        return matrix
-    
-    def get(self, request):
-        """Get Eisenhower Matrix from database tasks."""
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'error': 'Invalid input data',
+                    'details': serializer.errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        config = serializer.validated_data
         tasks = Task.objects.all()
         
         if not tasks.exists():
@@ -922,52 +2255,54 @@ class EisenhowerMatrixView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        task_list = [task.to_dict() for task in tasks]
-        
-       
-        custom_weights = request.query_params.get('weights')
-        weights = None
-        if custom_weights:
-            try:
-                import json
-                weights_dict = json.loads(custom_weights)
-                weight_serializer = WeightConfigSerializer(data=weights_dict)
-                if weight_serializer.is_valid():
-                    weights = weight_serializer.validated_data
-            except (json.JSONDecodeError, ValueError):
-                pass
+        calendar, error_response = resolve_calendar(request.data.get('calendar'))
+        if error_response:
+            return error_response
         
-        calculator = PriorityCalculator(weights=weights)
-        matrix = self._build_matrix(task_list, calculator)
+        dependency_mode, error_response = resolve_dependency_mode(request.data.get('dependency_mode'))
+        if error_response:
+            return error_response
         
-        return Response({'matrix': matrix}, status=status.HTTP_200_OK)
-    
-    def post(self, request):
-        """Get Eisenhower Matrix from request body."""
-        serializer = TaskListSerializer(data=request.data)
+        task_list, versions = load_task_versions(tasks)
         
-        if not serializer.is_valid():
+        try:
+            calculator = PriorityCalculator.cached(
+                weights=config.get('weights') or None,
+                calendar=calendar,
+                dependency_mode=dependency_mode,
+                impact_hours_per_task=IMPACT_HOURS
+            )
+            simulator = WhatIfSimulator(calculator, task_list, cache=stored_score_cache, versions=versions)
+            result = simulator.run(config['scenarios'], limit=config['limit'], top=config['top'])
+        except ValueError as e:
             return Response(
                 {
-                    'error': 'Invalid input data',
-                    'details': serializer.errors
+                    'error': 'Invalid scenario',
+                    'message': str(e)
                 },
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        tasks = serializer.validated_data['tasks']
-       
-        custom_weights = request.data.get('weights')
-        weights = None
-        if custom_weights:
-            weight_serializer = WeightConfigSerializer(data=custom_weights)
-            if weight_serializer.is_valid():
-                weights = weight_serializer.validated_data
-        
-        calculator = PriorityCalculator(weights=weights)
-        matrix = self._build_matrix(tasks, calculator)
-        
-        return Response({'matrix': matrix}, status=status.HTTP_200_OK)
+        return Response(result, status=status.HTTP_200_OK)
+
+
+class ScoreCacheView(APIView):
+    """
+    GET /api/tasks/score-cache/ - Get score cache hit/miss statistics
+    DELETE /api/tasks/score-cache/ - Clear the score cache
+    """
+    
+    def get(self, request):
+        """Get score cache statistics."""
+        return Response(stored_score_cache.stats(), status=status.HTTP_200_OK)
+    
+    def delete(self, request):
+        """Clear cached scores and reset the counters."""
+        stored_score_cache.clear()
+        return Response(
+            {'message': 'Score cache cleared'},
+            status=status.HTTP_200_OK
+        )
 
 
 class TaskFeedbackView(APIView):
@@ -1108,6 +2443,7 @@ class LearningAdjustedSuggestView(APIView):
         
         return weights
     
+    @conditional_get
     def get(self, request):
         """Get learning-adjusted suggestions from database tasks."""
         from django.db import models
@@ -1120,7 +2456,7 @@ class LearningAdjustedSuggestView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        task_list = [task.to_dict() for task in tasks]
+        task_list, versions = load_task_versions(tasks)
         
         adjusted_weights = self._get_adjusted_weights()
         weights = adjusted_weights
@@ -1136,49 +2472,35 @@ class LearningAdjustedSuggestView(APIView):
             except (json.JSONDecodeError, ValueError):
                 pass
       
+        graph = TaskGraph(task_list)
         validator = DependencyValidator()
-        is_valid, error_msg = validator.validate_dependencies(task_list)
+        is_valid, error_msg = validator.validate_dependencies(task_list, graph)
         if not is_valid:
             return Response(
                 {'error': 'Invalid dependencies', 'message': error_msg},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        has_cycle, cycle_path = validator.detect_circular_dependencies(task_list)
-        if has_cycle:
-            return Response(
-                {
-                    'error': 'Circular dependency detected',
-                    'cycle': cycle_path,
-                    'message': f"Circular dependency found: {' -> '.join(map(str, cycle_path))}"
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        cyclic_components = validator.find_cyclic_components(task_list, graph)
+        if cyclic_components:
+            return circular_dependency_response(cyclic_components)
     
-        try:
-            calculator = PriorityCalculator(weights=weights)
-            scored_tasks = calculator.analyze_tasks(task_list)
-            
+        calendar, error_response = resolve_calendar(request.query_params.get('calendar'))
+        if error_response:
+            return error_response
         
-            top_tasks = scored_tasks[:3]
-            
-            suggestions = []
-            for task in top_tasks:
-                explanation = calculator.generate_task_explanation(task)
-                task_dict = {
-                    'id': task['id'],
-                    'title': task['title'],
-                    'due_date': task['due_date'].strftime('%Y-%m-%d') if hasattr(task['due_date'], 'strftime') else task['due_date'],
-                    'priority_score': task['priority_score']
-                }
-                if 'metadata' in task:
-                    task_dict['is_overdue'] = task['metadata'].get('is_overdue', False)
-                    task_dict['days_overdue'] = task['metadata'].get('days_overdue', 0)
-                
-                suggestions.append({
-                    'task': task_dict,
-                    'reason': explanation
-                })
+        dependency_mode, error_response = resolve_dependency_mode(request.query_params.get('dependency_mode'))
+        if error_response:
+            return error_response
+        
+        k, error_response = parse_suggestion_count(request)
+        if error_response:
+            return error_response
+        
+        try:
+            calculator = PriorityCalculator.cached(weights=weights, calendar=calendar, dependency_mode=dependency_mode, impact_hours_per_task=IMPACT_HOURS)
+            top_tasks = calculator.top_tasks(task_list, k=k, cache=stored_score_cache, versions=versions, graph=graph)
+            suggestions = build_suggestions(calculator, top_tasks)
             
             response_data = {
                 'suggestions': suggestions,
@@ -1217,51 +2539,36 @@ class LearningAdjustedSuggestView(APIView):
             if weight_serializer.is_valid():
                 weights = weight_serializer.validated_data
        
+        graph = serializer.task_graph
         validator = DependencyValidator()
-        is_valid, error_msg = validator.validate_dependencies(tasks)
+        is_valid, error_msg = validator.validate_dependencies(tasks, graph)
         if not is_valid:
             return Response(
                 {'error': 'Invalid dependencies', 'message': error_msg},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        has_cycle, cycle_path = validator.detect_circular_dependencies(tasks)
-        if has_cycle:
-            return Response(
-                {
-                    'error': 'Circular dependency detected',
-                    'cycle': cycle_path,
-                    'message': f"Circular dependency found: {' -> '.join(map(str, cycle_path))}"
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        cyclic_components = validator.find_cyclic_components(tasks, graph)
+        if cyclic_components:
+            return circular_dependency_response(cyclic_components)
         
  
+        calendar, error_response = resolve_calendar(request.data.get('calendar'))
+        if error_response:
+            return error_response
+        
+        dependency_mode, error_response = resolve_dependency_mode(request.data.get('dependency_mode'))
+        if error_response:
+            return error_response
+        
+        k, error_response = parse_suggestion_count(request)
+        if error_response:
+            return error_response
+        
         try:
-            calculator = PriorityCalculator(weights=weights)
-            scored_tasks = calculator.analyze_tasks(tasks)
-            
-         
-            top_tasks = scored_tasks[:3]
-            
-    
-            suggestions = []
-            for task in top_tasks:
-                explanation = calculator.generate_task_explanation(task)
-                task_dict = {
-                    'id': task['id'],
-                    'title': task['title'],
-                    'due_date': task['due_date'].strftime('%Y-%m-%d') if hasattr(task['due_date'], 'strftime') else task['due_date'],
-                    'priority_score': task['priority_score']
-                }
-                if 'metadata' in task:
-                    task_dict['is_overdue'] = task['metadata'].get('is_overdue', False)
-                    task_dict['days_overdue'] = task['metadata'].get('days_overdue', 0)
-                
-                suggestions.append({
-                    'task': task_dict,
-                    'reason': explanation
-                })
+            calculator = PriorityCalculator.cached(weights=weights, calendar=calendar, dependency_mode=dependency_mode, impact_hours_per_task=IMPACT_HOURS)
+            top_tasks = calculator.top_tasks(tasks, k=k, scorer=sharded_scorer, graph=graph)
+            suggestions = build_suggestions(calculator, top_tasks)
             
             response_data = {
                 'suggestions': suggestions,
@@ -1277,3 +2584,204 @@ class LearningAdjustedSuggestView(APIView):
             )
 
 
+class HolidayCalendarListView(APIView):
+    """
+    GET /api/tasks/calendars/ - List built-in and custom calendars
+    POST /api/tasks/calendars/ - Create or replace a custom calendar
+    """
+    
+    def get(self, request):
+        """List available calendars."""
+        return Response(
+            {
+                'builtin': sorted(BUILTIN_CALENDARS),
+                'custom': [calendar.to_dict() for calendar in HolidayCalendar.objects.all()],
+                'note': 'Select a calendar via the "calendar" parameter of analyze/suggest endpoints.'
+            },
+            status=status.HTTP_200_OK
+        )
+    
+    def post(self, request):
+        """
+        Create or replace a custom calendar.
+        
+        Request body:
+        {
+            "name": "berlin-office",
+            "base_calendar": "none",
+            "holidays": ["2025-10-03", "2025-12-24"]
+        }
+        """
+        serializer = HolidayCalendarSerializer(data=request.data)
+        
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'error': 'Invalid calendar configuration',
+                    'details': serializer.errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        data = serializer.validated_data
+        calendar, created = HolidayCalendar.objects.update_or_create(
+            name=data['name'],
+            defaults={
+                'base_calendar': data['base_calendar'],
+                'holidays': data['holidays']
+            }
+        )
+        
+        return Response(
+            {
+                'message': 'Calendar created successfully' if created else 'Calendar updated successfully',
+                'calendar': calendar.to_dict()
+            },
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
+        )
+
+
+class HolidayCalendarDetailView(APIView):
+    """
+    GET /api/tasks/calendars/<name>/ - Retrieve a custom calendar
+    DELETE /api/tasks/calendars/<name>/ - Delete a custom calendar
+    """
+    
+    def get(self, request, name):
+        """Get a custom calendar by name."""
+        calendar = get_object_or_404(HolidayCalendar, name=name.lower())
+        return Response(calendar.to_dict(), status=status.HTTP_200_OK)
+    
+    def delete(self, request, name):
+        """Delete a custom calendar."""
+        calendar = get_object_or_404(HolidayCalendar, name=name.lower())
+        calendar_dict = calendar.to_dict()
+        calendar.delete()
+        
+        return Response(
+            {
+                'message': 'Calendar deleted successfully',
+                'calendar': calendar_dict
+            },
+            status=status.HTTP_200_OK
+        )
+
+
+class JobListCreateView(APIView):
+    """
+    GET /api/tasks/jobs/ - List recent jobs (without results)
+    POST /api/tasks/jobs/ - Queue a background job
+    
+    Request body:
+    {
+        "kind": "analyze",
+        "payload": {"tasks": [...], "strategy": "smart_balance"}
+    }
+    
+    Response (202 Accepted):
+    {
+        "job": {"id": 12, "kind": "analyze", "status": "queued", "progress": 0.0, ...},
+        "url": "/api/tasks/jobs/12/"
+    }
+    
+    Kinds: analyze, suggest, dashboard, dependency_graph, critical_path, plan,
+    weight_sweep and what_if take the payload of the matching endpoint (the
+    request body, or its query parameters when the payload has no "tasks"
+    and the endpoint can use stored tasks); bulk_import takes the body of
+    POST /api/tasks/bulk/. Jobs are run by `python manage.py run_job_worker`.
+    """
+    
+    def get(self, request):
+        """List recent jobs, newest first."""
+        jobs = Job.objects.all()
+        job_status = request.query_params.get('status')
+        if job_status:
+            jobs = jobs.filter(status=job_status)
+        jobs = jobs.defer('payload', 'result')[:getattr(settings, 'TASK_PAGE_SIZE', DEFAULT_PAGE_SIZE)]
+        
+        return Response(
+            {'jobs': [job.to_dict(include_result=False) for job in jobs]},
+            status=status.HTTP_200_OK
+        )
+    
+    def post(self, request):
+        """Queue a job."""
+        data = request.data
+        if not isinstance(data, dict):
+            return Response(
+                {'error': 'Request body must be an object'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            job = submit_job(data.get('kind'), data.get('payload', {}))
+        except ValueError as e:
+            return Response(
+                {'error': 'Invalid job', 'message': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response(
+            {
+                'job': job.to_dict(),
+                'url': request.build_absolute_uri(f'{job.pk}/')
+            },
+            status=status.HTTP_202_ACCEPTED
+        )
+
+
+class JobDetailView(APIView):
+    """
+    GET /api/tasks/jobs/<id>/ - Job status, progress and (once finished) result
+    DELETE /api/tasks/jobs/<id>/ - Cancel a queued job or discard a finished one
+    
+    Response:
+    {
+        "id": 12,
+        "kind": "analyze",
+        "status": "succeeded",  // queued, running, succeeded or failed
+        "progress": 1.0,
+        "progress_message": "Finished",
+        ...
+        "result_status": 200,
+        "result": {...}  // what the endpoint would have returned
+    }
+    
+    Finished jobs are kept for TASK_JOB_RESULT_TTL seconds.
+    """
+    
+    def _get_job(self, pk):
+        job = get_object_or_404(Job, pk=pk)
+        if job.expires_at is not None and job.expires_at <= timezone.now():
+            # Expired but not purged by a worker yet.
+            return None, Response(
+                {'error': 'Job not found', 'message': f'Job {pk} has expired'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return job, None
+    
+    def get(self, request, pk):
+        """Get a job's status and result."""
+        job, error_response = self._get_job(pk)
+        if error_response:
+            return error_response
+        return Response(job.to_dict(), status=status.HTTP_200_OK)
+    
+    def delete(self, request, pk):
+        """Delete a job that is not running."""
+        job, error_response = self._get_job(pk)
+        if error_response:
+            return error_response
+        
+        # Only delete if the job was not claimed meanwhile.
+        deleted, _ = Job.objects.filter(pk=pk).exclude(status=Job.RUNNING).delete()
+        if not deleted:
+            return Response(
+                {'error': 'Job is running', 'message': f'Job {pk} is running and cannot be deleted'},
+                status=status.HTTP_409_CONFLICT
+            )
+        
+        return Response(
+            {'message': 'Job deleted successfully', 'job': job.to_dict(include_result=False)},
+            status=status.HTTP_200_OK
+        )
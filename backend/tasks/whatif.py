@@ -0,0 +1,296 @@
+"""
+What-if simulation of hypothetical task edits.
+
+A scenario is a set of patches over stored tasks (new due dates, estimates,
+importance or dependencies). All scenarios are evaluated against one shared
+baseline: the raw factor scores of every task are computed once, and each
+scenario only re-evaluates the factors its patches touch - urgency of
+re-dated tasks, effort of re-estimated tasks, dependency scores of tasks
+whose dependent count changed - before re-weighting and re-ranking.
+Nothing is written to the database.
+"""
+from datetime import timedelta
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .scoring import PriorityCalculator, ScoreCache, round_array
+
+FACTOR_COLUMNS = ('urgency_raw', 'importance_raw', 'effort_raw', 'dependency_raw')
+DEFAULT_DIFF_LIMIT = 50
+DEFAULT_TOP = 3
+
+
+class WhatIfSimulator:
+    """
+    Evaluates scenarios against a shared baseline ranking.
+
+    Rankings follow analyze_tasks exactly (rounded priority score, ties in
+    input order), so a scenario's ranking is the one analyze_tasks would
+    return if the patches were saved.
+    """
+
+    def __init__(
+        self,
+        calculator: PriorityCalculator,
+        tasks: List[Dict],
+        cache: ScoreCache = None,
+        versions: Dict[int, object] = None
+    ):
+        """
+        Score the baseline.
+
+        Args:
+            calculator: Calculator used for the baseline and every scenario
+            tasks: List of task dictionaries (the stored tasks)
+            cache: Optional ScoreCache for the baseline scores
+            versions: Dictionary mapping task_id to its version (see score_tasks)
+
+        Raises:
+            ValueError: If tasks are empty or invalid
+        """
+        self.calculator = calculator
+        self.tasks = tasks
+        self.position = {task.get('id'): i for i, task in enumerate(tasks)}
+        scores, self.priority_scores = calculator.score_tasks(tasks, cache, versions)
+        self.factors = {column: scores[column] for column in FACTOR_COLUMNS}
+        self.dependent_counts = calculator.dependent_counts(tasks)
+        self.order = np.argsort(-self.priority_scores, kind='stable')
+        self.ranks = self._ranks(self.order)
+
+    @staticmethod
+    def _ranks(order: np.ndarray) -> np.ndarray:
+        """1-based rank of every task, given the ranking order."""
+        ranks = np.empty(len(order), dtype=np.int64)
+        ranks[order] = np.arange(1, len(order) + 1)
+        return ranks
+
+    def _patched_tasks(self, patches: List[Dict]) -> Dict[int, Dict]:
+        """
+        Apply patches to copies of the affected tasks.
+
+        Returns:
+            Dictionary mapping row index to the patched task
+
+        Raises:
+            ValueError: If a patch targets an unknown task
+        """
+        patched = {}
+        for patch in patches:
+            task_id = patch.get('id')
+            row = self.position.get(task_id)
+            if row is None:
+                raise ValueError(f"Task {task_id} does not exist")
+            task = patched.get(row) or dict(self.tasks[row])
+            if patch.get('due_date') is not None:
+                task['due_date'] = patch['due_date']
+            if patch.get('shift_days'):
+                due_date, _, _ = self.calculator._parse_task_fields(task)
+                task['due_date'] = due_date + timedelta(days=patch['shift_days'])
+            if patch.get('estimated_hours') is not None:
+                task['estimated_hours'] = patch['estimated_hours']
+            if patch.get('hours_scale') is not None:
+                task['estimated_hours'] = float(task['estimated_hours']) * patch['hours_scale']
+            if patch.get('importance') is not None:
+                task['importance'] = patch['importance']
+            if patch.get('dependencies') is not None:
+                task['dependencies'] = list(patch['dependencies'])
+            patched[row] = task
+        return patched
+
+    def _dependency_changes(self, patched: Dict[int, Dict]) -> List[int]:
+        """Rows whose patched dependencies differ from the stored ones."""
+        return [
+            row for row, task in patched.items()
+            if (task.get('dependencies') or []) != (self.tasks[row].get('dependencies') or [])
+        ]
+
+    def _hours_changes(self, patched: Dict[int, Dict]) -> List[int]:
+        """Rows whose patched estimated hours differ from the stored ones."""
+        return [
+            row for row, task in patched.items()
+            if float(task.get('estimated_hours') or 0) != float(self.tasks[row].get('estimated_hours') or 0)
+        ]
+
+    def _scenario_counts(self, patched: Dict[int, Dict], changed_rows: List[int]) -> Tuple[Dict[int, int], List[int]]:
+        """
+        Dependent counts with the patched dependencies (and, in
+        'transitive_hours' mode, the patched estimated hours).
+
+        In 'direct' mode only the counts of tasks gaining or losing a
+        dependent are touched; the transitive modes re-run the graph pass.
+        Changed hours only matter in 'transitive_hours' mode, where a task's
+        hours flow into the impact of every task it depends on.
+
+        Returns:
+            Tuple of (counts, changed_ids): the scenario's dependent counts and
+            the IDs of tasks whose count differs from the baseline
+        """
+        if self.calculator.dependency_mode == 'transitive_hours' and not changed_rows:
+            changed_rows = self._hours_changes(patched)
+        if not changed_rows:
+            return self.dependent_counts, []
+
+        if self.calculator.dependency_mode != 'direct':
+            counts = self.calculator.dependent_counts(
+                [patched.get(row, task) for row, task in enumerate(self.tasks)]
+            )
+            candidates = counts.keys()
+        else:
+            counts = dict(self.dependent_counts)
+            candidates = set()
+            for row in changed_rows:
+                for dep_id in self.tasks[row].get('dependencies') or []:
+                    if dep_id in counts:
+                        counts[dep_id] -= 1
+                        candidates.add(dep_id)
+                for dep_id in patched[row].get('dependencies') or []:
+                    if dep_id in counts:
+                        counts[dep_id] += 1
+                        candidates.add(dep_id)
+        changed_ids = [
+            task_id for task_id in candidates
+            if counts.get(task_id, 0) != self.dependent_counts.get(task_id, 0)
+        ]
+        return counts, changed_ids
+
+    def _validate_dependencies(self, patched: Dict[int, Dict], changed_rows: List[int]):
+        """
+        Reject patched dependencies on unknown tasks or that close a cycle.
+
+        A new edge task -> dep closes a cycle exactly when dep already reaches
+        task through dependencies, so only the part of the graph reachable
+        from the new dependencies is searched.
+        """
+        for row in changed_rows:
+            task_id = self.tasks[row].get('id')
+            for dep_id in patched[row].get('dependencies') or []:
+                if dep_id not in self.position:
+                    raise ValueError(f"Task {task_id} references non-existent dependency {dep_id}")
+                if dep_id == task_id:
+                    raise ValueError(f"Task {task_id} cannot depend on itself")
+
+        def dependencies_of(row):
+            task = patched.get(row, self.tasks[row])
+            return task.get('dependencies') or []
+
+        for row in changed_rows:
+            task_id = self.tasks[row].get('id')
+            parents = {}
+            stack = list(dependencies_of(row))
+            for dep_id in stack:
+                parents.setdefault(dep_id, None)
+            while stack:
+                current = stack.pop()
+                if current == task_id:
+                    path = []
+                    node = parents[current]
+                    while node is not None:
+                        path.append(node)
+                        node = parents[node]
+                    cycle = ' -> '.join(str(node) for node in [task_id] + path[::-1] + [task_id])
+                    raise ValueError(f"Patched dependencies create a circular dependency: {cycle}")
+                for dep_id in dependencies_of(self.position[current]) if current in self.position else []:
+                    if dep_id not in parents:
+                        parents[dep_id] = current
+                        stack.append(dep_id)
+
+    def simulate(self, patches: List[Dict], limit: int = DEFAULT_DIFF_LIMIT, top: int = DEFAULT_TOP) -> Dict:
+        """
+        Evaluate one scenario.
+
+        Args:
+            patches: List of patches, each with the task 'id' and any of
+                due_date, shift_days, estimated_hours, hours_scale,
+                importance, dependencies
+            limit: Maximum number of changed tasks listed
+            top: Number of top task IDs reported for the scenario
+
+        Returns:
+            Dictionary with the patched task IDs, the scenario's top tasks,
+            counts of changed/moved tasks and the largest rank changes
+
+        Raises:
+            ValueError: If a patch targets an unknown task or produces invalid data
+        """
+        calculator = self.calculator
+        patched = self._patched_tasks(patches)
+        changed_rows = self._dependency_changes(patched)
+        self._validate_dependencies(patched, changed_rows)
+        counts, changed_ids = self._scenario_counts(patched, changed_rows)
+
+        rows = np.fromiter(patched, dtype=np.int64, count=len(patched))
+        batch, errors = calculator._collect_batch([patched[row] for row in rows.tolist()], counts)
+        if errors:
+            raise calculator._batch_error(errors)
+
+        factors = {column: values.copy() for column, values in self.factors.items()}
+        factors['urgency_raw'][rows] = calculator._urgency_scores(batch.due_ordinals)
+        factors['importance_raw'][rows] = calculator._importance_scores(batch.importance)
+        factors['effort_raw'][rows] = calculator._effort_scores(batch.estimated_hours)
+        if changed_ids:
+            count_rows = np.array([self.position[task_id] for task_id in changed_ids], dtype=np.int64)
+            factors['dependency_raw'][count_rows] = calculator._dependency_scores(
+                np.array([counts[task_id] for task_id in changed_ids], dtype=np.int64)
+            )
+
+        totals = calculator.combine_factors(*(factors[column] for column in FACTOR_COLUMNS))['total']
+        priority_scores = round_array(totals)
+        order = np.argsort(-priority_scores, kind='stable')
+        ranks = self._ranks(order)
+
+        rank_change = self.ranks - ranks
+        changed = np.flatnonzero((rank_change != 0) | (priority_scores != self.priority_scores))
+        listed = changed[np.lexsort((ranks[changed], -np.abs(rank_change[changed])))][:limit]
+
+        return {
+            'patched': [self.tasks[row].get('id') for row in rows.tolist()],
+            'top': [self.tasks[i].get('id') for i in order[:top].tolist()],
+            'changed_count': len(changed),
+            'moved_up': int(np.count_nonzero(rank_change > 0)),
+            'moved_down': int(np.count_nonzero(rank_change < 0)),
+            'changes': [
+                {
+                    'id': self.tasks[i].get('id'),
+                    'title': self.tasks[i].get('title'),
+                    'baseline_rank': int(self.ranks[i]),
+                    'rank': int(ranks[i]),
+                    'rank_change': int(rank_change[i]),
+                    'baseline_score': float(self.priority_scores[i]),
+                    'priority_score': float(priority_scores[i])
+                }
+                for i in listed.tolist()
+            ]
+        }
+
+    def run(self, scenarios: List[Dict], limit: int = DEFAULT_DIFF_LIMIT, top: int = DEFAULT_TOP) -> Dict:
+        """
+        Evaluate every scenario against the baseline.
+
+        Args:
+            scenarios: List of {'name': ..., 'patches': [...]} dictionaries
+            limit: Maximum number of changed tasks listed per scenario
+            top: Number of top task IDs reported per scenario
+
+        Returns:
+            Dictionary with the baseline top tasks and one result per scenario
+
+        Raises:
+            ValueError: If a scenario is invalid (the message names it)
+        """
+        results = []
+        for index, scenario in enumerate(scenarios, 1):
+            name = scenario.get('name') or f"Scenario {index}"
+            try:
+                result = self.simulate(scenario['patches'], limit=limit, top=top)
+            except ValueError as e:
+                raise ValueError(f"{name}: {e}")
+            results.append({'name': name, **result})
+
+        return {
+            'baseline': {
+                'top': [self.tasks[i].get('id') for i in self.order[:top].tolist()],
+                'task_count': len(self.tasks)
+            },
+            'scenarios': results
+        }
@@ -545,7 +545,9 @@ async function analyzeTasks() {
         if (!Array.isArray(cleanedTasks) || cleanedTasks.length === 0) {
             throw new Error('Invalid task data. Please check your tasks and try again.');
         }
-        const analyzeResponse = await fetch(`${API_BASE_URL}/tasks/analyze/`, {
+        // One request returns the ranking, suggestions, graph and matrix,
+        // all computed from a single scoring pass on the server.
+        const dashboardResponse = await fetch(`${API_BASE_URL}/tasks/dashboard/`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
@@ -553,38 +555,24 @@ async function analyzeTasks() {
             body: JSON.stringify({ tasks: cleanedTasks })
         });
         
-        if (!analyzeResponse.ok) {
-            const errorData = await analyzeResponse.json().catch(() => ({}));
-            throw new Error(errorData.message || errorData.error || `Analysis failed: ${analyzeResponse.status} ${analyzeResponse.statusText}`);
+        if (!dashboardResponse.ok) {
+            const errorData = await dashboardResponse.json().catch(() => ({}));
+            throw new Error(errorData.message || errorData.error || `Analysis failed: ${dashboardResponse.status} ${dashboardResponse.statusText}`);
         }
         
-        const analyzeData = await analyzeResponse.json();
-        if (!analyzeData.tasks || !Array.isArray(analyzeData.tasks)) {
+        const dashboardData = await dashboardResponse.json();
+        if (!dashboardData.tasks || !Array.isArray(dashboardData.tasks)) {
             throw new Error('Invalid response from server. Please try again.');
         }
         
-        let analyzedTasks = analyzeData.tasks;
+        let analyzedTasks = dashboardData.tasks;
         if (currentStrategy !== 'smart') {
             analyzedTasks = applySortingStrategy(analyzedTasks, currentStrategy);
         }
-        let suggestions = [];
-        try {
-            const suggestResponse = await fetch(`${API_BASE_URL}/tasks/suggest/`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify({ tasks: cleanedTasks })
-            });
-            
-            if (suggestResponse.ok) {
-                const suggestData = await suggestResponse.json();
-                suggestions = suggestData.suggestions || [];
-            }
-        } catch (suggestError) {
-            console.warn('Failed to fetch suggestions:', suggestError);
-        }
-        displayResults(analyzedTasks, suggestions);
+        // Suggestions are the server's top-k selection; the full list is
+        // never sorted client-side just to pick them.
+        const suggestions = dashboardData.suggestions || [];
+        displayResults(analyzedTasks, suggestions, dashboardData.graph, dashboardData.matrix);
         
     } catch (error) {
         console.error('Analysis error:', error);
@@ -645,10 +633,8 @@ function applySortingStrategy(tasks, strategy) {
                 
             case 'smart':
             default:
-               
-                sortedTasks.sort((a, b) => {
-                    return (b.priority_score || 0) - (a.priority_score || 0);
-                });
+                // The server already returns the smart ranking (ties in input
+                // order); re-sorting it here would only redo that work.
                 break;
         }
     } catch (error) {
@@ -688,7 +674,7 @@ function hideResults() {
     elements.suggestions.style.display = 'none';
 }
 
-function displayResults(analyzedTasks, suggestions) {
+function displayResults(analyzedTasks, suggestions, graphData, matrix) {
   
     elements.loadingState.style.display = 'none';
     elements.errorState.style.display = 'none';
@@ -796,23 +782,33 @@ function displayResults(analyzedTasks, suggestions) {
     }
     
     
-    loadDependencyGraph();
+    showDependencyGraph(graphData);
     
   
-    loadEisenhowerMatrix();
+    showEisenhowerMatrix(matrix);
 }
 
 
 async function loadTasksFromDatabase() {
     try {
-        const response = await fetch(`${API_BASE_URL}/tasks/`);
+        const loaded = [];
+        let cursor = null;
         
-        if (!response.ok) {
-            throw new Error('Failed to load tasks from database');
-        }
+        // The list is paginated; follow next_cursor until the last page.
+        do {
+            const query = cursor ? `?limit=1000&cursor=${encodeURIComponent(cursor)}` : '?limit=1000';
+            const response = await fetch(`${API_BASE_URL}/tasks/${query}`);
+            
+            if (!response.ok) {
+                throw new Error('Failed to load tasks from database');
+            }
+            
+            const data = await response.json();
+            loaded.push(...(data.tasks || []));
+            cursor = data.next_cursor;
+        } while (cursor);
         
-        const data = await response.json();
-        tasks = data.tasks || [];
+        tasks = loaded;
         
    
         tasks = cleanTaskDependencies(tasks);
@@ -979,33 +975,18 @@ function getDaysUntilDue(dateString) {
     return diffDays;
 }
 
-async function loadDependencyGraph() {
-    try {
-        const response = await fetch(`${API_BASE_URL}/tasks/dependency-graph/`, {
-            method: 'GET'
-        });
-        
-        if (!response.ok) {
-            console.warn('Failed to fetch dependency graph:', response.status);
-            return; 
-        }
-        
-        const graphData = await response.json();
-        
-        const graphContainer = document.getElementById('dependencyGraph');
-        if (!graphContainer) return;
-        
-        if (graphData.nodes && graphData.nodes.length > 0) {
-            graphContainer.style.display = 'block';
-            // Use setTimeout to ensure container is visible before calculating dimensions
-            setTimeout(() => {
-                renderDependencyGraph(graphData);
-            }, 10);
-        } else {
-            graphContainer.style.display = 'none';
-        }
-    } catch (error) {
-        console.warn('Failed to load dependency graph:', error);
+function showDependencyGraph(graphData) {
+    const graphContainer = document.getElementById('dependencyGraph');
+    if (!graphContainer) return;
+    
+    if (graphData && graphData.nodes && graphData.nodes.length > 0) {
+        graphContainer.style.display = 'block';
+        // Use setTimeout to ensure container is visible before calculating dimensions
+        setTimeout(() => {
+            renderDependencyGraph(graphData);
+        }, 10);
+    } else {
+        graphContainer.style.display = 'none';
     }
 }
 
@@ -1284,7 +1265,10 @@ function renderDependencyGraph(graphData) {
         const cyclePath = document.getElementById('cyclePath');
         if (cycleWarning && cyclePath) {
             cycleWarning.style.display = 'block';
-            cyclePath.textContent = `Cycle: ${graphData.cyclePath.join(' → ')}`;
+            const cycles = graphData.cycles && graphData.cycles.length ? graphData.cycles : [graphData.cyclePath];
+            cyclePath.textContent = cycles.length > 1
+                ? `${cycles.length} cycles: ${cycles.map(cycle => cycle.join(' → ')).join('; ')}`
+                : `Cycle: ${cycles[0].join(' → ')}`;
         }
     } else {
         const cycleWarning = document.getElementById('cycleWarning');
@@ -1295,28 +1279,13 @@ function renderDependencyGraph(graphData) {
 }
 
 
-async function loadEisenhowerMatrix() {
-    try {
-        const response = await fetch(`${API_BASE_URL}/tasks/eisenhower-matrix/`, {
-            method: 'GET'
-        });
-        
-        if (!response.ok) {
-            return;
+function showEisenhowerMatrix(matrix) {
+    if (matrix) {
+        const matrixContainer = document.getElementById('eisenhowerMatrix');
+        if (matrixContainer) {
+            matrixContainer.style.display = 'block';
+            renderEisenhowerMatrix(matrix);
         }
-        
-        const data = await response.json();
-        const matrix = data.matrix;
-        
-        if (matrix) {
-            const matrixContainer = document.getElementById('eisenhowerMatrix');
-            if (matrixContainer) {
-                matrixContainer.style.display = 'block';
-                renderEisenhowerMatrix(matrix);
-            }
-        }
-    } catch (error) {
-        console.warn('Failed to load Eisenhower Matrix:', error);
     }
 }
 